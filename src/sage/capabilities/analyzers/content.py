@@ -9,6 +9,7 @@ Author: SAGE AI Collab Team
 Version: 0.1.0
 """
 
+import functools
 import logging
 import re
 from dataclasses import dataclass, field
@@ -17,6 +18,13 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Line-start structure markers, matched in a single scan; the group name
+# (header, table, list_item) identifies which element was found
+_STRUCTURE_PATTERN = re.compile(
+    r"(?P<header>^#+\s)|(?P<table>^\s*\|)|(?P<list_item>^[\s]*[-*+]\s)",
+    re.MULTILINE,
+)
+
 
 @dataclass
 class ContentMetrics:
@@ -95,6 +103,9 @@ class ContentAnalyzer:
     # Average tokens per character (rough estimate for English)
     TOKENS_PER_CHAR = 0.25
 
+    # Files larger than this are analyzed line by line (1 MiB)
+    STREAMING_THRESHOLD = 1 << 20
+
     def __init__(self) -> None:
         """Initialize the content analyzer."""
         pass
@@ -109,10 +120,21 @@ class ContentAnalyzer:
         Returns:
             ContentMetrics with analysis results
         """
-        if not file_path.exists():
+        try:
+            size = file_path.stat().st_size
+        except OSError:
             return ContentMetrics(file_path=str(file_path))
 
-        content = file_path.read_text(encoding="utf-8")
+        if size > self.STREAMING_THRESHOLD:
+            return self.analyze_file_streaming(file_path)
+
+        # Empty files need no read syscall
+        raw = file_path.read_bytes() if size else b""
+        # Single decode; undecodable bytes must not abort a metrics pass
+        content = raw.decode("utf-8", errors="replace")
+        if b"\r" in raw:
+            # Match read_text() universal-newline handling
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
         return self.analyze_content(content, str(file_path))
 
     def analyze_content(self, content: str, file_path: str = "") -> ContentMetrics:
@@ -126,19 +148,21 @@ class ContentAnalyzer:
         Returns:
             ContentMetrics with analysis results
         """
-        lines = content.split("\n")
-
-        # Basic metrics
-        total_lines = len(lines)
+        # Basic metrics (same count as len(content.split("\n")), no list built)
+        total_lines = content.count("\n") + 1
         total_chars = len(content)
         estimated_tokens = int(total_chars * self.TOKENS_PER_CHAR)
 
         # Structure metrics
-        header_count = len(re.findall(r"^#+\s", content, re.MULTILINE))
-        code_block_count = len(re.findall(r"```", content)) // 2
-        table_count = self._count_tables(content)
+        structure = dict.fromkeys(_STRUCTURE_PATTERN.groupindex, 0)
+        for match in _STRUCTURE_PATTERN.finditer(content):
+            structure[match.lastgroup] += 1  # type: ignore[index]
+        header_count = structure["header"]
+        code_block_count = content.count("```") // 2
+        # Estimate tables (at least 3 lines per table)
+        table_count = structure["table"] // 3
         link_count = len(re.findall(r"\[([^\]]+)\]\(([^)]+)\)", content))
-        list_item_count = len(re.findall(r"^[\s]*[-*+]\s", content, re.MULTILINE))
+        list_item_count = structure["list_item"]
 
         # Extract sections
         sections = self._extract_sections(content)
@@ -166,6 +190,77 @@ class ContentAnalyzer:
             sections=sections,
         )
 
+    def analyze_file_streaming(self, file_path: Path) -> ContentMetrics:
+        """
+        Analyze a file in a single pass without buffering its full content.
+
+        Produces the same metrics as analyze_content(), except that links
+        are matched within paragraphs, so a link broken by a blank line is
+        not counted.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            ContentMetrics with analysis results
+        """
+        total_lines = 1
+        total_chars = 0
+        non_whitespace = 0
+        structure = dict.fromkeys(_STRUCTURE_PATTERN.groupindex, 0)
+        fence_count = 0
+        link_count = 0
+        sections: list[str] = []
+        paragraph: list[str] = []
+
+        with open(
+            file_path, encoding="utf-8", errors="replace", buffering=1 << 16
+        ) as f:
+            for line in f:
+                if line.endswith("\n"):
+                    total_lines += 1
+                total_chars += len(line)
+                non_whitespace += len(re.sub(r"\s", "", line))
+
+                match = _STRUCTURE_PATTERN.match(line)
+                if match:
+                    structure[match.lastgroup] += 1  # type: ignore[index]
+                if line.startswith("#"):
+                    sections.append(re.sub(r"^#+\s*", "", line.rstrip("\n")))
+                fence_count += line.count("```")
+
+                if line.strip():
+                    paragraph.append(line)
+                elif paragraph:
+                    link_count += len(
+                        re.findall(r"\[([^\]]+)\]\(([^)]+)\)", "".join(paragraph))
+                    )
+                    paragraph.clear()
+
+        if paragraph:
+            link_count += len(
+                re.findall(r"\[([^\]]+)\]\(([^)]+)\)", "".join(paragraph))
+            )
+
+        estimated_tokens = int(total_chars * self.TOKENS_PER_CHAR)
+        header_count = structure["header"]
+        section_count = max(1, header_count)
+
+        return ContentMetrics(
+            file_path=str(file_path),
+            total_lines=total_lines,
+            total_chars=total_chars,
+            estimated_tokens=estimated_tokens,
+            header_count=header_count,
+            code_block_count=fence_count // 2,
+            table_count=structure["table"] // 3,
+            link_count=link_count,
+            list_item_count=structure["list_item"],
+            tokens_per_section=estimated_tokens / section_count,
+            content_density=non_whitespace / max(1, total_chars),
+            sections=sections,
+        )
+
     def analyze_directory(
         self, dir_path: Path, extensions: list[str] | None = None
     ) -> dict[str, ContentMetrics]:
@@ -227,14 +322,6 @@ class ContentAnalyzer:
             },
         }
 
-    def _count_tables(self, content: str) -> int:
-        """Count markdown tables in content."""
-        # Simple heuristic: count lines starting with |
-        table_lines = [l for l in content.split("\n") if l.strip().startswith("|")]
-
-        # Estimate tables (at least 3 lines per table)
-        return len(table_lines) // 3
-
     def _extract_sections(self, content: str) -> list[str]:
         """Extract section headers from content."""
         sections = []
@@ -269,35 +356,64 @@ class ContentAnalyzer:
         Returns:
             List of optimization suggestions
         """
-        suggestions = []
-
-        # Token efficiency
-        if metrics.tokens_per_section > 200:
-            suggestions.append(
-                f"Consider breaking into more sections "
-                f"(current: {metrics.tokens_per_section:.0f} tokens/section)"
+        return list(
+            _suggest_optimizations(
+                metrics.tokens_per_section,
+                metrics.content_density,
+                metrics.header_count,
+                metrics.total_lines,
+                metrics.code_block_count,
+                metrics.table_count,
+                metrics.list_item_count,
             )
+        )
 
-        # Content density
-        if metrics.content_density < 0.5:
-            suggestions.append("High whitespace ratio - consider compacting content")
 
-        # Structure
-        if metrics.header_count < 3 and metrics.total_lines > 100:
-            suggestions.append("Long document with few headers - add more structure")
+@functools.lru_cache(maxsize=256)
+def _suggest_optimizations(
+    tokens_per_section: float,
+    content_density: float,
+    header_count: int,
+    total_lines: int,
+    code_block_count: int,
+    table_count: int,
+    list_item_count: int,
+) -> tuple[str, ...]:
+    """Build optimization suggestions from the numeric metric fields."""
+    suggestions = []
+
+    # Token efficiency
+    if tokens_per_section > 200:
+        suggestions.append(
+            f"Consider breaking into more sections "
+            f"(current: {tokens_per_section:.0f} tokens/section)"
+        )
 
-        if metrics.code_block_count == 0 and metrics.total_lines > 50:
-            suggestions.append("No code examples - consider adding examples")
+    # Content density
+    if content_density < 0.5:
+        suggestions.append("High whitespace ratio - consider compacting content")
+
+    # Structure
+    if header_count < 3 and total_lines > 100:
+        suggestions.append("Long document with few headers - add more structure")
+
+    if code_block_count == 0 and total_lines > 50:
+        suggestions.append("No code examples - consider adding examples")
+
+    if table_count == 0 and list_item_count > 20:
+        suggestions.append(
+            "Many list items - consider using tables for structured data"
+        )
+
+    return tuple(suggestions)
 
-        if metrics.table_count == 0 and metrics.list_item_count > 20:
-            suggestions.append(
-                "Many list items - consider using tables for structured data"
-            )
 
-        return suggestions
+_default_analyzer: ContentAnalyzer | None = None
 
 
 def analyze_content(path: Path) -> ContentMetrics:
     """Convenience function to analyze a single file."""
-    analyzer = ContentAnalyzer()
-    return analyzer.analyze_file(path)
+    global _default_analyzer
+    if _default_analyzer is None:
+        _default_analyzer = ContentAnalyzer()
+    return _default_analyzer.analyze_file(path)
@@ -11,16 +11,32 @@ Version: 0.1.0
 
 import logging
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Score dimensions and their weights in the overall score, in a fixed order
+SCORE_DIMENSIONS = (
+    "correctness",
+    "completeness",
+    "clarity",
+    "efficiency",
+    "testability",
+)
+_SCORE_WEIGHTS = (0.25, 0.20, 0.25, 0.15, 0.15)
+
 
 @dataclass
 class QualityScore:
-    """Structured quality score with multiple dimensions."""
+    """
+    Structured quality score with multiple dimensions.
+
+    Issue codes recorded in ``issue_codes``:
+    - file_not_found: The analyzed path does not exist
+    - unsupported_extension: No analysis routine for the file type
+    """
 
     # Core dimensions (0-100)
     correctness: int = 0
@@ -34,18 +50,43 @@ class QualityScore:
     analysis_type: str = ""  # "code" or "documentation"
     issues: list[str] = field(default_factory=list)
     suggestions: list[str] = field(default_factory=list)
+    issue_codes: set[str] = field(default_factory=set)  # Machine-readable issues
+
+    def has_issue(self, text_or_code: str) -> bool:
+        """
+        Check for an issue by code or by issue text.
+
+        Issue codes are checked first with a set lookup; otherwise falls back
+        to a substring search over the human-readable issues.
+
+        Args:
+            text_or_code: Issue code (e.g. "file_not_found") or text fragment
+
+        Returns:
+            True if a matching issue was recorded
+        """
+        if text_or_code in self.issue_codes:
+            return True
+        return any(text_or_code in issue for issue in self.issues)
+
+    @property
+    def scores(self) -> tuple[int, int, int, int, int]:
+        """Dimension scores as a tuple, ordered as SCORE_DIMENSIONS."""
+        return (
+            self.correctness,
+            self.completeness,
+            self.clarity,
+            self.efficiency,
+            self.testability,
+        )
 
     @property
     def overall(self) -> float:
         """Calculate overall weighted score."""
-        weights = {
-            "correctness": 0.25,
-            "completeness": 0.20,
-            "clarity": 0.25,
-            "efficiency": 0.15,
-            "testability": 0.15,
-        }
-        total = sum(getattr(self, dim) * weight for dim, weight in weights.items())
+        total = sum(
+            score * weight
+            for score, weight in zip(self.scores, _SCORE_WEIGHTS, strict=True)
+        )
         return round(float(total), 2)
 
     @property
@@ -68,16 +109,11 @@ class QualityScore:
         return {
             "file_path": self.file_path,
             "analysis_type": self.analysis_type,
-            "scores": {
-                "correctness": self.correctness,
-                "completeness": self.completeness,
-                "clarity": self.clarity,
-                "efficiency": self.efficiency,
-                "testability": self.testability,
-            },
+            "scores": dict(zip(SCORE_DIMENSIONS, self.scores, strict=True)),
             "overall": self.overall,
             "grade": self.grade,
             "issues": self.issues,
+            "issue_codes": sorted(self.issue_codes),
             "suggestions": self.suggestions,
         }
 
@@ -93,10 +129,18 @@ class QualityAnalyzer:
     - Issue identification and suggestions
     """
 
+    # File types with a dedicated analysis routine
+    SUPPORTED_EXTENSIONS = frozenset({".py", ".md"})
+
+    # Maximum number of cached file analyses (oldest evicted first)
+    MAX_CACHE_ENTRIES = 512
+
     def __init__(self) -> None:
         """Initialize the quality analyzer."""
         self._code_patterns = self._load_code_patterns()
         self._doc_patterns = self._load_doc_patterns()
+        # Keyed by (path, mtime_ns, size) so edited files are re-analyzed
+        self._cache: dict[tuple[str, int, int], QualityScore] = {}
 
     def analyze_file(self, file_path: Path) -> QualityScore:
         """
@@ -108,21 +152,48 @@ class QualityAnalyzer:
         Returns:
             QualityScore with analysis results
         """
-        if not file_path.exists():
-            return QualityScore(file_path=str(file_path), issues=["File not found"])
-
-        content = file_path.read_text(encoding="utf-8")
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return QualityScore(
+                file_path=str(file_path),
+                issues=["File not found"],
+                issue_codes={"file_not_found"},
+            )
 
-        if file_path.suffix == ".py":
-            return self._analyze_python(file_path, content)
-        elif file_path.suffix == ".md":
-            return self._analyze_markdown(file_path, content)
-        else:
+        # Reject unsupported types before touching the file contents
+        if file_path.suffix not in self.SUPPORTED_EXTENSIONS:
             return QualityScore(
                 file_path=str(file_path),
                 issues=[f"Unsupported file type: {file_path.suffix}"],
+                issue_codes={"unsupported_extension"},
             )
 
+        key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(key)
+        if cached is None:
+            content = file_path.read_text(encoding="utf-8") if stat.st_size else ""
+            if file_path.suffix == ".py":
+                cached = self._analyze_python(file_path, content)
+            else:
+                cached = self._analyze_markdown(file_path, content)
+
+            if len(self._cache) >= self.MAX_CACHE_ENTRIES:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = cached
+
+        # Hand out a copy so callers cannot mutate the cached entry
+        return replace(
+            cached,
+            issues=list(cached.issues),
+            suggestions=list(cached.suggestions),
+            issue_codes=set(cached.issue_codes),
+        )
+
+    def clear_cache(self) -> None:
+        """Clear cached file analyses."""
+        self._cache.clear()
+
     def analyze_directory(
         self, dir_path: Path, extensions: list[str] | None = None
     ) -> list[QualityScore]:
@@ -198,25 +269,30 @@ class QualityAnalyzer:
         # Clarity checks
         clarity = 100
 
-        # Check line length
-        long_lines = sum(1 for line in lines if len(line) > 100)
-        if long_lines > 0:
-            issues.append(f"{long_lines} lines exceed 100 characters")
-            clarity -= min(20, long_lines * 2)
-
-        # Check function length
+        # Line length and function length share a single pass over lines
+        long_lines = 0
+        long_functions = 0
         in_function = False
         func_lines = 0
         for line in lines:
+            if len(line) > 100:
+                long_lines += 1
             if line.strip().startswith("def "):
                 if in_function and func_lines > 50:
-                    issues.append("Function exceeds 50 lines")
-                    clarity -= 10
+                    long_functions += 1
                 in_function = True
                 func_lines = 0
             elif in_function:
                 func_lines += 1
 
+        if long_lines > 0:
+            issues.append(f"{long_lines} lines exceed 100 characters")
+            clarity -= min(20, long_lines * 2)
+
+        for _ in range(long_functions):
+            issues.append("Function exceeds 50 lines")
+            clarity -= 10
+
         # Efficiency checks
         efficiency = 100
 
@@ -284,7 +360,7 @@ class QualityAnalyzer:
         clarity = 100
 
         # Check for code blocks
-        code_blocks = len(re.findall(r"```", content))
+        code_blocks = content.count("```")
         if code_blocks % 2 != 0:
             issues.append("Unclosed code block")
             clarity -= 15
@@ -359,7 +435,12 @@ class QualityAnalyzer:
         }
 
 
+_default_analyzer: QualityAnalyzer | None = None
+
+
 def analyze_quality(path: Path) -> QualityScore:
     """Convenience function to analyze a single file."""
-    analyzer = QualityAnalyzer()
-    return analyzer.analyze_file(path)
+    global _default_analyzer
+    if _default_analyzer is None:
+        _default_analyzer = QualityAnalyzer()
+    return _default_analyzer.analyze_file(path)
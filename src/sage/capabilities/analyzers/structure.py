@@ -17,7 +17,7 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class StructureIssue:
     """A single structure validation issue."""
 
@@ -38,7 +38,7 @@ class StructureIssue:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StructureReport:
     """Report from structure validation."""
 
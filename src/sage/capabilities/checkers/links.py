@@ -11,15 +11,28 @@ Author: SAGE AI Collab Team
 Version: 0.1.0
 """
 
+import bisect
+import json
 import logging
+import multiprocessing
+import os
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 from urllib.parse import unquote, urlparse
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,7 +56,7 @@ class LinkStatus(Enum):
     ERROR = "error"  # Check failed
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LinkResult:
     """Result of a link check."""
 
@@ -70,7 +83,7 @@ class LinkResult:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LinkReport:
     """A comprehensive link check report."""
 
@@ -83,6 +96,15 @@ class LinkReport:
     files_checked: int
     duration_ms: float
     timestamp: datetime = field(default_factory=datetime.now)
+    # Derived from results once, so repeated queries need no rescan
+    broken_results: tuple[LinkResult, ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Collect the broken results once at construction."""
+        broken = tuple(r for r in self.results if r.status == LinkStatus.BROKEN)
+        object.__setattr__(self, "broken_results", broken)
 
     @property
     def broken_rate(self) -> float:
@@ -102,11 +124,69 @@ class LinkReport:
             "files_checked": self.files_checked,
             "duration_ms": round(self.duration_ms, 2),
             "timestamp": self.timestamp.isoformat(),
-            "broken_links": [
-                r.to_dict() for r in self.results if r.status == LinkStatus.BROKEN
-            ],
+            "broken_links": [r.to_dict() for r in self.broken_results],
         }
 
+    def to_json(self) -> str:
+        """Serialize to a JSON string, using orjson when it is installed."""
+        data = self.to_dict()
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data).decode("utf-8")
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+class _RawLink(NamedTuple):
+    """A link found by the scanner, before it is classified and checked."""
+
+    line_number: int
+    is_image: bool
+    text: str
+    target: str
+
+
+def _extract_links(content: bytes) -> list[_RawLink]:
+    """
+    Extract markdown links and images from raw file contents.
+
+    The patterns are ASCII-only, so the scan runs over raw bytes and only
+    the captured text and target of each link are decoded.
+
+    Args:
+        content: Raw bytes of a Markdown file
+
+    Returns:
+        Links in line order; within a line, links come before images
+    """
+    # Scan the whole file once per pattern, then map match offsets back to
+    # 1-based line numbers
+    line_starts = [0, *(m.end() for m in re.finditer(b"\n", content))]
+    matches = [
+        (bisect.bisect_right(line_starts, m.start()), is_image, m)
+        for is_image, pattern in enumerate(
+            (LinkChecker.MD_LINK_BYTES_PATTERN, LinkChecker.MD_IMAGE_BYTES_PATTERN)
+        )
+        for m in pattern.finditer(content)
+    ]
+    matches.sort(key=lambda item: (item[0], item[1]))
+
+    return [
+        _RawLink(
+            line_number,
+            bool(is_image),
+            m.group(1).decode("utf-8"),
+            m.group(2).decode("utf-8").strip(),
+        )
+        for line_number, is_image, m in matches
+    ]
+
+
+def _scan_file(file_path: Path) -> list[_RawLink] | None:
+    """Read and scan one file in a worker process; None if it fails."""
+    try:
+        return _extract_links(file_path.read_bytes())
+    except Exception:
+        return None
+
 
 class LinkChecker:
     """
@@ -120,12 +200,22 @@ class LinkChecker:
     - Detailed reporting
     """
 
-    # Regex patterns for link extraction
-    MD_LINK_PATTERN = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
-    MD_IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+    # Regex patterns for link extraction; links never span lines, so
+    # check_file() can scan a whole file at once
+    MD_LINK_PATTERN = re.compile(r"\[([^\]\n]*)\]\(([^)\n]+)\)")
+    MD_IMAGE_PATTERN = re.compile(r"!\[([^\]\n]*)\]\(([^)\n]+)\)")
+    # Byte-level twins used by check_file() to scan undecoded file contents
+    MD_LINK_BYTES_PATTERN = re.compile(MD_LINK_PATTERN.pattern.encode())
+    MD_IMAGE_BYTES_PATTERN = re.compile(MD_IMAGE_PATTERN.pattern.encode())
     MD_REFERENCE_PATTERN = re.compile(r"\[([^\]]*)\]:\s*(\S+)")
     MD_HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
 
+    # Upper bound on worker threads reading files in check_all()
+    MAX_WORKERS = 8
+
+    # Files to re-check in one check_all() before scanning moves to processes
+    PROCESS_POOL_MIN_FILES = 2000
+
     def __init__(
         self,
         kb_path: Path | None = None,
@@ -146,6 +236,21 @@ class LinkChecker:
 
         self._heading_cache: dict[str, set[str]] = {}
         self._file_cache: set[str] = set()
+        self._dir_cache: set[str] = set()
+        # KB-relative path -> (mtime_ns, size), from the last check_all() walk
+        self._file_index: dict[str, tuple[int, int]] = {}
+        # KB-relative path -> ((mtime_ns, size), results, has cross-file anchors)
+        self._result_cache: dict[
+            str, tuple[tuple[int, int], list[LinkResult], bool]
+        ] = {}
+        # (source dir, target) -> (resolved path, exists, inside the KB), kept
+        # for one check_all() run or one standalone check_file() call
+        self._target_cache: dict[tuple[str, str], tuple[str, bool, bool]] = {}
+        self._in_check_all = False
+        # Files linking outside the KB in this check_all(); the index cannot
+        # see those targets change, so their results are never reused
+        self._outside_linkers: set[Path] = set()
+        self._last_report: LinkReport | None = None
 
     @staticmethod
     def _normalize_anchor(heading: str) -> str:
@@ -175,12 +280,30 @@ class LinkChecker:
         return headings
 
     def _build_file_cache(self) -> None:
-        """Build a cache of all files in KB."""
-        self._file_cache.clear()
-        for file_path in self.kb_path.rglob("*"):
-            if file_path.is_file():
-                rel_path = file_path.relative_to(self.kb_path)
-                self._file_cache.add(str(rel_path).replace("\\", "/"))
+        """Build a cache of all files in KB, with their modification times."""
+        index: dict[str, tuple[int, int]] = {}
+        dirs = {"."}
+        pending = [(str(self.kb_path), "")]
+        # One scandir walk; DirEntry.stat() reuses data from the listing
+        while pending:
+            dir_path, prefix = pending.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        rel_path = prefix + entry.name
+                        if entry.is_dir():
+                            dirs.add(rel_path)
+                            if not entry.is_symlink():
+                                pending.append((entry.path, rel_path + "/"))
+                        elif entry.is_file():
+                            stat = entry.stat()
+                            index[rel_path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError as e:
+                logger.warning(f"Error scanning {dir_path}: {e}")
+
+        self._file_index = index
+        self._file_cache = set(index)
+        self._dir_cache = dirs
 
     @staticmethod
     def _classify_link(link: str) -> LinkType:
@@ -202,12 +325,19 @@ class LinkChecker:
 
         return LinkType.INTERNAL
 
-    def _resolve_relative_path(self, source_file: Path, target: str) -> str:
-        """Resolve a relative path from a source file."""
+    def _resolve_relative_path(
+        self, source_file: Path, target: str
+    ) -> tuple[str, bool]:
+        """Resolve a relative path from a source file.
+
+        Returns:
+            The KB-relative path (or the raw target if it leaves the KB),
+            and whether it lies inside the KB
+        """
         # Remove anchor if present
         target_path = target.split("#")[0]
         if not target_path:
-            return str(source_file.relative_to(self.kb_path)).replace("\\", "/")
+            return self._relative_key(source_file), True
 
         # Decode URL encoding
         target_path = unquote(target_path)
@@ -217,9 +347,34 @@ class LinkChecker:
         resolved = (source_dir / target_path).resolve()
 
         try:
-            return str(resolved.relative_to(self.kb_path.resolve())).replace("\\", "/")
+            relative = resolved.relative_to(self.kb_path.resolve())
         except ValueError:
-            return target_path
+            return target_path, False
+        return str(relative).replace("\\", "/"), True
+
+    def _resolve_target(self, source_file: Path, target: str) -> tuple[str, bool]:
+        """
+        Resolve a link target and check it exists, once per source dir.
+
+        During check_all(), hits in the file index it just built are taken as
+        is; misses, and every lookup outside check_all(), go to the filesystem,
+        since the index skips symlinked directories and goes stale afterwards.
+        """
+        key = (str(source_file.parent), target)
+        cached = self._target_cache.get(key)
+        if cached is None:
+            resolved_path, inside = self._resolve_relative_path(source_file, target)
+            if self._in_check_all and (
+                resolved_path in self._file_cache or resolved_path in self._dir_cache
+            ):
+                exists = True
+            else:
+                exists = (self.kb_path / resolved_path).exists()
+            cached = (resolved_path, exists, inside)
+            self._target_cache[key] = cached
+        if not cached[2] and self._in_check_all:
+            self._outside_linkers.add(source_file)
+        return cached[0], cached[1]
 
     def _check_internal_link(
         self,
@@ -227,8 +382,9 @@ class LinkChecker:
         link_target: str,
         line_number: int,
         link_text: str,
+        link_type: LinkType = LinkType.INTERNAL,
     ) -> LinkResult:
-        """Check an internal link."""
+        """Check an internal link, reporting it as link_type (e.g. IMAGE)."""
         # Split target and anchor
         if "#" in link_target:
             file_part, anchor = link_target.split("#", 1)
@@ -237,22 +393,23 @@ class LinkChecker:
 
         # Resolve the file path
         if file_part:
-            resolved_path = self._resolve_relative_path(source_file, file_part)
+            resolved_path, exists = self._resolve_target(source_file, file_part)
             target_file = self.kb_path / resolved_path
         else:
             target_file = source_file
             resolved_path = str(source_file.relative_to(self.kb_path)).replace(
                 "\\", "/"
             )
+            exists = True
 
         # Check if a file exists
-        if file_part and not target_file.exists():
+        if not exists:
             return LinkResult(
                 source_file=str(source_file.relative_to(self.kb_path)),
                 line_number=line_number,
                 link_text=link_text,
                 link_target=link_target,
-                link_type=LinkType.INTERNAL,
+                link_type=link_type,
                 status=LinkStatus.BROKEN,
                 message=f"File not found: {resolved_path}",
             )
@@ -266,7 +423,7 @@ class LinkChecker:
                     line_number=line_number,
                     link_text=link_text,
                     link_target=link_target,
-                    link_type=LinkType.INTERNAL,
+                    link_type=link_type,
                     status=LinkStatus.WARNING,
                     message=f"Anchor not found: #{anchor}",
                     details={"available_anchors": list(headings)[:10]},
@@ -277,7 +434,7 @@ class LinkChecker:
             line_number=line_number,
             link_text=link_text,
             link_target=link_target,
-            link_type=LinkType.INTERNAL,
+            link_type=link_type,
             status=LinkStatus.VALID,
             message="OK",
         )
@@ -369,62 +526,48 @@ class LinkChecker:
                 message=f"URL parse error: {e}",
             )
 
-    def check_file(self, file_path: Path) -> list[LinkResult]:
+    def check_file(
+        self, file_path: Path, links: list[_RawLink] | None = None
+    ) -> list[LinkResult]:
         """
         Check all links in a single file.
 
         Args:
             file_path: Path to the Markdown file
+            links: Links already extracted from the file, if scanned elsewhere
 
         Returns:
             List of LinkResult for each link found
         """
         results = []
+        # Outside check_all() the filesystem may have changed since last time
+        if not self._in_check_all:
+            self._target_cache.clear()
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
-            for line_num, line in enumerate(lines, start=1):
-                # Check markdown links
-                for match in self.MD_LINK_PATTERN.finditer(line):
-                    link_text = match.group(1)
-                    link_target = match.group(2).strip()
-
-                    link_type = self._classify_link(link_target)
-
-                    if link_type == LinkType.ANCHOR:
-                        result = self._check_anchor_link(
-                            file_path, link_target, line_num, link_text
-                        )
-                    elif link_type == LinkType.EXTERNAL:
-                        result = self._check_external_link(
-                            file_path, link_target, line_num, link_text
-                        )
-                    else:
-                        result = self._check_internal_link(
-                            file_path, link_target, line_num, link_text
-                        )
-
-                    results.append(result)
-
-                # Check image links
-                for match in self.MD_IMAGE_PATTERN.finditer(line):
-                    link_text = match.group(1)
-                    link_target = match.group(2).strip()
-
-                    link_type = self._classify_link(link_target)
-                    if link_type == LinkType.EXTERNAL:
-                        result = self._check_external_link(
-                            file_path, link_target, line_num, link_text
-                        )
-                    else:
-                        result = self._check_internal_link(
-                            file_path, link_target, line_num, link_text
-                        )
-                        result.link_type = LinkType.IMAGE
-
-                    results.append(result)
+            if links is None:
+                links = _extract_links(file_path.read_bytes())
+            for line_num, is_image, link_text, link_target in links:
+                link_type = self._classify_link(link_target)
+
+                if link_type == LinkType.EXTERNAL:
+                    result = self._check_external_link(
+                        file_path, link_target, line_num, link_text
+                    )
+                elif link_type == LinkType.ANCHOR and not is_image:
+                    result = self._check_anchor_link(
+                        file_path, link_target, line_num, link_text
+                    )
+                else:
+                    result = self._check_internal_link(
+                        file_path,
+                        link_target,
+                        line_num,
+                        link_text,
+                        LinkType.IMAGE if is_image else LinkType.INTERNAL,
+                    )
+
+                results.append(result)
 
         except Exception as e:
             logger.error(f"Error checking file {file_path}: {e}")
@@ -456,46 +599,140 @@ class LinkChecker:
 
         start_time = time.monotonic()
 
-        # Build file cache for faster lookups
+        # Re-index the KB; targets may have changed since the last run
+        previous_index = self._file_index
+        previous_dirs = self._dir_cache
         self._build_file_cache()
-
-        all_results = []
-        files_checked = 0
-
-        for file_path in self.kb_path.glob(pattern):
-            if file_path.is_file():
-                results = self.check_file(file_path)
+        self._target_cache.clear()
+        self._outside_linkers.clear()
+        # check_file() calls share resolved targets only within this run
+        self._in_check_all = True
+        try:
+            same_paths = (
+                previous_index.keys() == self._file_index.keys()
+                and previous_dirs == self._dir_cache
+            )
+            changed_md = {
+                rel_path
+                for rel_path, version in self._file_index.items()
+                if rel_path.endswith(".md") and previous_index.get(rel_path) != version
+            }
+            for rel_path in changed_md:
+                self._heading_cache.pop(str(self.kb_path / rel_path), None)
+
+            files = [p for p in self.kb_path.glob(pattern) if p.is_file()]
+            rel_paths = [self._relative_key(p) for p in files]
+
+            # A file's results depend on its own content, on which files and
+            # directories exist and, for cross-file anchors, on other files'
+            # headings
+            per_file: list[list[LinkResult] | None] = []
+            for rel_path in rel_paths:
+                cached = self._result_cache.get(rel_path)
+                if (
+                    cached is not None
+                    and same_paths
+                    and cached[0] == self._file_index.get(rel_path)
+                    and not (changed_md and cached[2])
+                ):
+                    per_file.append(cached[1])
+                else:
+                    per_file.append(None)
+
+            stale = [
+                p for p, results in zip(files, per_file, strict=True) if results is None
+            ]
+
+            # Very large batches are CPU-bound on the regex scan, so extract links
+            # in worker processes and only classify them here
+            if len(stale) >= self.PROCESS_POOL_MIN_FILES:
+                fresh = iter(self._check_files_multiprocess(stale))
+            # Otherwise file checks are I/O-bound, so overlap them on a thread
+            # pool; map() keeps results in glob order
+            elif len(stale) > 1:
+                workers = min(self.MAX_WORKERS, len(stale))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    fresh = iter(list(executor.map(self.check_file, stale)))
+            else:
+                fresh = iter([self.check_file(p) for p in stale])
+
+            all_results = []
+            for path, rel_path, results in zip(files, rel_paths, per_file, strict=True):
+                if results is None:
+                    results = next(fresh)
+                    if path in self._outside_linkers:
+                        self._result_cache.pop(rel_path, None)
+                    else:
+                        self._result_cache[rel_path] = (
+                            self._file_index.get(rel_path, (-1, -1)),
+                            results,
+                            any(self._is_cross_file_anchor(r) for r in results),
+                        )
                 all_results.extend(results)
-                files_checked += 1
-
-        duration = (time.monotonic() - start_time) * 1000
-
-        # Count by status
-        valid = sum(1 for r in all_results if r.status == LinkStatus.VALID)
-        broken = sum(1 for r in all_results if r.status == LinkStatus.BROKEN)
-        warning = sum(1 for r in all_results if r.status == LinkStatus.WARNING)
-        skipped = sum(1 for r in all_results if r.status == LinkStatus.SKIPPED)
-
-        return LinkReport(
-            total_links=len(all_results),
-            valid_count=valid,
-            broken_count=broken,
-            warning_count=warning,
-            skipped_count=skipped,
-            results=all_results,
-            files_checked=files_checked,
-            duration_ms=duration,
+            files_checked = len(files)
+
+            duration = (time.monotonic() - start_time) * 1000
+
+            # Count by status in a single pass
+            counts = Counter(r.status for r in all_results)
+
+            self._last_report = LinkReport(
+                total_links=len(all_results),
+                valid_count=counts[LinkStatus.VALID],
+                broken_count=counts[LinkStatus.BROKEN],
+                warning_count=counts[LinkStatus.WARNING],
+                skipped_count=counts[LinkStatus.SKIPPED],
+                results=all_results,
+                files_checked=files_checked,
+                duration_ms=duration,
+            )
+            return self._last_report
+        finally:
+            self._in_check_all = False
+
+    def _check_files_multiprocess(self, files: list[Path]) -> list[list[LinkResult]]:
+        """Scan files in worker processes, then check their links here."""
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(files) // (4 * workers))
+        # spawn: forking a process that may be running threads is unsafe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            scanned = list(pool.map(_scan_file, files, chunksize=chunksize))
+        # A file that failed to scan is re-read in-process to report the error
+        return [
+            self.check_file(path, links)
+            for path, links in zip(files, scanned, strict=True)
+        ]
+
+    def _relative_key(self, file_path: Path) -> str:
+        """Get the KB-relative, slash-separated key for a file."""
+        return str(file_path.relative_to(self.kb_path)).replace("\\", "/")
+
+    @staticmethod
+    def _is_cross_file_anchor(result: LinkResult) -> bool:
+        """Check if a result depends on the headings of another file."""
+        target = result.link_target
+        return (
+            result.link_type in (LinkType.INTERNAL, LinkType.IMAGE)
+            and "#" in target
+            and not target.startswith("#")
         )
 
     def get_broken_links(self) -> list[LinkResult]:
-        """Get all broken links from the last check."""
-        report = self.check_all()
-        return [r for r in report.results if r.status == LinkStatus.BROKEN]
+        """Get all broken links from the last check, running one if needed."""
+        report = self._last_report or self.check_all()
+        return list(report.broken_results)
 
     def clear_cache(self) -> None:
         """Clear internal caches."""
         self._heading_cache.clear()
         self._file_cache.clear()
+        self._dir_cache.clear()
+        self._file_index.clear()
+        self._result_cache.clear()
+        self._target_cache.clear()
+        self._outside_linkers.clear()
+        self._last_report = None
 
 
 # Convenience function
@@ -11,17 +11,40 @@ Version: 0.1.0
 """
 
 import asyncio
+import inspect
+import itertools
+import json
 import logging
+import os
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Alert callbacks may be plain functions or coroutine functions
+AlertCallback = Callable[["HealthReport"], None | Awaitable[None]]
+
+# (inputs key, sage.yaml parse error or None, merged config)
+_ConfigLoad = tuple[tuple[Any, ...], str | None, dict[str, Any]]
+
+
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds elapsed since a time.perf_counter() reading."""
+    return (time.perf_counter() - start) * 1000
+
 
 class HealthStatus(Enum):
     """Health status levels."""
@@ -32,7 +55,7 @@ class HealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthCheck:
     """Result of a single health check."""
 
@@ -55,7 +78,7 @@ class HealthCheck:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthReport:
     """Comprehensive health report."""
 
@@ -85,6 +108,13 @@ class HealthReport:
             },
         }
 
+    def to_json(self) -> str:
+        """Serialize to a JSON string, using orjson when it is installed."""
+        data = self.to_dict()
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data).decode("utf-8")
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
 
 class HealthMonitor:
     """
@@ -102,6 +132,7 @@ class HealthMonitor:
         kb_path: Path | None = None,
         check_interval_s: float = 60.0,
         history_size: int = 100,
+        check_timeout_s: float = 10.0,
     ):
         """
         Initialize health monitor.
@@ -110,26 +141,37 @@ class HealthMonitor:
             kb_path: Path to knowledge base root
             check_interval_s: Interval between automatic checks
             history_size: Number of historical checks to retain
+            check_timeout_s: Per-check timeout within check_all()
         """
         self.kb_path = kb_path or Path(__file__).parent.parent.parent
         self.check_interval_s = check_interval_s
         self.history_size = history_size
+        self.check_timeout_s = check_timeout_s
 
-        self._history: list[HealthReport] = []
-        self._alert_callbacks: list[Callable[[HealthReport], None]] = []
+        # Last load_config() result; see _config_key() for what it depends on
+        self._config_load: _ConfigLoad | None = None
+
+        # Ring buffer: appends evict the oldest report once full
+        self._history: deque[HealthReport] = deque(maxlen=history_size)
+        self._alert_callbacks: list[AlertCallback] = []
         self._running = False
         self._task: asyncio.Task | None = None
 
     def register_alert_callback(
         self,
-        callback: Callable[[HealthReport], None],
+        callback: AlertCallback,
     ) -> None:
-        """Register a callback for health alerts."""
+        """Register a sync or async callback for health alerts."""
         self._alert_callbacks.append(callback)
 
     async def check_filesystem(self) -> HealthCheck:
         """Check file system health."""
-        start = time.monotonic()
+        # Directory walks block, so keep them off the event loop
+        return await asyncio.to_thread(self._check_filesystem)
+
+    def _check_filesystem(self) -> HealthCheck:
+        """Run the blocking file system checks."""
+        start = time.perf_counter()
         try:
             # Check if the KB path exists
             if not self.kb_path.exists():
@@ -137,45 +179,54 @@ class HealthMonitor:
                     name="filesystem",
                     status=HealthStatus.UNHEALTHY,
                     message=f"KB path not found: {self.kb_path}",
-                    duration_ms=(time.monotonic() - start) * 1000,
+                    duration_ms=_elapsed_ms(start),
                 )
 
+            # List each parent directory once instead of a stat per path
+            listings: dict[str, set[str]] = {}
+
+            def present(rel_path: str) -> bool:
+                parent, _, name = rel_path.rpartition("/")
+                if parent not in listings:
+                    listings[parent] = self._list_names(self.kb_path / parent)
+                return name in listings[parent]
+
             # Check core directories
             core_dirs = [".knowledge/core", ".knowledge/guidelines", "tools"]
-            missing_dirs = []
-            for dir_name in core_dirs:
-                dir_path = self.kb_path / dir_name
-                if not dir_path.exists():
-                    missing_dirs.append(dir_name)
+            missing_dirs = [d for d in core_dirs if not present(d)]
 
             if missing_dirs:
                 return HealthCheck(
                     name="filesystem",
                     status=HealthStatus.DEGRADED,
                     message=f"Missing directories: {', '.join(missing_dirs)}",
-                    duration_ms=(time.monotonic() - start) * 1000,
+                    duration_ms=_elapsed_ms(start),
                     details={"missing": missing_dirs},
                 )
 
             # Check index.md exists
-            index_path = self.kb_path / "index.md"
-            if not index_path.exists():
+            if not present("index.md"):
                 return HealthCheck(
                     name="filesystem",
                     status=HealthStatus.DEGRADED,
                     message="index.md not found",
-                    duration_ms=(time.monotonic() - start) * 1000,
+                    duration_ms=_elapsed_ms(start),
                 )
 
-            # Count files
-            md_count = len(list(self.kb_path.rglob("*.md")))
-            py_count = len(list(self.kb_path.rglob("*.py")))
+            # Count files in a single walk
+            md_count = py_count = 0
+            for _, _, filenames in os.walk(self.kb_path):
+                for filename in filenames:
+                    if filename.endswith(".md"):
+                        md_count += 1
+                    elif filename.endswith(".py"):
+                        py_count += 1
 
             return HealthCheck(
                 name="filesystem",
                 status=HealthStatus.HEALTHY,
                 message=f"All directories present ({md_count} MD, {py_count} PY files)",
-                duration_ms=(time.monotonic() - start) * 1000,
+                duration_ms=_elapsed_ms(start),
                 details={"md_files": md_count, "py_files": py_count},
             )
 
@@ -184,9 +235,18 @@ class HealthMonitor:
                 name="filesystem",
                 status=HealthStatus.UNHEALTHY,
                 message=f"Error checking filesystem: {e}",
-                duration_ms=(time.monotonic() - start) * 1000,
+                duration_ms=_elapsed_ms(start),
             )
 
+    @staticmethod
+    def _list_names(dir_path: Path) -> set[str]:
+        """List entry names in a directory, or an empty set if unreadable."""
+        try:
+            with os.scandir(dir_path) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
+
     async def check_config(self) -> HealthCheck:
         """Check configuration health.
 
@@ -195,7 +255,12 @@ class HealthMonitor:
         2. sage.yaml is valid YAML
         3. Merged config (sage.yaml + config/*.yaml) has required keys
         """
-        start = time.monotonic()
+        # YAML parsing blocks, so keep it off the event loop
+        return await asyncio.to_thread(self._check_config)
+
+    def _check_config(self) -> HealthCheck:
+        """Run the blocking configuration checks."""
+        start = time.perf_counter()
         try:
             # Check that sage.yaml exists (entry point)
             config_path = self.kb_path / "sage.yaml"
@@ -205,28 +270,19 @@ class HealthMonitor:
                     name="config",
                     status=HealthStatus.DEGRADED,
                     message="sage.yaml not found",
-                    duration_ms=(time.monotonic() - start) * 1000,
+                    duration_ms=_elapsed_ms(start),
                 )
 
-            # First, validate sage.yaml is parseable YAML
-            import yaml
-
-            try:
-                with open(config_path, encoding="utf-8") as f:
-                    yaml.safe_load(f)
-            except yaml.YAMLError as e:
+            # Load the merged config, failing if sage.yaml is not valid YAML
+            parse_error, config = self._load_config(config_path)
+            if parse_error is not None:
                 return HealthCheck(
                     name="config",
                     status=HealthStatus.UNHEALTHY,
-                    message=f"Error parsing sage.yaml: {e}",
-                    duration_ms=(time.monotonic() - start) * 1000,
+                    message=f"Error parsing sage.yaml: {parse_error}",
+                    duration_ms=_elapsed_ms(start),
                 )
 
-            # Use unified config system to load merged configuration
-            from sage.core.config import load_config
-
-            config = load_config(config_path)
-
             # Check required keys in merged config (from sage.yaml + config/*.yaml)
             required_keys = ["version", "timeout", "loading"]
             missing_keys = [k for k in required_keys if k not in config]
@@ -236,7 +292,7 @@ class HealthMonitor:
                     name="config",
                     status=HealthStatus.DEGRADED,
                     message=f"Missing config keys: {', '.join(missing_keys)}",
-                    duration_ms=(time.monotonic() - start) * 1000,
+                    duration_ms=_elapsed_ms(start),
                     details={"missing_keys": missing_keys},
                 )
 
@@ -244,7 +300,7 @@ class HealthMonitor:
                 name="config",
                 status=HealthStatus.HEALTHY,
                 message=f"Config valid (version: {config.get('version', 'unknown')})",
-                duration_ms=(time.monotonic() - start) * 1000,
+                duration_ms=_elapsed_ms(start),
                 details={"version": config.get("version")},
             )
 
@@ -253,12 +309,66 @@ class HealthMonitor:
                 name="config",
                 status=HealthStatus.UNHEALTHY,
                 message=f"Error checking config: {e}",
-                duration_ms=(time.monotonic() - start) * 1000,
+                duration_ms=_elapsed_ms(start),
             )
 
+    def _load_config(self, config_path: Path) -> tuple[str | None, dict[str, Any]]:
+        """
+        Load the merged config, reusing the last result while its inputs hold.
+
+        Args:
+            config_path: Path to sage.yaml
+
+        Returns:
+            The sage.yaml parse error message (or None), and the merged config
+        """
+        # Use unified config system to load merged configuration
+        from sage.core.config import load_config
+        from sage.core.exceptions import ConfigParseError
+
+        key = self._config_key(config_path)
+        if self._config_load is not None and self._config_load[0] == key:
+            return self._config_load[1], self._config_load[2]
+
+        error: str | None = None
+        config: dict[str, Any] = {}
+        try:
+            config = load_config(config_path, strict=True)
+        except ConfigParseError as e:
+            error = str(e.details.get("parse_error", e))
+
+        self._config_load = (key, error, config)
+        return error, config
+
+    @staticmethod
+    def _config_key(config_path: Path) -> tuple[Any, ...]:
+        """
+        Fingerprint what load_config() reads, without parsing anything.
+
+        Covers sage.yaml, config/*.yaml and SAGE_* environment overrides.
+        Files pulled in by sage.yaml ``includes`` are re-read when sage.yaml
+        or config/ changes.
+        """
+        try:
+            with os.scandir(config_path.parent / "config") as entries:
+                config_dir = sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in entries
+                    if entry.name.endswith(".yaml")
+                )
+        except OSError:
+            config_dir = []
+        env = sorted(item for item in os.environ.items() if item[0].startswith("SAGE_"))
+        return (
+            str(config_path),
+            config_path.stat().st_mtime_ns,
+            tuple(config_dir),
+            tuple(env),
+        )
+
     async def check_loader(self) -> HealthCheck:
         """Check loader health by attempting a quick load."""
-        start = time.monotonic()
+        start = time.perf_counter()
         try:
             # Import loader
             import sys
@@ -272,7 +382,7 @@ class HealthMonitor:
             loader = KnowledgeLoader(kb_path=self.kb_path)
             result = await loader.load_core(timeout_ms=2000)
 
-            duration = (time.monotonic() - start) * 1000
+            duration = _elapsed_ms(start)
 
             if result.status == "success":
                 return HealthCheck(
@@ -306,18 +416,32 @@ class HealthMonitor:
                 name="loader",
                 status=HealthStatus.UNHEALTHY,
                 message=f"Loader error: {e}",
-                duration_ms=(time.monotonic() - start) * 1000,
+                duration_ms=_elapsed_ms(start),
+            )
+
+    async def _run_check(
+        self, name: str, check: Coroutine[Any, Any, HealthCheck]
+    ) -> HealthCheck:
+        """Await a check, reporting it unhealthy if it exceeds the timeout."""
+        try:
+            return await asyncio.wait_for(check, timeout=self.check_timeout_s)
+        except TimeoutError:
+            return HealthCheck(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                message=f"Check timed out after {self.check_timeout_s}s",
+                duration_ms=self.check_timeout_s * 1000,
             )
 
     async def check_all(self) -> HealthReport:
         """Run all health checks and generate a report."""
-        start = time.monotonic()
+        start = time.perf_counter()
 
-        # Run all checks concurrently
+        # Run all checks concurrently, each bounded by the check timeout
         checks = await asyncio.gather(
-            self.check_filesystem(),
-            self.check_config(),
-            self.check_loader(),
+            self._run_check("filesystem", self.check_filesystem()),
+            self._run_check("config", self.check_config()),
+            self._run_check("loader", self.check_loader()),
             return_exceptions=True,
         )
 
@@ -348,26 +472,44 @@ class HealthMonitor:
         report = HealthReport(
             overall_status=overall,
             checks=results,
-            duration_ms=(time.monotonic() - start) * 1000,
+            duration_ms=_elapsed_ms(start),
         )
 
         # Store in history
         self._history.append(report)
-        if len(self._history) > self.history_size:
-            self._history.pop(0)
 
-        # Trigger alerts if unhealthy
+        # Trigger alerts if unhealthy; slow callbacks don't delay the others
         if overall in [HealthStatus.UNHEALTHY, HealthStatus.DEGRADED]:
-            for callback in self._alert_callbacks:
-                try:
-                    callback(report)
-                except Exception as e:
-                    logger.error(f"Alert callback error: {e}")
+            await asyncio.gather(
+                *(self._safe_alert(cb, report) for cb in self._alert_callbacks)
+            )
 
         return report
 
+    @staticmethod
+    async def _safe_alert(callback: AlertCallback, report: HealthReport) -> None:
+        """Run one alert callback, logging instead of raising on failure."""
+        try:
+            if inspect.iscoroutinefunction(callback) or inspect.iscoroutinefunction(
+                type(callback).__call__
+            ):
+                result = callback(report)
+            else:
+                # Run sync callbacks in a thread to avoid blocking the loop
+                result = await asyncio.to_thread(callback, report)
+            # Wrappers and lambdas may also hand back a coroutine to await
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Alert callback error: {e}")
+
     async def start_monitoring(self) -> None:
-        """Start continuous health monitoring."""
+        """
+        Start continuous health monitoring.
+
+        The monitoring task is created on the currently running event loop,
+        so it runs on uvloop whenever the caller's loop is a uvloop loop.
+        """
         if self._running:
             return
 
@@ -398,7 +540,8 @@ class HealthMonitor:
 
     def get_history(self, limit: int = 10) -> list[HealthReport]:
         """Get recent health history."""
-        return self._history[-limit:]
+        start = max(0, len(self._history) - limit) if limit > 0 else 0
+        return list(itertools.islice(self._history, start, None))
 
     def get_status_summary(self) -> dict[str, Any]:
         """Get the current status summary."""
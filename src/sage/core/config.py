@@ -387,7 +387,9 @@ def merge_configs(*configs: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
-def load_config(config_path: Path | None = None) -> dict[str, Any]:
+def load_config(
+    config_path: Path | None = None, *, strict: bool = False
+) -> dict[str, Any]:
     """
     Load complete configuration with all sources merged.
 
@@ -400,9 +402,14 @@ def load_config(config_path: Path | None = None) -> dict[str, Any]:
 
     Args:
         config_path: Optional explicit path to config file
+        strict: Raise instead of falling back to defaults when the main
+            config file cannot be parsed
 
     Returns:
         Complete merged configuration dictionary
+
+    Raises:
+        ConfigParseError: If strict and the main config file is invalid YAML
     """
     configs = [DEFAULT_CONFIG.copy()]
 
@@ -431,7 +438,11 @@ def load_config(config_path: Path | None = None) -> dict[str, Any]:
 
             # Add main config (highest priority among file configs)
             configs.append(yaml_config)
-        except (ConfigNotFoundError, ConfigParseError):
+        except ConfigParseError:
+            if strict:
+                raise
+            # Otherwise use defaults if config file has issues
+        except ConfigNotFoundError:
             pass  # Use defaults if config file has issues
 
     # Apply environment overrides (highest priority)
@@ -10,9 +10,14 @@ Features:
 Version: 0.1.0
 """
 
+import inspect
+import itertools
 import logging
 import threading
-from collections.abc import Callable
+import weakref
+from collections import deque
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional, TypeVar, get_type_hints
@@ -27,18 +32,123 @@ class Lifetime(Enum):
 
     SINGLETON = "singleton"  # One instance for entire application
     TRANSIENT = "transient"  # New instance every time
-    SCOPED = "scoped"  # One instance per scope (e.g., request)
+    # One live instance per scope (e.g., request): reused while referenced
+    # elsewhere, rebuilt once dropped, unless it has dispose()
+    SCOPED = "scoped"
+
+
+# Source of Registration.id values
+_registration_ids = itertools.count()
+
+# Registration ids under construction (DFS "gray" set) are passed down the
+# resolution as an argument; this only carries them into factories, which
+# call back into resolve(). Paired with the container that owns them, since
+# one module-level variable serves every container. Ints avoid hashing
+# arbitrary types.
+_RESOLVING: ContextVar[tuple["DIContainer", set[int]] | None] = ContextVar(
+    "di_resolving", default=None
+)
 
 
-@dataclass
 class Registration:
-    """Service registration info."""
+    """
+    Service registration info.
 
-    interface: type
-    implementation: type
-    lifetime: Lifetime
-    config_key: str | None = None
-    factory: Callable[..., Any] | None = None
+    A plain slotted class: registrations are created for every register()
+    call, so __init__ is hand-written rather than dataclass-generated, and
+    being unique per interface they compare and hash by identity.
+    """
+
+    __slots__ = (
+        "interface",
+        "implementation",
+        "lifetime",
+        "config_key",
+        "factory",
+        "deps",
+        "strategy",
+        "config_path",
+        "id",
+    )
+
+    def __init__(
+        self,
+        interface: type,
+        implementation: type,
+        lifetime: Lifetime,
+        config_key: str | None = None,
+        factory: Callable[..., Any] | None = None,
+        deps: tuple[tuple[str, Any], ...] | None = (),
+    ) -> None:
+        self.interface = interface
+        self.implementation = implementation
+        self.lifetime = lifetime
+        self.config_key = config_key
+        self.factory = factory
+        self.deps = deps
+        self.strategy: _LifetimeStrategy = _STRATEGIES[lifetime]
+        self.config_path = tuple(config_key.split(".")) if config_key else ()
+        self.id = next(_registration_ids)
+
+    def __repr__(self) -> str:
+        return (
+            f"Registration(interface={self.interface.__name__}, "
+            f"implementation={self.implementation.__name__}, "
+            f"lifetime={self.lifetime.value})"
+        )
+
+
+# Constructor analyses per implementation class; weak so that analyzing a
+# class never keeps it alive
+_deps_cache: weakref.WeakKeyDictionary[type, tuple[tuple[str, Any], ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _analyze_deps(implementation: type) -> tuple[tuple[str, Any], ...] | None:
+    """
+    Inspect a constructor once for auto-wiring.
+
+    Failures are not cached: a hint may be a forward reference to a class
+    that is defined only after registration, so a later call can succeed.
+
+    Args:
+        implementation: The concrete class to inspect
+
+    Returns:
+        (parameter name, annotated type) pairs in signature order, or None
+        if the type hints cannot be evaluated yet
+    """
+    deps = _deps_cache.get(implementation)
+    if deps is not None:
+        return deps
+    try:
+        init = implementation.__init__  # type: ignore[misc]
+        parameters = inspect.signature(init).parameters
+        hints = get_type_hints(init)
+    except Exception:
+        return None
+    deps = tuple(
+        (name, hints[name]) for name in parameters if name != "self" and name in hints
+    )
+    _deps_cache[implementation] = deps
+    return deps
+
+
+def _registration_deps(registration: Registration) -> tuple[tuple[str, Any], ...]:
+    """
+    Return a registration's constructor dependencies.
+
+    Registrations whose hints could not be evaluated when registered are
+    analyzed again here, and keep the result once it succeeds.
+    """
+    deps = registration.deps
+    if deps is None:
+        deps = _analyze_deps(registration.implementation)
+        if deps is None:
+            return ()
+        registration.deps = deps
+    return deps
 
 
 @dataclass
@@ -51,6 +161,40 @@ class ServiceDescriptor:
     factory: Callable[..., Any] | None = None
 
 
+class _ScopeInstances:
+    """
+    Instances held by one scope.
+
+    Instances are reused while something else references them; only those
+    with a dispose() method are kept alive until the scope is disposed.
+    """
+
+    __slots__ = ("instances", "pinned", "disposables")
+
+    def __init__(self) -> None:
+        self.instances: weakref.WeakValueDictionary[type, Any] = (
+            weakref.WeakValueDictionary()
+        )
+        self.pinned: dict[type, Any] = {}  # Values that cannot be weakly referenced
+        self.disposables: list[Any] = []
+
+    def get(self, interface: type) -> Any | None:
+        """Return the live instance for an interface, if any."""
+        instance = self.instances.get(interface)
+        if instance is None:
+            instance = self.pinned.get(interface)
+        return instance
+
+    def add(self, interface: type, instance: Any) -> None:
+        """Store a newly created instance."""
+        try:
+            self.instances[interface] = instance
+        except TypeError:
+            self.pinned[interface] = instance
+        if hasattr(instance, "dispose"):
+            self.disposables.append(instance)
+
+
 class DIContainerError(Exception):
     """Base exception for DI container errors."""
 
@@ -97,9 +241,12 @@ class DIContainer:
     def __init__(self) -> None:
         self._registrations: dict[type, Registration] = {}
         self._singletons: dict[type, Any] = {}
-        self._scoped: dict[str, dict[type, Any]] = {}
+        self._scoped: dict[str, _ScopeInstances] = {}
         self._config: dict[str, Any] = {}
-        self._resolving: set[type] = set()  # Track resolution stack for circular deps
+        self._config_cache: dict[tuple[str, ...], Any] = {}
+        # Cleared by build() once the graph is proven acyclic; any later
+        # registration change may introduce a cycle again
+        self._cycles_possible = True
 
     @classmethod
     def get_instance(cls) -> "DIContainer":
@@ -124,12 +271,18 @@ class DIContainer:
             config: Configuration dictionary with 'di' section
         """
         self._config = config
+        self._config_cache.clear()
         di_config = config.get("di", {})
 
-        # Register services from config
+        # Register services from config in one batch
         services = di_config.get("services", {})
+        descriptors: dict[type, ServiceDescriptor] = {}
         for service_name, service_config in services.items():
-            self._register_from_config(service_name, service_config)
+            entry = self._descriptor_from_config(service_name, service_config)
+            if entry is not None:
+                interface, descriptor = entry
+                descriptors[interface] = descriptor
+        self.register_many(descriptors)
 
         logger.debug(f"DI Container configured with {len(services)} services")
 
@@ -147,22 +300,59 @@ class DIContainer:
         Args:
             interface: The interface/protocol type to register
             implementation: The concrete implementation class
-            lifetime: Service lifetime (SINGLETON, TRANSIENT, SCOPED)
+            lifetime: Service lifetime (SINGLETON, TRANSIENT, SCOPED).
+                A scope holds SCOPED instances weakly: one is reused only
+                while a caller still references it and is constructed
+                again after it has been released. Instances with a
+                dispose() method are kept until the scope is disposed.
             config_key: Optional config key for injecting configuration
             factory: Optional factory function to create instances
         """
-        if implementation is None and factory is None:
-            implementation = interface  # Self-registration
+        impl: type = implementation or interface  # Self-registration
 
-        self._registrations[interface] = Registration(
-            interface=interface,
-            implementation=implementation or interface,
-            lifetime=lifetime,
-            config_key=config_key,
-            factory=factory,
+        # A replaced registration must not keep serving the old instance
+        self._singletons.pop(interface, None)
+        self._cycles_possible = True
+        self._registrations[interface] = self._new_registration(
+            interface, ServiceDescriptor(impl, lifetime, config_key, factory)
         )
         logger.debug(
-            f"Registered {interface.__name__} -> {(implementation or interface).__name__} ({lifetime.value})"
+            f"Registered {interface.__name__} -> {impl.__name__} ({lifetime.value})"
+        )
+
+    def register_many(self, services: Mapping[type, ServiceDescriptor]) -> None:
+        """
+        Register several services at once.
+
+        Equivalent to calling register() for each entry, but the container's
+        registration table is updated in a single step.
+
+        Args:
+            services: Mapping of interface/protocol type to its descriptor
+        """
+        registrations = {
+            interface: self._new_registration(interface, descriptor)
+            for interface, descriptor in services.items()
+        }
+        for interface in registrations:
+            self._singletons.pop(interface, None)
+        self._cycles_possible = True
+        self._registrations.update(registrations)
+        logger.debug(f"Registered {len(registrations)} services")
+
+    @staticmethod
+    def _new_registration(
+        interface: type, descriptor: ServiceDescriptor
+    ) -> Registration:
+        """Create a registration, analyzing constructor dependencies once."""
+        implementation = descriptor.implementation
+        return Registration(
+            interface=interface,
+            implementation=implementation,
+            lifetime=descriptor.lifetime,
+            config_key=descriptor.config_key,
+            factory=descriptor.factory,
+            deps=_analyze_deps(implementation) if descriptor.factory is None else (),
         )
 
     def register_instance(self, interface: type[T], instance: T) -> None:
@@ -173,6 +363,7 @@ class DIContainer:
             interface: The interface/protocol type
             instance: The pre-created instance
         """
+        self._cycles_possible = True
         self._registrations[interface] = Registration(
             interface=interface,
             implementation=type(instance),
@@ -217,39 +408,80 @@ class DIContainer:
             CircularDependencyError: If circular dependency detected
             ScopeRequiredError: If scope ID required but not provided
         """
-        if interface not in self._registrations:
+        # Fast path: singletons already built, e.g. by build()
+        if interface in self._singletons:
+            return self._singletons[interface]  # type: ignore[no-any-return]
+
+        # Non-None only when called from a factory during another resolution
+        return self._resolve(interface, scope_id, self._factory_inflight())  # type: ignore[no-any-return]
+
+    def _resolve(
+        self, interface: type, scope_id: str | None, inflight: set[int] | None
+    ) -> Any:
+        """Resolve a service, passing the in-flight registration ids down."""
+        if interface in self._singletons:
+            return self._singletons[interface]
+
+        registration = self._registrations.get(interface)
+        if registration is None:
             raise ServiceNotFoundError(
                 f"No registration found for {interface.__name__}"
             )
+        return registration.strategy.get(self, registration, scope_id, inflight)
 
-        # Check for circular dependencies
-        if interface in self._resolving:
-            raise CircularDependencyError(
-                f"Circular dependency detected while resolving {interface.__name__}"
-            )
+    def build(self) -> None:
+        """
+        Check the dependency graph and construct every singleton up front.
 
-        registration = self._registrations[interface]
+        Registrations are ordered with Kahn's algorithm over the constructor
+        dependencies analyzed at registration. Singletons are then created in
+        that order, so each one finds its dependencies already cached and
+        later resolve() calls are a single dict lookup. If the graph is
+        acyclic and no factory (whose dependencies are opaque) is registered,
+        later constructions also skip runtime cycle tracking.
 
-        # Singleton: return cached or create once
-        if registration.lifetime == Lifetime.SINGLETON:
-            if interface not in self._singletons:
-                self._singletons[interface] = self._create_instance(registration)
-            return self._singletons[interface]  # type: ignore[no-any-return]
+        Raises:
+            CircularDependencyError: If services depend on each other cyclically
+            ScopeRequiredError: If a singleton depends on a scoped service
+        """
+        registrations = self._registrations
+        indegree = dict.fromkeys(registrations, 0)
+        dependents: dict[type, list[type]] = {interface: [] for interface in indegree}
+        for interface, registration in registrations.items():
+            for _, dependency in _registration_deps(registration):
+                if dependency in registrations:
+                    indegree[interface] += 1
+                    dependents[dependency].append(interface)
+
+        ready = deque(interface for interface, count in indegree.items() if not count)
+        order: list[type] = []
+        while ready:
+            interface = ready.popleft()
+            order.append(interface)
+            for dependent in dependents[interface]:
+                indegree[dependent] -= 1
+                if not indegree[dependent]:
+                    ready.append(dependent)
+
+        if len(order) < len(registrations):
+            cycle = sorted(i.__name__ for i, count in indegree.items() if count)
+            raise CircularDependencyError(
+                f"Circular dependency detected among services: {', '.join(cycle)}"
+            )
+        self._cycles_possible = any(
+            registration.factory is not None for registration in registrations.values()
+        )
 
-        # Scoped: return cached for scope or create
-        if registration.lifetime == Lifetime.SCOPED:
-            if scope_id is None:
-                raise ScopeRequiredError(
-                    f"Scope ID required for scoped service {interface.__name__}"
-                )
-            if scope_id not in self._scoped:
-                self._scoped[scope_id] = {}
-            if interface not in self._scoped[scope_id]:
-                self._scoped[scope_id][interface] = self._create_instance(registration)
-            return self._scoped[scope_id][interface]  # type: ignore[no-any-return]
-
-        # Transient: always create new
-        return self._create_instance(registration)  # type: ignore[no-any-return]
+        built = 0
+        for interface in order:
+            registration = registrations[interface]
+            if (
+                registration.lifetime == Lifetime.SINGLETON
+                and interface not in self._singletons
+            ):
+                self._singletons[interface] = self._create_instance(registration, None)
+                built += 1
+        logger.debug(f"DI Container built {built} singletons")
 
     def try_resolve(self, interface: type[T], scope_id: str | None = None) -> T | None:
         """
@@ -262,44 +494,80 @@ class DIContainer:
         Returns:
             The resolved service instance or None
         """
+        # Unregistered is the common miss; answer it without raising
+        registration = self._registrations.get(interface)
+        if registration is None:
+            return None
         try:
-            return self.resolve(interface, scope_id)
+            return registration.strategy.get(  # type: ignore[no-any-return]
+                self, registration, scope_id, self._factory_inflight()
+            )
         except DIContainerError:
             return None
 
-    def _create_instance(self, registration: Registration) -> Any:
-        """Create instance with auto-wiring."""
-        self._resolving.add(registration.interface)
+    def _factory_inflight(self) -> set[int] | None:
+        """Return the in-flight set handed to a factory of this container."""
+        current = _RESOLVING.get()
+        if current is None or current[0] is not self:
+            return None
+        return current[1]
+
+    def _create_instance(
+        self, registration: Registration, inflight: set[int] | None
+    ) -> Any:
+        """
+        Create instance, tracking it for cycle detection when needed.
+
+        Args:
+            registration: The registration to construct
+            inflight: Registration ids being constructed further up this
+                resolution (DFS "gray" set), or None at the top level
+        """
+        if not self._cycles_possible:
+            return self._construct(registration, None)
+
+        # Only construction can recurse, so cached instances skip this check
+        if inflight is None:
+            inflight = set()
+        if registration.id in inflight:
+            raise CircularDependencyError(
+                "Circular dependency detected while resolving "
+                f"{registration.interface.__name__}"
+            )
+
+        inflight.add(registration.id)
         try:
-            # Use factory if provided
-            if registration.factory is not None:
+            return self._construct(registration, inflight)
+        finally:
+            inflight.discard(registration.id)
+
+    def _construct(self, registration: Registration, inflight: set[int] | None) -> Any:
+        """Create instance with auto-wiring."""
+        # Use factory if provided. Factories re-enter through the public
+        # resolve(), so the in-flight set is handed over via the ContextVar.
+        if registration.factory is not None:
+            token = _RESOLVING.set(None if inflight is None else (self, inflight))
+            try:
                 return registration.factory()
+            finally:
+                _RESOLVING.reset(token)
 
-            impl = registration.implementation
+        impl = registration.implementation
 
-            # Get constructor type hints for auto-wiring
-            try:
-                hints = get_type_hints(impl.__init__)  # type: ignore[misc]
-            except Exception:
-                hints = {}
-
-            # Auto-resolve dependencies
-            kwargs: dict[str, Any] = {}
-            for param_name, param_type in hints.items():
-                if param_name == "return":
-                    continue
-                if param_type in self._registrations:
-                    kwargs[param_name] = self.resolve(param_type)
-
-            # Add config if specified
-            if registration.config_key:
-                config_value = self._get_nested_config(registration.config_key)
-                if config_value:
-                    kwargs["config"] = config_value
-
-            return impl(**kwargs)
-        finally:
-            self._resolving.discard(registration.interface)
+        # Auto-resolve dependencies analyzed at registration (or, for forward
+        # references, at first construction)
+        kwargs: dict[str, Any] = {}
+        for param_name, param_type in _registration_deps(registration):
+            if param_type in self._registrations:
+                kwargs[param_name] = self._resolve(param_type, None, inflight)
+
+        # Add config if specified
+        if registration.config_path:
+            config_value = self._lookup_config(registration.config_path)
+            if config_value:
+                kwargs["config"] = config_value
+
+        return impl(**kwargs)
 
     def _get_nested_config(self, key: str) -> Any:
         """
@@ -311,12 +579,29 @@ class DIContainer:
         Returns:
             The config value or empty dict if not found
         """
-        value = self._config
-        for part in key.split("."):
+        return self._lookup_config(tuple(key.split(".")))
+
+    def _lookup_config(self, path: tuple[str, ...]) -> Any:
+        """
+        Get nested config value by pre-split path, cached until configure().
+
+        Args:
+            path: Config path segments (e.g., ("plugins", "loader"))
+
+        Returns:
+            The config value or empty dict if not found
+        """
+        if path in self._config_cache:
+            return self._config_cache[path]
+
+        value: Any = self._config
+        for part in path:
             if isinstance(value, dict):
                 value = value.get(part, {})
             else:
-                return {}
+                value = {}
+                break
+        self._config_cache[path] = value
         return value
 
     def create_scope(self, scope_id: str) -> "DIScope":
@@ -340,18 +625,19 @@ class DIContainer:
         """
         if scope_id in self._scoped:
             # Call dispose on disposable services
-            for instance in self._scoped[scope_id].values():
-                if hasattr(instance, "dispose"):
-                    try:
-                        instance.dispose()
-                    except Exception as e:
-                        logger.warning(f"Error disposing service: {e}")
+            for instance in self._scoped[scope_id].disposables:
+                try:
+                    instance.dispose()
+                except Exception as e:
+                    logger.warning(f"Error disposing service: {e}")
             del self._scoped[scope_id]
             logger.debug(f"Disposed scope: {scope_id}")
 
-    def _register_from_config(self, service_name: str, config: dict[str, Any]) -> None:
+    def _descriptor_from_config(
+        self, service_name: str, config: dict[str, Any]
+    ) -> tuple[type, ServiceDescriptor] | None:
         """
-        Register service from YAML config.
+        Build a service registration from YAML config.
 
         Args:
             service_name: The service interface name
@@ -359,6 +645,9 @@ class DIContainer:
                 - implementation: string name of the implementation class
                 - lifetime: "singleton" | "transient" | "scoped"
                 - config_key: optional config key for injecting configuration
+
+        Returns:
+            The interface and its descriptor, or None if a type is unknown
         """
         from sage.core.di.registry import get_registry, register_default_types
 
@@ -371,14 +660,14 @@ class DIContainer:
         interface = registry.resolve(service_name)
         if interface is None:
             logger.warning(f"Unknown interface type: {service_name}")
-            return
+            return None
 
         # Resolve the implementation type
         impl_name = config.get("implementation", service_name)
         implementation = registry.resolve(impl_name)
         if implementation is None:
             logger.warning(f"Unknown implementation type: {impl_name}")
-            return
+            return None
 
         # Parse lifetime
         lifetime_str = config.get("lifetime", "singleton").lower()
@@ -392,23 +681,23 @@ class DIContainer:
         # Get optional config key
         config_key = config.get("config_key")
 
-        # Register the service
-        self.register(
-            interface=interface,
+        logger.info(
+            f"Registered from config: {service_name} -> {impl_name} ({lifetime.value})"
+        )
+        return interface, ServiceDescriptor(
             implementation=implementation,
             lifetime=lifetime,
             config_key=config_key,
         )
-        logger.info(
-            f"Registered from config: {service_name} -> {impl_name} ({lifetime.value})"
-        )
 
     def clear(self) -> None:
         """Clear all registrations and cached instances."""
         self._registrations.clear()
+        self._cycles_possible = True
         self._singletons.clear()
         self._scoped.clear()
         self._config.clear()
+        self._config_cache.clear()
         logger.debug("DI Container cleared")
 
     def get_registrations(self) -> dict[type, Registration]:
@@ -416,6 +705,87 @@ class DIContainer:
         return self._registrations.copy()
 
 
+class _LifetimeStrategy:
+    """Stateless policy for obtaining an instance of one lifetime."""
+
+    def get(
+        self,
+        container: DIContainer,
+        registration: Registration,
+        scope_id: str | None,
+        inflight: set[int] | None,
+    ) -> Any:
+        """Return an instance for the registration."""
+        raise NotImplementedError
+
+
+class _SingletonStrategy(_LifetimeStrategy):
+    """Return cached or create once."""
+
+    def get(
+        self,
+        container: DIContainer,
+        registration: Registration,
+        scope_id: str | None,
+        inflight: set[int] | None,
+    ) -> Any:
+        singletons = container._singletons
+        interface = registration.interface
+        if interface not in singletons:
+            singletons[interface] = container._create_instance(registration, inflight)
+        return singletons[interface]
+
+
+class _ScopedStrategy(_LifetimeStrategy):
+    """Return cached for scope or create."""
+
+    def get(
+        self,
+        container: DIContainer,
+        registration: Registration,
+        scope_id: str | None,
+        inflight: set[int] | None,
+    ) -> Any:
+        interface = registration.interface
+        if scope_id is None:
+            raise ScopeRequiredError(
+                f"Scope ID required for scoped service {interface.__name__}"
+            )
+        instances = container._scoped.get(scope_id)
+        if instances is None:
+            instances = container._scoped[scope_id] = _ScopeInstances()
+        instance = instances.get(interface)
+        if instance is None:
+            instance = container._create_instance(registration, inflight)
+            instances.add(interface, instance)
+        return instance
+
+
+class _TransientStrategy(_LifetimeStrategy):
+    """Always create new."""
+
+    def get(
+        self,
+        container: DIContainer,
+        registration: Registration,
+        scope_id: str | None,
+        inflight: set[int] | None,
+    ) -> Any:
+        return container._create_instance(registration, inflight)
+
+
+# Shared by every registration of the same lifetime
+_SINGLETON_STRATEGY = _SingletonStrategy()
+_SCOPED_STRATEGY = _ScopedStrategy()
+_TRANSIENT_STRATEGY = _TransientStrategy()
+
+_STRATEGIES: dict[Lifetime, _LifetimeStrategy] = {
+    Lifetime.SINGLETON: _SINGLETON_STRATEGY,
+    Lifetime.SCOPED: _SCOPED_STRATEGY,
+    Lifetime.TRANSIENT: _TRANSIENT_STRATEGY,
+}
+
+
 class DIScope:
     """
     Context manager for scoped service lifetime.
@@ -425,6 +795,8 @@ class DIScope:
         ...     service = scope.resolve(MyService)
     """
 
+    __slots__ = ("_container", "_scope_id")
+
     def __init__(self, container: DIContainer, scope_id: str) -> None:
         self._container = container
         self._scope_id = scope_id
@@ -447,4 +819,5 @@ class DIScope:
 
 def get_container() -> DIContainer:
     """Get the global DI container instance."""
-    return DIContainer.get_instance()
+    # Read the attribute directly once created; the locked path runs only once
+    return DIContainer._instance or DIContainer.get_instance()
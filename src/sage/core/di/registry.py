@@ -7,8 +7,10 @@ to actual Python types, enabling YAML-driven dependency injection.
 Version: 0.1.0
 """
 
+import functools
 import importlib
 import logging
+import sys
 from collections.abc import Callable
 from typing import Any, Optional, TypeVar
 
@@ -16,6 +18,58 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Tags for TypeRegistry entries
+_TYPE = 0
+_FACTORY = 1
+_LAZY = 2  # Dotted path imported on first resolve
+
+# Built-in types referenceable from YAML, as (name, dotted path)
+_DEFAULTS: tuple[tuple[str, str], ...] = (
+    # Core types - Loader
+    ("KnowledgeLoader", "sage.core.loader.KnowledgeLoader"),
+    ("TimeoutLoader", "sage.core.loader.KnowledgeLoader"),  # Alias for YAML config
+    # Core types - Protocols (interfaces)
+    ("SourceProtocol", "sage.core.protocols.SourceProtocol"),
+    ("AnalyzeProtocol", "sage.core.protocols.AnalyzeProtocol"),
+    ("GenerateProtocol", "sage.core.protocols.GenerateProtocol"),
+    ("EvolveProtocol", "sage.core.protocols.EvolveProtocol"),
+    # Event types
+    ("EventBus", "sage.core.events.EventBus"),
+    ("AsyncEventBus", "sage.core.events.EventBus"),  # Alias
+    # Memory types
+    ("MemoryStore", "sage.core.memory.MemoryStore"),
+    ("TokenBudget", "sage.core.memory.TokenBudget"),
+    ("SessionContinuity", "sage.core.memory.SessionContinuity"),
+    # Capability types
+    ("ContentAnalyzer", "sage.capabilities.ContentAnalyzer"),
+    ("QualityAnalyzer", "sage.capabilities.QualityAnalyzer"),
+    ("StructureChecker", "sage.capabilities.StructureChecker"),
+    ("LinkChecker", "sage.capabilities.LinkChecker"),
+    ("HealthMonitor", "sage.capabilities.HealthMonitor"),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_dotted(full_path: str) -> type:
+    """
+    Import a type from a fully qualified path, memoized per path.
+
+    Already-loaded modules are taken from sys.modules without going through
+    the import machinery. Failures raise and are therefore not cached.
+
+    Args:
+        full_path: Full module path (e.g., "sage.core.loader.TimeoutLoader")
+
+    Returns:
+        The imported type
+    """
+    module_path, _, class_name = full_path.rpartition(".")
+    if not module_path or not class_name:
+        raise ImportError(f"Invalid import path: {full_path}")
+
+    module = sys.modules.get(module_path) or importlib.import_module(module_path)
+    return getattr(module, class_name)  # type: ignore[no-any-return]
+
 
 class TypeRegistry:
     """
@@ -32,8 +86,10 @@ class TypeRegistry:
     _instance: Optional["TypeRegistry"] = None
 
     def __init__(self) -> None:
-        self._types: dict[str, type] = {}
-        self._factories: dict[str, Callable[..., Any]] = {}
+        # name -> (_TYPE | _FACTORY | _LAZY, value): one lookup serves every
+        # kind. Names are interned on registration (ones read from YAML would
+        # not be otherwise) so lookups with literal names match by identity.
+        self._entries: dict[str, tuple[int, Any]] = {}
 
     @classmethod
     def get_instance(cls) -> "TypeRegistry":
@@ -55,23 +111,33 @@ class TypeRegistry:
             name: The string name to register
             type_or_factory: The type class or factory function
         """
+        # Decide the kind once; register_type/register_factory own the storage
         if callable(type_or_factory) and not isinstance(type_or_factory, type):
-            self._factories[name] = type_or_factory
-            logger.debug(f"Registered factory: {name}")
+            self.register_factory(name, type_or_factory)
         else:
-            self._types[name] = type_or_factory
-            logger.debug(f"Registered type: {name} -> {type_or_factory}")
+            self.register_type(name, type_or_factory)
 
     def register_type(self, name: str, type_cls: type[T]) -> None:
         """Register a type by name."""
-        self._types[name] = type_cls
+        self._entries[sys.intern(name)] = (_TYPE, type_cls)
         logger.debug(f"Registered type: {name} -> {type_cls}")
 
     def register_factory(self, name: str, factory: Callable[..., Any]) -> None:
         """Register a factory function by name."""
-        self._factories[name] = factory
+        self._entries[sys.intern(name)] = (_FACTORY, factory)
         logger.debug(f"Registered factory: {name}")
 
+    def register_type_lazy(self, name: str, full_path: str) -> None:
+        """
+        Register a type by dotted path, importing it on first resolve.
+
+        Args:
+            name: The string name to register
+            full_path: Full module path (e.g., "sage.core.loader.KnowledgeLoader")
+        """
+        self._entries[sys.intern(name)] = (_LAZY, full_path)
+        logger.debug(f"Registered lazy type: {name} -> {full_path}")
+
     def resolve(self, name: str) -> type | None:
         """
         Resolve a type by name.
@@ -85,8 +151,13 @@ class TypeRegistry:
             The resolved type or None if not found
         """
         # Check explicit registration first
-        if name in self._types:
-            return self._types[name]
+        entry = self._entries.get(name)
+        if entry is not None:
+            tag, value = entry
+            if tag == _TYPE:
+                return value  # type: ignore[no-any-return]
+            if tag == _LAZY:
+                return self._load_lazy(name, value)
 
         # Try dynamic import (e.g., "sage.core.loader.TimeoutLoader")
         if "." in name:
@@ -100,7 +171,10 @@ class TypeRegistry:
 
     def resolve_factory(self, name: str) -> Callable[..., Any] | None:
         """Resolve a factory by name."""
-        return self._factories.get(name)
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == _FACTORY:
+            return entry[1]  # type: ignore[no-any-return]
+        return None
 
     def _import_type(self, full_path: str) -> type:
         """
@@ -112,35 +186,51 @@ class TypeRegistry:
         Returns:
             The imported type
         """
-        parts = full_path.rsplit(".", 1)
-        if len(parts) != 2:
-            raise ImportError(f"Invalid import path: {full_path}")
-
-        module_path, class_name = parts
-        module = importlib.import_module(module_path)
-        return getattr(module, class_name)  # type: ignore[no-any-return]
+        return _resolve_dotted(full_path)
+
+    def _load_lazy(self, name: str, full_path: str) -> type | None:
+        """Import a lazily registered type and keep the result."""
+        try:
+            type_cls = self._import_type(full_path)
+        except (ImportError, AttributeError) as e:
+            logger.warning(f"Failed to import {full_path} for {name}: {e}")
+            return None
+        self._entries[name] = (_TYPE, type_cls)
+        return type_cls
 
     def is_registered(self, name: str) -> bool:
         """Check if a name is registered."""
-        return name in self._types or name in self._factories
+        return name in self._entries
 
     def clear(self) -> None:
         """Clear all registrations."""
-        self._types.clear()
-        self._factories.clear()
+        self._entries.clear()
 
     def get_all_types(self) -> dict[str, type]:
-        """Get all registered types."""
-        return self._types.copy()
+        """Get all registered types, importing any still registered lazily."""
+        types: dict[str, type] = {}
+        for name, (tag, value) in list(self._entries.items()):
+            if tag == _LAZY:
+                value = self._load_lazy(name, value)
+                if value is None:
+                    continue
+            elif tag != _TYPE:
+                continue
+            types[name] = value
+        return types
 
     def get_all_factories(self) -> dict[str, Callable[..., Any]]:
         """Get all registered factories."""
-        return self._factories.copy()
+        return {
+            name: value
+            for name, (tag, value) in self._entries.items()
+            if tag == _FACTORY
+        }
 
 
 def get_registry() -> TypeRegistry:
     """Get the global type registry instance."""
-    return TypeRegistry.get_instance()
+    return TypeRegistry._instance or TypeRegistry.get_instance()
 
 
 def register_default_types(registry: TypeRegistry | None = None) -> None:
@@ -156,66 +246,8 @@ def register_default_types(registry: TypeRegistry | None = None) -> None:
     if registry is None:
         registry = get_registry()
 
-    # Core types - Loader
-    try:
-        from sage.core.loader import KnowledgeLoader
-
-        registry.register("KnowledgeLoader", KnowledgeLoader)
-        registry.register("TimeoutLoader", KnowledgeLoader)  # Alias for YAML config
-    except ImportError:
-        pass
+    # Imports are deferred until a type is first resolved
+    for name, full_path in _DEFAULTS:
+        registry.register_type_lazy(name, full_path)
 
-    # Core types - Protocols (interfaces)
-    try:
-        from sage.core.protocols import (
-            AnalyzeProtocol,
-            EvolveProtocol,
-            GenerateProtocol,
-            SourceProtocol,
-        )
-
-        registry.register("SourceProtocol", SourceProtocol)
-        registry.register("AnalyzeProtocol", AnalyzeProtocol)
-        registry.register("GenerateProtocol", GenerateProtocol)
-        registry.register("EvolveProtocol", EvolveProtocol)
-    except ImportError:
-        pass
-
-    # Event types
-    try:
-        from sage.core.events import EventBus
-
-        registry.register("EventBus", EventBus)
-        registry.register("AsyncEventBus", EventBus)  # Alias
-    except ImportError:
-        pass
-
-    # Memory types
-    try:
-        from sage.core.memory import MemoryStore, SessionContinuity, TokenBudget
-
-        registry.register("MemoryStore", MemoryStore)
-        registry.register("TokenBudget", TokenBudget)
-        registry.register("SessionContinuity", SessionContinuity)
-    except ImportError:
-        pass
-
-    # Capability types
-    try:
-        from sage.capabilities import (
-            ContentAnalyzer,
-            HealthMonitor,
-            LinkChecker,
-            QualityAnalyzer,
-            StructureChecker,
-        )
-
-        registry.register("ContentAnalyzer", ContentAnalyzer)
-        registry.register("QualityAnalyzer", QualityAnalyzer)
-        registry.register("StructureChecker", StructureChecker)
-        registry.register("LinkChecker", LinkChecker)
-        registry.register("HealthMonitor", HealthMonitor)
-    except ImportError:
-        pass
-
-    logger.debug(f"Registered {len(registry._types)} default types")
+    logger.debug(f"Registered {len(_DEFAULTS)} default types")
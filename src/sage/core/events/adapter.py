@@ -9,10 +9,12 @@ Version: 0.1.0
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import inspect
 import logging
+import weakref
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from sage.core.events.bus import EventBus, get_event_bus
 from sage.core.events.events import (
@@ -36,6 +38,22 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# Event subclass for each event type namespace ("loader.*" -> LoadEvent, ...)
+_EVENT_CLASS_BY_NAMESPACE: dict[str, type[Event]] = {
+    "loader": LoadEvent,
+    "timeout": TimeoutEvent,
+    "search": SearchEvent,
+    "plugin": PluginEvent,
+    "system": SystemEvent,
+}
+
+# Constructor fields each subclass adds to Event, taken from the data dict
+_EVENT_FIELDS: dict[type[Event], frozenset[str]] = {
+    cls: frozenset(f.name for f in dataclasses.fields(cls) if f.init)
+    - {f.name for f in dataclasses.fields(Event)}
+    for cls in _EVENT_CLASS_BY_NAMESPACE.values()
+}
+
 
 class PluginAdapter:
     """Adapter that wraps legacy plugins to work with EventBus.
@@ -74,6 +92,16 @@ class PluginAdapter:
         EventType.SYSTEM_HEALTH_CHECK.value: "on_health_check",
     }
 
+    # Per adapter class: plugin class -> (event type, method name) pairs the
+    # class defines as methods, plus pairs only an instance lookup can settle
+    # (properties, __slots__ members, __getattr__), so register() scans each
+    # plugin class only once
+    _method_scans: ClassVar[
+        weakref.WeakKeyDictionary[
+            type, tuple[tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]]
+        ]
+    ]
+
     def __init__(
         self,
         plugin: PluginBase | Any,
@@ -125,21 +153,20 @@ class PluginAdapter:
 
         handlers_registered = 0
 
-        for event_type, method_name in self.EVENT_METHOD_MAP.items():
-            if hasattr(self._plugin, method_name):
-                method = getattr(self._plugin, method_name)
-                if callable(method):
-                    handler = self._create_handler(method)
-                    sub_id = self._event_bus.subscribe(
-                        event_type,
-                        handler,
-                        priority=self._priority,
-                    )
-                    self._subscription_ids.append(sub_id)
-                    handlers_registered += 1
-                    logger.debug(
-                        f"Registered {self.plugin_name}.{method_name} for {event_type}"
-                    )
+        for event_type, method_name in self._handler_methods():
+            method = getattr(self._plugin, method_name)
+            if callable(method):
+                handler = self._create_handler(method)
+                sub_id = self._event_bus.subscribe(
+                    event_type,
+                    handler,
+                    priority=self._priority,
+                )
+                self._subscription_ids.append(sub_id)
+                handlers_registered += 1
+                logger.debug(
+                    f"Registered {self.plugin_name}.{method_name} for {event_type}"
+                )
 
         # Also check for generic "on_event" handler
         if hasattr(self._plugin, "on_event"):
@@ -162,6 +189,66 @@ class PluginAdapter:
 
         return handlers_registered
 
+    def _handler_methods(self) -> list[tuple[str, str]]:
+        """Find the legacy handler methods the plugin provides.
+
+        The scan of the plugin's class is cached per class. Names the class
+        defines as methods are taken from the cache; names it provides some
+        other way (a property, a ``__slots__`` member, ``__getattr__``) and
+        handlers set on the instance itself are checked on every call.
+
+        Returns:
+            (event type, method name) pairs in EVENT_METHOD_MAP order.
+        """
+        cls = type(self)
+        scans = cls.__dict__.get("_method_scans")
+        if scans is None:
+            scans = weakref.WeakKeyDictionary()
+            cls._method_scans = scans
+
+        plugin_cls = type(self._plugin)
+        scan = scans.get(plugin_cls)
+        if scan is None:
+            scan = self._scan_plugin_class(plugin_cls)
+            scans[plugin_cls] = scan
+        found, dynamic = scan
+
+        own = getattr(self._plugin, "__dict__", None)
+        if own and own.keys().isdisjoint(self.EVENT_METHOD_MAP.values()):
+            own = None
+        if not own and not dynamic:
+            return list(found)
+        return [
+            (event_type, method_name)
+            for event_type, method_name in self.EVENT_METHOD_MAP.items()
+            if (event_type, method_name) in found
+            or (own is not None and method_name in own)
+            or (
+                (event_type, method_name) in dynamic
+                and callable(getattr(self._plugin, method_name, None))
+            )
+        ]
+
+    def _scan_plugin_class(
+        self, plugin_cls: type
+    ) -> tuple[tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]]:
+        """Split EVENT_METHOD_MAP by what plugin_cls alone tells us.
+
+        Returns:
+            Pairs the class defines as methods, and pairs whose handler can
+            only be found by looking the name up on an instance.
+        """
+        has_getattr = hasattr(plugin_cls, "__getattr__")
+        found: list[tuple[str, str]] = []
+        dynamic: list[tuple[str, str]] = []
+        for pair in self.EVENT_METHOD_MAP.items():
+            attr = getattr(plugin_cls, pair[1], None)
+            if inspect.isroutine(attr):
+                found.append(pair)
+            elif attr is not None or has_getattr:
+                dynamic.append(pair)
+        return tuple(found), tuple(dynamic)
+
     def unregister(self) -> int:
         """Unregister the plugin from the event bus.
 
@@ -267,53 +354,16 @@ def create_event_from_dict(
         event_type.value if isinstance(event_type, EventType) else event_type
     )
 
-    # Determine the appropriate Event subclass
-    if event_type_str.startswith("loader."):
-        return LoadEvent(
-            event_type=event_type,
-            source=source,
-            layer=data.get("layer", ""),
-            file_count=data.get("file_count", 0),
-            duration_ms=data.get("duration_ms", 0.0),
-        )
-    elif event_type_str.startswith("timeout."):
-        return TimeoutEvent(
-            event_type=event_type,
-            source=source,
-            operation=data.get("operation", ""),
-            timeout_level=data.get("timeout_level", "T2"),
-            elapsed_ms=data.get("elapsed_ms", 0.0),
-            limit_ms=data.get("limit_ms", 500.0),
-        )
-    elif event_type_str.startswith("search."):
-        return SearchEvent(
-            event_type=event_type,
-            source=source,
-            query=data.get("query", ""),
-            results_count=data.get("results_count", 0),
-            layers_searched=data.get("layers_searched", []),
-            duration_ms=data.get("duration_ms", 0.0),
-        )
-    elif event_type_str.startswith("plugin."):
-        return PluginEvent(
-            event_type=event_type,
-            source=source,
-            plugin_name=data.get("plugin_name", ""),
-            plugin_version=data.get("plugin_version", "0.0.0"),
-            action=data.get("action", ""),
-        )
-    elif event_type_str.startswith("system."):
-        return SystemEvent(
-            event_type=event_type,
-            source=source,
-            component=data.get("component", ""),
-            status=data.get("status", ""),
-            message=data.get("message", ""),
-        )
-    else:
+    # Pick the Event subclass from the event type's namespace
+    namespace, dot, _ = event_type_str.partition(".")
+    event_cls = _EVENT_CLASS_BY_NAMESPACE.get(namespace) if dot else None
+    if event_cls is None:
         # Generic event for unknown types
-        return Event(
-            event_type=event_type,
-            source=source,
-            data=data,
-        )
+        return Event(event_type=event_type, source=source, data=data)
+
+    own_fields = _EVENT_FIELDS[event_cls]
+    return event_cls(
+        event_type=event_type,
+        source=source,
+        **{name: value for name, value in data.items() if name in own_fields},
+    )
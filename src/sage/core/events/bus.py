@@ -5,6 +5,7 @@ This module provides an async event bus with support for:
 - Wildcard event matching
 - Priority-based handler ordering
 - Per-handler timeout protection
+- Fire-and-forget publishing through a background dispatcher
 
 Version: 0.1.0
 """
@@ -12,12 +13,17 @@ Version: 0.1.0
 from __future__ import annotations
 
 import asyncio
+import bisect
 import fnmatch
+import heapq
+import itertools
 import logging
-from collections import defaultdict
-from collections.abc import Callable, Coroutine
+import re
+import sys
+from collections import defaultdict, deque
+from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, cast
 
 from sage.core.events.events import Event, EventType
 
@@ -33,8 +39,17 @@ logger = logging.getLogger(__name__)
 # Type alias for async event handlers
 AsyncHandler = Callable[[Event], Coroutine[Any, Any, None]]
 
+# Characters that make a pattern segment a glob rather than a literal
+_GLOB_CHARS = frozenset("*?[")
 
-@dataclass
+# Bound on remembered event types (matches or misses) before a cache is reset
+_MAX_CACHED_TYPES = 1024
+
+# Source of generated subscription IDs; next() on a count is atomic
+_subscription_ids = itertools.count(1)
+
+
+@dataclass(slots=True)
 class Subscription:
     """Represents a subscription to an event type.
 
@@ -42,23 +57,34 @@ class Subscription:
         event_pattern: The event type or wildcard pattern to match.
         handler: The async function to call when the event matches.
         priority: Handler priority (lower = earlier execution).
-        timeout_ms: Per-handler timeout in milliseconds.
+        timeout_ms: Per-handler timeout in milliseconds. None trusts the
+            handler to finish and awaits it without a timeout.
         subscription_id: Unique identifier for this subscription.
     """
 
     event_pattern: str
     handler: AsyncHandler
     priority: int = 100
-    timeout_ms: float = 5000.0
+    timeout_ms: float | None = 5000.0
     subscription_id: str = field(default_factory=lambda: "")
 
-    _id_counter: int = field(default=0, init=False, repr=False)
+    # None matches everything ("*"); a str must equal the event type
+    _matcher: str | re.Pattern[str] | None = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        """Generate unique subscription ID if not provided."""
+        """Generate unique subscription ID if not provided, compile the pattern."""
         if not self.subscription_id:
-            Subscription._id_counter += 1
-            self.subscription_id = f"sub_{Subscription._id_counter}"
+            self.subscription_id = f"sub_{next(_subscription_ids)}"
+
+        # Resolve the pattern once: match-all, literal, or compiled glob
+        if self.event_pattern == "*":
+            self._matcher = None
+        elif _GLOB_CHARS.isdisjoint(self.event_pattern):
+            self._matcher = self.event_pattern
+        else:
+            self._matcher = re.compile(fnmatch.translate(self.event_pattern))
 
     def matches(self, event_type: str) -> bool:
         """Check if this subscription matches the given event type.
@@ -74,7 +100,33 @@ class Subscription:
         Returns:
             True if the pattern matches the event type.
         """
-        return fnmatch.fnmatch(event_type, self.event_pattern)
+        matcher = self._matcher
+        if matcher is None:
+            return True
+        if isinstance(matcher, str):
+            return event_type == matcher
+        return matcher.match(event_type) is not None
+
+
+def _priority(subscription: Subscription) -> int:
+    """Sort key for subscription lists."""
+    return subscription.priority
+
+
+class _TopicNode:
+    """One dotted segment in the EventBus subscription index.
+
+    ``exact`` holds subscriptions whose pattern is exactly the path to this
+    node; ``prefix`` holds those whose pattern is that path followed by
+    ``.*`` (which, as with fnmatch, matches any deeper event type).
+    """
+
+    __slots__ = ("children", "exact", "prefix")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TopicNode] = {}
+        self.exact: list[Subscription] = []
+        self.prefix: list[Subscription] = []
 
 
 class EventBus:
@@ -103,21 +155,43 @@ class EventBus:
 
     def __init__(
         self,
-        default_timeout_ms: float = 5000.0,
+        default_timeout_ms: float | None = 5000.0,
         error_handler: Callable[[Exception, Event, Subscription], None] | None = None,
     ) -> None:
         """Initialize the EventBus.
 
         Args:
-            default_timeout_ms: Default timeout for handlers in milliseconds.
+            default_timeout_ms: Default timeout for handlers in milliseconds,
+                or None to run handlers without one unless they set their own.
             error_handler: Optional callback for handler errors.
         """
         self._subscriptions: dict[str, list[Subscription]] = defaultdict(list)
         self._all_subscriptions: list[Subscription] = []
+        # Segment trie so publish() only visits subscriptions on its path;
+        # "*" and patterns the trie cannot express are kept alongside it
+        self._index = _TopicNode()
+        self._match_all: list[Subscription] = []
+        self._globs: list[Subscription] = []
+        # Compiled glob patterns, parallel to _globs, so publish() scans a
+        # flat column of regexes and only touches the subscriptions that hit
+        self._glob_matchers: list[re.Pattern[str]] = []
+        # Event types known to have no subscribers; any subscribe() may add
+        # interest, so it clears the set (unsubscribing only removes interest)
+        self._no_interest: set[str] = set()
+        # Match results per event type for a stable subscription set; any
+        # subscribe() or unsubscribe() invalidates them
+        self._match_cache: dict[str, tuple[Subscription, ...]] = {}
+        # Subscription order, to break priority ties the way a stable sort would
+        self._order: dict[str, int] = {}
+        self._counter = itertools.count()
         self._default_timeout_ms = default_timeout_ms
         self._error_handler = error_handler or self._default_error_handler
-        self._is_publishing = False
-        self._pending_unsubscribes: list[str] = []
+        # publish_nowait() queue, drained by a dispatcher task started on
+        # first use in the running loop
+        self._queue: deque[tuple[Event, str, tuple[Subscription, ...]]] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._idle: asyncio.Event | None = None
+        self._dispatcher_task: asyncio.Task[None] | None = None
 
     def subscribe(
         self,
@@ -143,7 +217,8 @@ class EventBus:
             >>> bus.subscribe("loader.*", handle_all_loader, priority=50)
             >>> bus.subscribe("*", log_all_events, priority=1000)
         """
-        pattern = (
+        # Interned so pattern keys compare by identity on lookup
+        pattern = sys.intern(
             event_pattern.value
             if isinstance(event_pattern, EventType)
             else event_pattern
@@ -157,10 +232,22 @@ class EventBus:
         )
 
         self._subscriptions[pattern].append(subscription)
-        self._all_subscriptions.append(subscription)
-
-        # Sort by priority (lower = earlier)
-        self._all_subscriptions.sort(key=lambda s: s.priority)
+        self._no_interest.clear()
+        self._match_cache.clear()
+        self._order[subscription.subscription_id] = next(self._counter)
+
+        # Keep lists sorted by priority (lower = earlier); inserting to the
+        # right of equal priorities preserves subscription order
+        bisect.insort(self._all_subscriptions, subscription, key=_priority)
+        bucket = self._bucket(pattern)
+        position = bisect.bisect_right(bucket, priority, key=_priority)
+        bucket.insert(position, subscription)
+        if bucket is self._globs:
+            # Only patterns with glob characters land here, so the
+            # subscription has already compiled the regex
+            self._glob_matchers.insert(
+                position, cast(re.Pattern[str], subscription._matcher)
+            )
 
         logger.debug(
             f"Subscribed to '{pattern}' with priority {priority}, "
@@ -172,23 +259,34 @@ class EventBus:
     def unsubscribe(self, subscription_id: str) -> bool:
         """Unsubscribe a handler by subscription ID.
 
+        Safe to call from a handler: a publish in flight works from its own
+        immutable snapshot of matching subscriptions, so the index can be
+        changed under it without deferring.
+
         Args:
             subscription_id: The ID returned from subscribe().
 
         Returns:
             True if the subscription was found and removed.
         """
-        if self._is_publishing:
-            # Defer unsubscribing until publish completes
-            self._pending_unsubscribes.append(subscription_id)
-            return True
-
-        return self._do_unsubscribe(subscription_id)
-
-    def _do_unsubscribe(self, subscription_id: str) -> bool:
-        """Actually perform the unsubscribe operation."""
         found = False
 
+        # Remove from the publish index
+        for subscription in self._all_subscriptions:
+            if subscription.subscription_id == subscription_id:
+                bucket = self._bucket(subscription.event_pattern)
+                keep = [s.subscription_id != subscription_id for s in bucket]
+                bucket[:] = itertools.compress(bucket, keep)
+                if bucket is self._globs:
+                    self._glob_matchers[:] = itertools.compress(
+                        self._glob_matchers, keep
+                    )
+                elif not bucket and bucket is not self._match_all:
+                    # Otherwise emptied trie nodes would pile up in _index
+                    self._prune(subscription.event_pattern)
+        self._order.pop(subscription_id, None)
+        self._match_cache.clear()
+
         # Remove from all_subscriptions
         self._all_subscriptions = [
             s for s in self._all_subscriptions if s.subscription_id != subscription_id
@@ -210,11 +308,112 @@ class EventBus:
 
         return found
 
+    def _bucket(self, pattern: str) -> list[Subscription]:
+        """Return the index list that holds subscriptions for a pattern.
+
+        Args:
+            pattern: The subscription pattern.
+
+        Returns:
+            The list to store the subscription in, adding trie nodes as needed.
+        """
+        if pattern == "*":
+            return self._match_all
+
+        path, is_prefix = (
+            (pattern[:-2], True) if pattern.endswith(".*") else (pattern, False)
+        )
+        if not _GLOB_CHARS.isdisjoint(path):
+            return self._globs
+
+        node = self._index
+        for segment in path.split("."):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[sys.intern(segment)] = _TopicNode()
+            node = child
+        return node.prefix if is_prefix else node.exact
+
+    def _prune(self, pattern: str) -> None:
+        """Drop trie nodes left empty by removing a pattern's last subscription.
+
+        Args:
+            pattern: A pattern indexed in the trie (not "*" or a glob).
+        """
+        path = pattern[:-2] if pattern.endswith(".*") else pattern
+        segments = path.split(".")
+        nodes = [self._index]
+        for segment in segments:
+            nodes.append(nodes[-1].children[segment])
+        for depth in range(len(segments), 0, -1):
+            node = nodes[depth]
+            if node.exact or node.prefix or node.children:
+                break
+            del nodes[depth - 1].children[segments[depth - 1]]
+
+    def _match(self, event_type: str) -> tuple[Subscription, ...]:
+        """Find subscriptions matching an event type, in priority order.
+
+        Results are cached per event type until the subscriptions change,
+        so steady-state publishes skip the index walk entirely.
+
+        Args:
+            event_type: The event type string.
+
+        Returns:
+            Matching subscriptions, equivalent to filtering every
+            subscription with Subscription.matches().
+        """
+        cached = self._match_cache.get(event_type)
+        if cached is not None:
+            return cached
+        if event_type in self._no_interest:
+            return ()
+
+        # Every bucket is already in priority order, so merge instead of sort
+        sources: list[list[Subscription]] = [self._match_all]
+
+        node = self._index
+        segments = event_type.split(".")
+        last = len(segments) - 1
+        for depth, segment in enumerate(segments):
+            child = node.children.get(segment)
+            if child is None:
+                break
+            node = child
+            sources.append(node.exact if depth == last else node.prefix)
+
+        if self._globs:
+            hits = [m.match(event_type) is not None for m in self._glob_matchers]
+            sources.append(list(itertools.compress(self._globs, hits)))
+
+        sources = [source for source in sources if source]
+        if not sources:
+            if len(self._no_interest) >= _MAX_CACHED_TYPES:
+                self._no_interest.clear()
+            self._no_interest.add(event_type)
+            return ()
+
+        if len(sources) == 1:
+            matching = tuple(sources[0])
+        else:
+            order = self._order
+            matching = tuple(
+                heapq.merge(
+                    *sources, key=lambda s: (s.priority, order[s.subscription_id])
+                )
+            )
+        if len(self._match_cache) >= _MAX_CACHED_TYPES:
+            self._match_cache.clear()
+        self._match_cache[event_type] = matching
+        return matching
+
     async def publish(self, event: Event) -> int:
         """Publish an event to all matching subscribers.
 
-        Handlers are called in priority order (lower priority first).
-        Each handler has timeout protection and error isolation.
+        Handlers are called in priority order (lower priority first);
+        handlers sharing a priority run concurrently. Each handler has
+        timeout protection and error isolation.
 
         Args:
             event: The event to publish.
@@ -230,60 +429,249 @@ class EventBus:
             ... ))
             >>> print(f"Notified {count} handlers")
         """
-        event_type = (
-            event.event_type.value
-            if isinstance(event.event_type, EventType)
-            else event.event_type
-        )
+        event_type = self._event_type(event)
 
         # Find matching subscriptions
-        matching = [s for s in self._all_subscriptions if s.matches(event_type)]
+        matching = self._match(event_type)
 
         if not matching:
             logger.debug(f"No subscribers for event: {event_type}")
             return 0
 
+        return await self._dispatch(event, event_type, matching)
+
+    async def publish_batch(self, events: Iterable[Event]) -> int:
+        """Publish a burst of events, matching each distinct event type once.
+
+        The events are dispatched concurrently; within each event, handlers
+        keep the priority ordering, timeouts and error isolation of publish().
+
+        Args:
+            events: The events to publish.
+
+        Returns:
+            Number of handlers called across all events.
+
+        Example:
+            >>> await bus.publish_batch(
+            ...     LoadEvent(event_type=EventType.LOADER_LAYER_LOADED, layer=layer)
+            ...     for layer in ("core", "guidelines")
+            ... )
+        """
+        matches: dict[str, tuple[Subscription, ...]] = {}
+        dispatches = []
+        for event in events:
+            event_type = self._event_type(event)
+            matching = matches.get(event_type)
+            if matching is None:
+                matching = matches[event_type] = self._match(event_type)
+            if matching:
+                dispatches.append(self._dispatch(event, event_type, matching))
+
+        return sum(await asyncio.gather(*dispatches))
+
+    def publish_nowait(self, event: Event) -> int:
+        """Queue an event for the background dispatcher and return at once.
+
+        Subscribers are matched now; their handlers run later on a
+        dispatcher task with the same ordering, timeout and error isolation
+        as publish(). Must be called from a running event loop; await
+        drain() or aclose() before it shuts down, or events still queued
+        are dropped with a warning.
+
+        Args:
+            event: The event to publish.
+
+        Returns:
+            Number of handlers the event was queued for.
+
+        Example:
+            >>> bus.publish_nowait(Event(event_type="search.complete"))
+            >>> await bus.drain()
+        """
+        event_type = self._event_type(event)
+        matching = self._match(event_type)
+        if not matching:
+            logger.debug(f"No subscribers for event: {event_type}")
+            return 0
+
+        wakeup, idle = self._ensure_dispatcher()
+        self._queue.append((event, event_type, matching))
+        idle.clear()
+        wakeup.set()
+        return len(matching)
+
+    async def drain(self) -> None:
+        """Wait until every event queued by publish_nowait() has been handled."""
+        if self._idle is not None and self._queue_is_live():
+            await self._idle.wait()
+
+    async def aclose(self) -> None:
+        """Deliver every queued event, then stop the background dispatcher.
+
+        Call this before the event loop shuts down; otherwise events still
+        queued by publish_nowait() are dropped (with a warning).
+        """
+        task = self._dispatcher_task
+        await self.drain()
+        self._stop_dispatcher()
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            await asyncio.wait([task])
+
+    def _queue_is_live(self) -> bool:
+        """Whether the dispatcher task is running in the current event loop."""
+        task = self._dispatcher_task
+        return (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        )
+
+    def _ensure_dispatcher(self) -> tuple[asyncio.Event, asyncio.Event]:
+        """Start the dispatcher task for the running loop if needed.
+
+        Returns:
+            The wakeup and idle events shared with the dispatcher.
+
+        Raises:
+            RuntimeError: If no event loop is running.
+        """
+        if not self._queue_is_live() or self._wakeup is None or self._idle is None:
+            self._wakeup = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._dispatcher_task = asyncio.get_running_loop().create_task(
+                self._run_dispatcher(self._wakeup, self._idle),
+                name="sage-event-dispatcher",
+            )
+            self._dispatcher_task.add_done_callback(self._dispatcher_done)
+        return self._wakeup, self._idle
+
+    async def _run_dispatcher(self, wakeup: asyncio.Event, idle: asyncio.Event) -> None:
+        """Drain the publish_nowait() queue until cancelled."""
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            while self._queue:
+                event, event_type, matching = self._queue.popleft()
+                try:
+                    await self._dispatch(event, event_type, matching)
+                except Exception:
+                    logger.exception(f"Dispatch failed for event: {event_type}")
+                except asyncio.CancelledError:
+                    logger.warning(
+                        f"Dispatch of {event_type} cancelled before all "
+                        f"handlers ran, event_id={event.event_id}"
+                    )
+                    raise
+            idle.set()
+
+    def _dispatcher_done(self, task: asyncio.Task[None]) -> None:
+        """Report queued events lost when the loop stops the dispatcher."""
+        if task is self._dispatcher_task:
+            self._dispatcher_task = None
+            self._drop_queued("the dispatcher task ended")
+
+    def _drop_queued(self, reason: str) -> None:
+        """Discard queued events, logging how many were lost."""
+        if self._queue:
+            logger.warning(
+                f"Dropped {len(self._queue)} event(s) queued by "
+                f"publish_nowait(): {reason}"
+            )
+            self._queue.clear()
+
+    @staticmethod
+    def _event_type(event: Event) -> str:
+        """Return an event's type as a plain string."""
+        return (
+            event.event_type.value
+            if isinstance(event.event_type, EventType)
+            else event.event_type
+        )
+
+    async def _dispatch(
+        self, event: Event, event_type: str, matching: tuple[Subscription, ...]
+    ) -> int:
+        """Run the handlers of already-matched subscriptions.
+
+        Args:
+            event: The event to deliver.
+            event_type: The event type string, for logging.
+            matching: Matching subscriptions in priority order.
+
+        Returns:
+            Number of handlers called.
+        """
         logger.debug(
             f"Publishing {event_type} to {len(matching)} handlers, "
             f"event_id={event.event_id}"
         )
 
-        self._is_publishing = True
         handlers_called = 0
 
-        try:
-            for subscription in matching:
+        # Priority groups run in order; handlers within a group run
+        # concurrently, so the group takes as long as its slowest handler
+        for _, group in itertools.groupby(matching, key=_priority):
+            batch = tuple(group)
+            if len(batch) == 1:
+                # A lone handler is awaited inline, without a Task per handler
+                # and a gather future per group
                 try:
-                    await self._call_handler_with_timeout(subscription, event)
+                    await self._call_handler_with_timeout(batch[0], event)
+                except Exception as error:
+                    self._handle_failure(error, event_type, event, batch[0])
+                else:
                     handlers_called += 1
-                except TimeoutError:
-                    logger.warning(
-                        f"Handler timeout for {event_type}: "
-                        f"{subscription.subscription_id} "
-                        f"(limit: {subscription.timeout_ms}ms)"
-                    )
-                    self._error_handler(
-                        TimeoutError(
-                            f"Handler exceeded {subscription.timeout_ms}ms timeout"
-                        ),
-                        event,
-                        subscription,
-                    )
-                except Exception as e:
-                    logger.exception(
-                        f"Handler error for {event_type}: "
-                        f"{subscription.subscription_id}: {e}"
-                    )
-                    self._error_handler(e, event, subscription)
-        finally:
-            self._is_publishing = False
-            # Process pending unsubscribes
-            for sub_id in self._pending_unsubscribes:
-                self._do_unsubscribe(sub_id)
-            self._pending_unsubscribes.clear()
+                continue
+
+            outcomes = await asyncio.gather(
+                *(self._call_handler_with_timeout(s, event) for s in batch),
+                return_exceptions=True,
+            )
+            for subscription, outcome in zip(batch, outcomes, strict=True):
+                if outcome is None:
+                    handlers_called += 1
+                elif isinstance(outcome, Exception):
+                    self._handle_failure(outcome, event_type, event, subscription)
+                else:
+                    raise outcome
 
         return handlers_called
 
+    def _handle_failure(
+        self,
+        error: Exception,
+        event_type: str,
+        event: Event,
+        subscription: Subscription,
+    ) -> None:
+        """Log a failed handler and pass the error to the error handler.
+
+        Args:
+            error: The exception the handler raised (or its timeout).
+            event_type: The event type string, for logging.
+            event: The event that was being handled.
+            subscription: The subscription whose handler failed.
+        """
+        if isinstance(error, TimeoutError) and subscription.timeout_ms is not None:
+            logger.warning(
+                f"Handler timeout for {event_type}: "
+                f"{subscription.subscription_id} "
+                f"(limit: {subscription.timeout_ms}ms)"
+            )
+            self._error_handler(
+                TimeoutError(f"Handler exceeded {subscription.timeout_ms}ms timeout"),
+                event,
+                subscription,
+            )
+            return
+
+        logger.error(
+            f"Handler error for {event_type}: {subscription.subscription_id}: {error}",
+            exc_info=error,
+        )
+        self._error_handler(error, event, subscription)
+
     @staticmethod
     async def _call_handler_with_timeout(
         subscription: Subscription, event: Event
@@ -295,8 +683,12 @@ class EventBus:
             event: The event to pass to the handler.
 
         Raises:
-            asyncio.TimeoutError: If handler exceeds timeout.
+            asyncio.TimeoutError: If handler exceeds its timeout, if any.
         """
+        if subscription.timeout_ms is None:
+            # No timer to arm or cancel for handlers that opted out
+            await subscription.handler(event)
+            return
         timeout_seconds = subscription.timeout_ms / 1000.0
         await asyncio.wait_for(subscription.handler(event), timeout=timeout_seconds)
 
@@ -312,11 +704,36 @@ class EventBus:
         )
 
     def clear(self) -> None:
-        """Remove all subscriptions."""
+        """Remove all subscriptions and stop the background dispatcher.
+
+        Events still queued by publish_nowait() are dropped with a warning;
+        await aclose() first to deliver them.
+        """
+        self._stop_dispatcher()
         self._subscriptions.clear()
         self._all_subscriptions.clear()
+        self._index = _TopicNode()
+        self._match_all.clear()
+        self._globs.clear()
+        self._glob_matchers.clear()
+        self._no_interest.clear()
+        self._match_cache.clear()
+        self._order.clear()
         logger.debug("EventBus cleared all subscriptions")
 
+    def _stop_dispatcher(self) -> None:
+        """Cancel the dispatcher task and drop any queued events."""
+        task = self._dispatcher_task
+        self._dispatcher_task = None
+        if task is not None and not task.done() and not task.get_loop().is_closed():
+            task.cancel()
+            # Release drain() callers; what they waited for is now dropped
+            if self._idle is not None:
+                self._idle.set()
+        self._wakeup = None
+        self._idle = None
+        self._drop_queued("the dispatcher was stopped")
+
     @property
     def subscription_count(self) -> int:
         """Get the total number of active subscriptions."""
@@ -359,6 +776,7 @@ def get_event_bus() -> EventBus:
 def reset_event_bus() -> None:
     """Reset the global EventBus instance.
 
+    Clearing the bus also cancels its background dispatcher task.
     Useful for testing to ensure a clean state.
     """
     global _global_event_bus
@@ -8,7 +8,12 @@ Version: 0.1.0
 
 from __future__ import annotations
 
+import dataclasses
+import functools
+import sys
+import types
 import uuid
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -25,6 +30,15 @@ __all__ = [
 ]
 
 
+# Shared read-only default for events created without data or metadata
+_EMPTY_MAPPING: Mapping[str, Any] = types.MappingProxyType({})
+
+
+def _empty_mapping() -> Mapping[str, Any]:
+    """Return the shared empty mapping instead of allocating a dict."""
+    return _EMPTY_MAPPING
+
+
 class EventType(str, Enum):
     """Standard event types with namespacing.
 
@@ -62,8 +76,14 @@ class EventType(str, Enum):
     SYSTEM_SHUTDOWN = "system.shutdown"
     SYSTEM_HEALTH_CHECK = "system.health_check"
 
+    def __new__(cls, value: str) -> EventType:
+        """Create a member whose ``value`` is the interned type string."""
+        member = str.__new__(cls, value)
+        member._value_ = sys.intern(value)
+        return member
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
     """Base event class for all SAGE events.
 
@@ -72,40 +92,72 @@ class Event:
         timestamp: When the event was created (UTC).
         event_id: Unique identifier for this event instance.
         source: The component that generated this event.
-        data: Additional event-specific data.
+        data: Additional event-specific data (read-only when empty).
         metadata: Optional metadata for tracing and debugging.
     """
 
     event_type: EventType | str
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    # partial() calls datetime.now straight from C, without a lambda frame
+    timestamp: datetime = field(default_factory=functools.partial(datetime.now, UTC))
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     source: str = "unknown"
-    data: dict[str, Any] = field(default_factory=dict)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    data: Mapping[str, Any] = field(default_factory=_empty_mapping)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_mapping)
+
+    # timestamp.isoformat(), filled in by the first to_dict() call
+    _iso_timestamp: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        """Validate and normalize event data."""
+        """Validate and normalize event data.
+
+        Subclasses call ``Event.__post_init__(self)`` explicitly: zero-argument
+        super() does not work in methods of slotted dataclasses before 3.14.
+        """
         if isinstance(self.event_type, str) and not isinstance(
             self.event_type, EventType
         ):
-            # Allow custom event types as strings
-            pass
+            # Allow custom event types as strings, interned like the
+            # subscription patterns they are matched against
+            object.__setattr__(self, "event_type", sys.intern(self.event_type))
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert event to dictionary for serialization."""
+        """Convert event to dictionary for serialization.
+
+        The formatted timestamp is cached, so an event serialized once per
+        sink only pays for isoformat() the first time.
+        """
+        timestamp = self._iso_timestamp
+        if timestamp is None:
+            timestamp = self.timestamp.isoformat()
+            object.__setattr__(self, "_iso_timestamp", timestamp)
         return {
             "event_type": (
                 self.event_type.value
                 if isinstance(self.event_type, EventType)
                 else self.event_type
             ),
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": timestamp,
             "event_id": self.event_id,
             "source": self.source,
-            "data": self.data,
-            "metadata": self.metadata,
+            "data": dict(self.data),
+            "metadata": dict(self.metadata),
         }
 
+    def with_data(self, **values: Any) -> Event:
+        """Return a copy of this event with extra data entries.
+
+        Example:
+            >>> event.with_data(retries=2).data["retries"]
+            2
+        """
+        return dataclasses.replace(self, data={**self.data, **values})
+
+    def _merge_data(self, values: Mapping[str, Any]) -> None:
+        """Set data to a new mapping with values added, for __post_init__."""
+        object.__setattr__(self, "data", {**self.data, **values})
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Event:
         """Create an event from a dictionary."""
@@ -125,7 +177,7 @@ class Event:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoadEvent(Event):
     """Event for knowledge loading operations.
 
@@ -141,8 +193,8 @@ class LoadEvent(Event):
 
     def __post_init__(self) -> None:
         """Initialize load event with layer data."""
-        super().__post_init__()
-        self.data.update(
+        Event.__post_init__(self)
+        self._merge_data(
             {
                 "layer": self.layer,
                 "file_count": self.file_count,
@@ -151,7 +203,7 @@ class LoadEvent(Event):
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TimeoutEvent(Event):
     """Event for timeout-related occurrences.
 
@@ -169,8 +221,8 @@ class TimeoutEvent(Event):
 
     def __post_init__(self) -> None:
         """Initialize timeout event with timing data."""
-        super().__post_init__()
-        self.data.update(
+        Event.__post_init__(self)
+        self._merge_data(
             {
                 "operation": self.operation,
                 "timeout_level": self.timeout_level,
@@ -180,7 +232,7 @@ class TimeoutEvent(Event):
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchEvent(Event):
     """Event for search operations.
 
@@ -198,8 +250,8 @@ class SearchEvent(Event):
 
     def __post_init__(self) -> None:
         """Initialize a search event with search data."""
-        super().__post_init__()
-        self.data.update(
+        Event.__post_init__(self)
+        self._merge_data(
             {
                 "query": self.query,
                 "results_count": self.results_count,
@@ -209,7 +261,7 @@ class SearchEvent(Event):
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PluginEvent(Event):
     """Event for plugin lifecycle operations.
 
@@ -225,8 +277,8 @@ class PluginEvent(Event):
 
     def __post_init__(self) -> None:
         """Initialize plugin event with plugin data."""
-        super().__post_init__()
-        self.data.update(
+        Event.__post_init__(self)
+        self._merge_data(
             {
                 "plugin_name": self.plugin_name,
                 "plugin_version": self.plugin_version,
@@ -235,7 +287,7 @@ class PluginEvent(Event):
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemEvent(Event):
     """Event for system-level operations.
 
@@ -251,8 +303,8 @@ class SystemEvent(Event):
 
     def __post_init__(self) -> None:
         """Initialize system event with system data."""
-        super().__post_init__()
-        self.data.update(
+        Event.__post_init__(self)
+        self._merge_data(
             {
                 "component": self.component,
                 "status": self.status,
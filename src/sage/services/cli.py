@@ -24,6 +24,14 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.syntax import Syntax
 from rich.table import Table
 
+# Optional faster event loop (libuv-based; not available on Windows)
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Local imports
 from sage.core.loader import KnowledgeLoader, Layer
 
@@ -146,7 +154,9 @@ def get_loader() -> KnowledgeLoader:
 
 
 def run_async(coro: Any) -> Any:
-    """Run an async coroutine."""
+    """Run an async coroutine, on a uvloop event loop when installed."""
+    if UVLOOP_AVAILABLE:
+        return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
     return asyncio.run(coro)
 
 
@@ -19,6 +19,8 @@ Version: 0.1.0
 """
 
 import asyncio
+import socket
+from collections import Counter
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -223,6 +225,30 @@ def event_loop():
     loop.close()
 
 
+# ============================================================================
+# Network Guard
+# ============================================================================
+
+_LOOPBACK_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+
+@pytest.fixture(autouse=True)
+def _block_network(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail fast on outbound network access instead of waiting on timeouts."""
+    real_connect = socket.socket.connect
+
+    def guarded_connect(sock: socket.socket, address: Any) -> None:
+        if isinstance(address, tuple) and address[0] not in _LOOPBACK_HOSTS:
+            pytest.fail(f"Network access blocked in tests: {address!r}")
+        real_connect(sock, address)
+
+    def blocked_urlopen(*args: Any, **kwargs: Any) -> Any:
+        pytest.fail("Network access blocked in tests: urllib.request.urlopen")
+
+    monkeypatch.setattr(socket.socket, "connect", guarded_connect)
+    monkeypatch.setattr("urllib.request.urlopen", blocked_urlopen)
+
+
 # ============================================================================
 # Marker Registration
 # ============================================================================
@@ -237,3 +263,15 @@ def pytest_configure(config):
         "markers", "benchmark: mark test as a performance benchmark"
     )
     config.addinivalue_line("markers", "slow: mark test as slow running")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Fail collection if a test is collected twice under the same node id."""
+    if config.getoption("keepduplicates", False):
+        return
+    counts = Counter(item.nodeid for item in items)
+    duplicates = sorted(nodeid for nodeid, count in counts.items() if count > 1)
+    if duplicates:
+        raise pytest.UsageError(
+            "Duplicate test node ids collected: " + ", ".join(duplicates)
+        )
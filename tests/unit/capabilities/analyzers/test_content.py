@@ -82,6 +82,13 @@ print("hello")
         assert metrics.header_count > 0
         assert metrics.code_block_count > 0
 
+    def test_analyze_content_total_lines(self) -> None:
+        """Test line counting matches splitting on newlines."""
+        analyzer = ContentAnalyzer()
+        for content in ("", "one", "one\n", "one\ntwo\n\nthree"):
+            metrics = analyzer.analyze_content(content)
+            assert metrics.total_lines == len(content.split("\n"))
+
     def test_analyze_content_with_tables(self) -> None:
         """Test analyzing content with tables."""
         analyzer = ContentAnalyzer()
@@ -106,6 +113,66 @@ print("hello")
             assert metrics is not None
             assert metrics.header_count >= 1
 
+    def test_analyze_file_invalid_utf8(self, tmp_path: Path) -> None:
+        """Test undecodable bytes are replaced instead of raising."""
+        md_file = tmp_path / "broken.md"
+        md_file.write_bytes(b"# Title\n\xff\xfe bad bytes\n")
+        metrics = ContentAnalyzer().analyze_file(md_file)
+        assert metrics.header_count == 1
+        assert metrics.total_lines == 3
+
+    def test_analyze_file_crlf_matches_lf(self, tmp_path: Path) -> None:
+        """Test CRLF files produce the same metrics as LF files."""
+        analyzer = ContentAnalyzer()
+        crlf_file = tmp_path / "crlf.md"
+        crlf_file.write_bytes(b"# Title\r\n\r\n- item\r\n")
+        lf_file = tmp_path / "lf.md"
+        lf_file.write_bytes(b"# Title\n\n- item\n")
+        crlf = analyzer.analyze_file(crlf_file).to_dict()
+        lf = analyzer.analyze_file(lf_file).to_dict()
+        crlf.pop("file_path")
+        lf.pop("file_path")
+        assert crlf == lf
+
+    def test_analyze_file_streaming_matches_buffered(self, tmp_path: Path) -> None:
+        """Test the streaming path reports the same metrics as the buffered one."""
+        analyzer = ContentAnalyzer()
+        content = """# Title
+
+Intro with a [link](a.md) and [another](b.md).
+
+## Section
+
+- item one
+  * nested item
++ item three
+
+| A | B |
+|---|---|
+| 1 | 2 |
+
+```python
+print("hi")
+```
+
+#### Deep header
+No trailing newline"""
+        md_file = tmp_path / "doc.md"
+        md_file.write_text(content)
+        streamed = analyzer.analyze_file_streaming(md_file)
+        buffered = analyzer.analyze_content(content, str(md_file))
+        assert streamed.to_dict() == buffered.to_dict()
+
+    def test_analyze_file_dispatches_large_files(self, tmp_path: Path) -> None:
+        """Test files above the threshold use the streaming analyzer."""
+        analyzer = ContentAnalyzer()
+        analyzer.STREAMING_THRESHOLD = 8
+        md_file = tmp_path / "large.md"
+        md_file.write_text("# Large\n\nBody text.\n")
+        metrics = analyzer.analyze_file(md_file)
+        assert metrics.sections == ["Large"]
+        assert metrics.total_lines == 4
+
     def test_analyze_directory(self) -> None:
         """Test analyzing a directory."""
         analyzer = ContentAnalyzer()
@@ -139,6 +206,16 @@ print("hello")
         suggestions = analyzer.suggest_optimizations(metrics)
         assert isinstance(suggestions, list)
 
+    def test_suggest_optimizations_returns_fresh_list(self) -> None:
+        """Test memoized suggestions are returned as independent lists."""
+        analyzer = ContentAnalyzer()
+        metrics = ContentMetrics(total_lines=200, header_count=1)
+        first = analyzer.suggest_optimizations(metrics)
+        first.append("mutated")
+        second = analyzer.suggest_optimizations(metrics)
+        assert "mutated" not in second
+        assert "Long document with few headers - add more structure" in second
+
 
 class TestAnalyzeContentFunction:
     """Test cases for analyze_content convenience function."""
@@ -151,3 +228,14 @@ class TestAnalyzeContentFunction:
 
             metrics = analyze_content(Path(f.name))
             assert metrics is not None
+
+    def test_analyze_content_reuses_default_analyzer(self, tmp_path: Path) -> None:
+        """Test the convenience function shares one analyzer across calls."""
+        from sage.capabilities.analyzers import content
+
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# Test\n")
+        analyze_content(test_file)
+        analyzer = content._default_analyzer
+        analyze_content(test_file)
+        assert content._default_analyzer is analyzer
@@ -26,6 +26,7 @@ class TestQualityScore:
         assert score.file_path == ""
         assert score.issues == []
         assert score.suggestions == []
+        assert score.issue_codes == set()
 
     def test_overall_score_calculation(self):
         """Test overall score calculation."""
@@ -40,6 +41,18 @@ class TestQualityScore:
         assert isinstance(overall, float)
         assert 0.0 <= overall <= 100.0
 
+    def test_scores_tuple_and_weighting(self):
+        """Test dimension tuple order and weighted overall score."""
+        score = QualityScore(
+            correctness=80,
+            completeness=90,
+            clarity=70,
+            efficiency=85,
+            testability=75,
+        )
+        assert score.scores == (80, 90, 70, 85, 75)
+        assert score.overall == 79.5
+
     def test_grade_a(self):
         """Test A grade for high scores."""
         score = QualityScore(
@@ -112,6 +125,7 @@ class TestQualityScore:
         assert result["scores"]["correctness"] == 80
         assert "overall" in result
         assert "grade" in result
+        assert result["issue_codes"] == []
 
 
 class TestQualityAnalyzer:
@@ -189,6 +203,8 @@ Final thoughts.
         # Returns QualityScore with issue, not None
         assert isinstance(result, QualityScore)
         assert "File not found" in result.issues
+        assert "file_not_found" in result.issue_codes
+        assert result.has_issue("file_not_found")
 
     def test_analyze_unsupported_extension(self, analyzer, tmp_path):
         """Test analysis of unsupported file type."""
@@ -196,7 +212,30 @@ Final thoughts.
         txt_file.write_text("Plain text content")
         result = analyzer.analyze_file(txt_file)
         assert isinstance(result, QualityScore)
-        assert any("Unsupported" in issue for issue in result.issues)
+        assert result.has_issue("unsupported_extension")
+        assert result.has_issue("Unsupported")
+        assert not result.has_issue("file_not_found")
+
+    def test_analyze_unsupported_extension_not_read(self, analyzer, tmp_path):
+        """Test unsupported files are rejected without decoding their contents."""
+        bin_file = tmp_path / "image.png"
+        bin_file.write_bytes(b"\x89PNG\xff\xfe")
+        result = analyzer.analyze_file(bin_file)
+        assert result.has_issue("unsupported_extension")
+
+    def test_analyze_file_cached_until_modified(self, analyzer, tmp_path):
+        """Test repeated analysis reuses the cache until the file changes."""
+        py_file = tmp_path / "cached.py"
+        py_file.write_text('"""Doc."""\n')
+        first = analyzer.analyze_file(py_file)
+        first.issues.append("mutated")
+        assert "mutated" not in analyzer.analyze_file(py_file).issues
+
+        py_file.write_text("def foo():\n    pass\n")
+        assert "Missing module docstring" in analyzer.analyze_file(py_file).issues
+
+        analyzer.clear_cache()
+        assert analyzer._cache == {}
 
     def test_analyze_directory(self, analyzer, tmp_path):
         """Test directory analysis."""
@@ -232,6 +271,19 @@ def bar():
         # Should have lower completeness score or issues
         assert result.completeness < 100 or len(result.issues) > 0
 
+    def test_analyze_python_long_lines_and_functions(self, analyzer, tmp_path):
+        """Test line-length and function-length checks from one pass."""
+        body = "\n".join(f"    x{i} = {i}" for i in range(60))
+        py_file = tmp_path / "long.py"
+        py_file.write_text(
+            f'"""Doc."""\n\ndef first():\n{body}\n\ndef second():\n'
+            f"    return '{'a' * 120}'\n"
+        )
+        result = analyzer.analyze_file(py_file)
+        assert "1 lines exceed 100 characters" in result.issues
+        assert result.issues.count("Function exceeds 50 lines") == 1
+        assert result.clarity == 100 - 2 - 10
+
 
 class TestAnalyzeQualityFunction:
     """Tests for standalone analyze_quality function."""
@@ -243,3 +295,14 @@ class TestAnalyzeQualityFunction:
         result = analyze_quality(test_file)
         assert result is not None
         assert isinstance(result, QualityScore)
+
+    def test_analyze_quality_reuses_default_analyzer(self, tmp_path):
+        """Test the standalone function shares one analyzer across calls."""
+        from sage.capabilities.analyzers import quality
+
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# Title\n")
+        analyze_quality(test_file)
+        analyzer = quality._default_analyzer
+        analyze_quality(test_file)
+        assert quality._default_analyzer is analyzer
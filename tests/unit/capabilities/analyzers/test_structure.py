@@ -8,7 +8,12 @@ Tests cover:
 - check_structure convenience function
 """
 
-from pathlib import Path
+import io
+import os
+import re
+import tarfile
+
+import pytest
 
 from sage.capabilities.analyzers.structure import (
     StructureChecker,
@@ -17,6 +22,86 @@ from sage.capabilities.analyzers.structure import (
     check_structure,
 )
 
+# Snapshots of the checker's expected layout
+_REQ_DIRS = tuple(StructureChecker.REQUIRED_DIRS)
+_REQ_FILES = tuple(StructureChecker.REQUIRED_FILES)
+_EXPECTED = tuple(StructureChecker.EXPECTED_GUIDELINES)
+
+
+def _issue(severity, category, path, message, suggestion=""):
+    """Build a StructureIssue from positional arguments."""
+    return StructureIssue(severity, category, path, message, suggestion)
+
+
+def _build_tar(dirs, files):
+    """Pack directories and empty files into an in-memory tar archive."""
+    buffer = io.BytesIO()
+    with tarfile.open(mode="w", fileobj=buffer) as tar:
+        for name in dirs:
+            info = tarfile.TarInfo(name)
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            tar.addfile(info)
+        for name in files:
+            info = tarfile.TarInfo(name)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO())
+    return buffer.getvalue()
+
+
+# Complete, valid knowledge base tree, packed once at import
+_KB_TAR = _build_tar(
+    _REQ_DIRS,
+    [*_REQ_FILES, *(f"content/guidelines/{g}" for g in _EXPECTED)],
+)
+
+
+def _stats(directories, markdown_files, python_files, total_files):
+    """Build the stats dict returned by StructureChecker._collect_stats."""
+    return {
+        "directories": directories,
+        "markdown_files": markdown_files,
+        "python_files": python_files,
+        "total_files": total_files,
+    }
+
+
+def _touch(path):
+    """Create an empty file with bare open/close syscalls."""
+    fd = os.open(os.fspath(path), os.O_WRONLY | os.O_CREAT, 0o644)
+    os.close(fd)
+
+
+def _build_layout(root, spec):
+    """Create a layout where entries ending in "/" are dirs, others files."""
+    root = str(root)
+    for entry in spec:
+        path = os.path.join(root, entry)
+        if entry.endswith("/"):
+            os.makedirs(path)
+        else:
+            _touch(path)
+
+
+@pytest.fixture(scope="module")
+def empty_checker(tmp_path_factory):
+    """Checker over an empty root, shared by tests that only read from it."""
+    return StructureChecker(tmp_path_factory.mktemp("empty"))
+
+
+@pytest.fixture(scope="class")
+def class_tmp(tmp_path_factory):
+    """Create one base directory shared by every test in a class."""
+    return tmp_path_factory.mktemp("sc")
+
+
+@pytest.fixture
+def valid_kb(tmp_path):
+    """Extract the prebuilt valid knowledge base into the test's tmp_path."""
+    with tarfile.open(fileobj=io.BytesIO(_KB_TAR)) as tar:
+        tar.extractall(tmp_path, filter="data")
+    return tmp_path
+
 
 class TestStructureIssue:
     """Tests for StructureIssue dataclass."""
@@ -48,33 +133,28 @@ class TestStructureIssue:
 
     def test_to_dict(self):
         """Test converting issue to dictionary."""
-        issue = StructureIssue(
-            severity="info",
-            category="content",
-            path="doc.md",
-            message="Info message",
-            suggestion="Do something",
-        )
+        issue = _issue("info", "content", "doc.md", "Info message", "Do something")
         result = issue.to_dict()
-        assert result == {
-            "severity": "info",
-            "category": "content",
-            "path": "doc.md",
-            "message": "Info message",
-            "suggestion": "Do something",
-        }
+        assert result["severity"] == "info"
+        assert result["category"] == "content"
+        assert result["path"] == "doc.md"
+        assert result["message"] == "Info message"
+        assert result["suggestion"] == "Do something"
+        assert len(result) == 5
 
     def test_to_dict_empty_suggestion(self):
         """Test to_dict with empty suggestion."""
-        issue = StructureIssue(
-            severity="error",
-            category="missing",
-            path="file.md",
-            message="Missing file",
-        )
+        issue = _issue("error", "missing", "file.md", "Missing file")
         result = issue.to_dict()
         assert result["suggestion"] == ""
 
+    def test_issue_is_slotted(self):
+        """Test issues declare __slots__ and reject unknown attributes."""
+        assert "__slots__" in StructureIssue.__dict__
+        issue = _issue("error", "missing", "a.md", "Error 1")
+        with pytest.raises(AttributeError):
+            issue.extra = True
+
 
 class TestStructureReport:
     """Tests for StructureReport dataclass."""
@@ -86,6 +166,10 @@ class TestStructureReport:
         assert report.issues == []
         assert report.stats == {}
 
+    def test_report_is_slotted(self):
+        """Test reports declare __slots__."""
+        assert "__slots__" in StructureReport.__dict__
+
     def test_error_count_empty(self):
         """Test error count with no issues."""
         report = StructureReport()
@@ -99,12 +183,7 @@ class TestStructureReport:
     def test_add_warning_issue(self):
         """Test adding a warning issue."""
         report = StructureReport()
-        issue = StructureIssue(
-            severity="warning",
-            category="naming",
-            path="test.md",
-            message="Warning",
-        )
+        issue = _issue("warning", "naming", "test.md", "Warning")
         report.add_issue(issue)
         assert len(report.issues) == 1
         assert report.valid is True  # Warnings don't invalidate
@@ -114,12 +193,7 @@ class TestStructureReport:
     def test_add_error_issue(self):
         """Test adding an error issue invalidates report."""
         report = StructureReport()
-        issue = StructureIssue(
-            severity="error",
-            category="missing",
-            path="required.md",
-            message="Missing required file",
-        )
+        issue = _issue("error", "missing", "required.md", "Missing required file")
         report.add_issue(issue)
         assert len(report.issues) == 1
         assert report.valid is False
@@ -129,11 +203,11 @@ class TestStructureReport:
     def test_add_multiple_issues(self):
         """Test adding multiple issues of different severities."""
         report = StructureReport()
-        report.add_issue(StructureIssue("error", "missing", "a.md", "Error 1"))
-        report.add_issue(StructureIssue("warning", "naming", "b.md", "Warning 1"))
-        report.add_issue(StructureIssue("error", "missing", "c.md", "Error 2"))
-        report.add_issue(StructureIssue("info", "content", "d.md", "Info 1"))
-        report.add_issue(StructureIssue("warning", "naming", "e.md", "Warning 2"))
+        report.add_issue(_issue("error", "missing", "a.md", "Error 1"))
+        report.add_issue(_issue("warning", "naming", "b.md", "Warning 1"))
+        report.add_issue(_issue("error", "missing", "c.md", "Error 2"))
+        report.add_issue(_issue("info", "content", "d.md", "Info 1"))
+        report.add_issue(_issue("warning", "naming", "e.md", "Warning 2"))
 
         assert len(report.issues) == 5
         assert report.error_count == 2
@@ -144,7 +218,7 @@ class TestStructureReport:
         """Test converting report to dictionary."""
         report = StructureReport()
         report.stats = {"directories": 5, "files": 10}
-        report.add_issue(StructureIssue("error", "missing", "x.md", "Missing"))
+        report.add_issue(_issue("error", "missing", "x.md", "Missing"))
 
         result = report.to_dict()
         assert result["valid"] is False
@@ -169,10 +243,28 @@ class TestStructureReport:
 class TestStructureChecker:
     """Tests for StructureChecker class."""
 
-    def test_init_default_path(self):
+    @pytest.fixture
+    def tmp_path(self, class_tmp, request):
+        """Override tmp_path with a unique subdirectory of the class base."""
+        path = class_tmp / re.sub(r"\W", "_", request.node.name)[:60]
+        path.mkdir()
+        return path
+
+    @pytest.fixture
+    def report(self):
+        """Provide a fresh, empty report."""
+        return StructureReport()
+
+    @pytest.fixture
+    def checker_and_report(self, tmp_path, report):
+        """Provide a checker rooted at tmp_path and an empty report."""
+        return StructureChecker(tmp_path), report
+
+    def test_init_default_path(self, tmp_path, monkeypatch):
         """Test initialization with default path."""
+        monkeypatch.chdir(tmp_path)
         checker = StructureChecker()
-        assert checker.root_path == Path.cwd()
+        assert checker.root_path == tmp_path
 
     def test_init_custom_path(self, tmp_path):
         """Test initialization with custom path."""
@@ -193,226 +285,142 @@ class TestStructureChecker:
         """Test EXPECTED_GUIDELINES constant is defined."""
         assert len(StructureChecker.EXPECTED_GUIDELINES) > 0
 
-    def test_check_empty_directory(self, tmp_path):
+    def test_check_empty_directory(self, empty_checker):
         """Test checking an empty directory reports all missing."""
-        checker = StructureChecker(tmp_path)
-        report = checker.check()
+        report = empty_checker.check()
 
         assert report.valid is False
         assert report.error_count > 0
         # Should report missing directories and files
-        missing_issues = [i for i in report.issues if i.category == "missing"]
-        assert len(missing_issues) > 0
-
-    def test_check_directories_missing(self, tmp_path):
-        """Test _check_directories reports missing dirs."""
-        checker = StructureChecker(tmp_path)
-        report = StructureReport()
-        checker._check_directories(report)
-
-        # All required dirs should be reported as missing
-        assert len(report.issues) == len(StructureChecker.REQUIRED_DIRS)
+        assert any(i.category == "missing" for i in report.issues)
+
+    @pytest.mark.parametrize(
+        ("method", "required"),
+        [
+            ("_check_directories", _REQ_DIRS),
+            ("_check_required_files", _REQ_FILES),
+        ],
+        ids=["directories", "required_files"],
+    )
+    def test_check_required_missing(self, empty_checker, report, method, required):
+        """Test required dirs and files are all reported missing on empty root."""
+        getattr(empty_checker, method)(report)
+
+        assert len(report.issues) == len(required)
         for issue in report.issues:
             assert issue.severity == "error"
             assert issue.category == "missing"
 
-    def test_check_directories_exist(self, tmp_path):
+    def test_check_directories_exist(self, valid_kb, report):
         """Test _check_directories passes when dirs exist."""
-        # Create all required directories
-        for dir_name in StructureChecker.REQUIRED_DIRS:
-            (tmp_path / dir_name).mkdir(parents=True)
-
-        checker = StructureChecker(tmp_path)
-        report = StructureReport()
+        checker = StructureChecker(valid_kb)
         checker._check_directories(report)
 
         assert len(report.issues) == 0
 
-    def test_check_directories_file_instead_of_dir(self, tmp_path):
+    def test_check_directories_file_instead_of_dir(self, tmp_path, report):
         """Test error when file exists instead of directory."""
         # Create parent directory and a file with a directory name
-        (tmp_path / "content").mkdir(parents=True)
-        (tmp_path / "content" / "core").write_text("not a directory")
+        (tmp_path / ".knowledge").mkdir(parents=True)
+        (tmp_path / ".knowledge" / "core").write_text("not a directory")
 
         checker = StructureChecker(tmp_path)
-        report = StructureReport()
         checker._check_directories(report)
 
         # Should have error for file instead of directory
-        content_issues = [i for i in report.issues if i.category == "content"]
-        assert len(content_issues) >= 1
-
-    def test_check_required_files_missing(self, tmp_path):
-        """Test _check_required_files reports missing files."""
-        checker = StructureChecker(tmp_path)
-        report = StructureReport()
-        checker._check_required_files(report)
+        assert any(i.category == "content" for i in report.issues)
 
-        assert len(report.issues) == len(StructureChecker.REQUIRED_FILES)
-        for issue in report.issues:
-            assert issue.severity == "error"
-            assert issue.category == "missing"
-
-    def test_check_required_files_exist(self, tmp_path):
+    def test_check_required_files_exist(self, valid_kb, report):
         """Test _check_required_files passes when files exist."""
-        # Create all required files
-        for file_path in StructureChecker.REQUIRED_FILES:
-            full_path = tmp_path / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text("")
-
-        checker = StructureChecker(tmp_path)
-        report = StructureReport()
+        checker = StructureChecker(valid_kb)
         checker._check_required_files(report)
 
         assert len(report.issues) == 0
 
-    def test_check_guidelines_dir_missing(self, tmp_path):
+    def test_check_guidelines_dir_missing(self, empty_checker, report):
         """Test _check_guidelines when directory missing."""
-        checker = StructureChecker(tmp_path)
-        report = StructureReport()
-        checker._check_guidelines(report)
+        empty_checker._check_guidelines(report)
 
         # Should return early without adding issues
         assert len(report.issues) == 0
 
-    def test_check_guidelines_empty_dir(self, tmp_path):
+    def test_check_guidelines_empty_dir(self, tmp_path, report):
         """Test _check_guidelines with empty guidelines dir."""
-        (tmp_path / "content" / "guidelines").mkdir(parents=True)
+        os.makedirs(os.path.join(tmp_path, "content", "guidelines"))
 
         checker = StructureChecker(tmp_path)
-        report = StructureReport()
         checker._check_guidelines(report)
 
         # Should report all expected guidelines as missing
-        assert len(report.issues) == len(StructureChecker.EXPECTED_GUIDELINES)
+        assert len(report.issues) == len(_EXPECTED)
         for issue in report.issues:
             assert issue.severity == "warning"
 
-    def test_check_guidelines_partial(self, tmp_path):
+    def test_check_guidelines_partial(self, tmp_path, report):
         """Test _check_guidelines with some guidelines present."""
-        guidelines_dir = tmp_path / "content" / "guidelines"
-        guidelines_dir.mkdir(parents=True)
-        (guidelines_dir / "quick_start.md").write_text("")
-        (guidelines_dir / "planning_design.md").write_text("")
+        guidelines_dir = os.path.join(tmp_path, "content", "guidelines")
+        os.makedirs(guidelines_dir)
+        _touch(os.path.join(guidelines_dir, "quick_start.md"))
+        _touch(os.path.join(guidelines_dir, "planning_design.md"))
 
         checker = StructureChecker(tmp_path)
-        report = StructureReport()
         checker._check_guidelines(report)
 
-        expected_missing = len(StructureChecker.EXPECTED_GUIDELINES) - 2
+        expected_missing = len(_EXPECTED) - 2
         assert len(report.issues) == expected_missing
 
-    def test_check_naming_spaces_in_name(self, tmp_path):
-        """Test _check_naming detects spaces in filenames."""
-        (tmp_path / "file with spaces.md").write_text("")
-
-        checker = StructureChecker(tmp_path)
-        report = StructureReport()
-        checker._check_naming(report)
-
-        assert len(report.issues) == 1
-        assert report.issues[0].category == "naming"
-        assert "spaces" in report.issues[0].message.lower()
-
-    def test_check_naming_uppercase(self, tmp_path):
-        """Test _check_naming detects uppercase in filenames."""
-        (tmp_path / "MyFile.md").write_text("")
-
-        checker = StructureChecker(tmp_path)
-        report = StructureReport()
-        checker._check_naming(report)
-
-        assert len(report.issues) == 1
-        assert report.issues[0].severity == "info"
-        assert "uppercase" in report.issues[0].message.lower()
-
-    def test_check_naming_readme_allowed(self, tmp_path):
-        """Test README.md is allowed to have uppercase."""
-        (tmp_path / "README.md").write_text("")
-
-        checker = StructureChecker(tmp_path)
-        report = StructureReport()
-        checker._check_naming(report)
-
-        # README.md should not be flagged
-        assert len(report.issues) == 0
-
-    def test_check_naming_skips_archive(self, tmp_path):
-        """Test _check_naming skips 08_archive directory."""
-        archive_dir = tmp_path / "08_archive"
-        archive_dir.mkdir()
-        (archive_dir / "File With Spaces.md").write_text("")
-
-        checker = StructureChecker(tmp_path)
-        report = StructureReport()
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("file with spaces.md", [("warning", "spaces")]),
+            ("MyFile.md", [("info", "uppercase")]),
+            ("README.md", []),
+            ("08_archive/File With Spaces.md", []),
+        ],
+        ids=["spaces", "uppercase", "readme_allowed", "skips_archive"],
+    )
+    def test_check_naming(self, tmp_path, checker_and_report, filename, expected):
+        """Test _check_naming flags spaces/uppercase but skips README and archive."""
+        file_path = os.path.join(tmp_path, filename)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        _touch(file_path)
+
+        checker, report = checker_and_report
         checker._check_naming(report)
 
-        # Archive files should be skipped
-        assert len(report.issues) == 0
-
-    def test_collect_stats_empty(self, tmp_path):
-        """Test _collect_stats on empty directory."""
-        checker = StructureChecker(tmp_path)
-        stats = checker._collect_stats()
-
-        assert stats["directories"] == 0
-        assert stats["markdown_files"] == 0
-        assert stats["python_files"] == 0
-        assert stats["total_files"] == 0
-
-    def test_collect_stats_with_files(self, tmp_path):
-        """Test _collect_stats counts files correctly."""
-        # Create directories and files
-        (tmp_path / "subdir").mkdir()
-        (tmp_path / "doc.md").write_text("")
-        (tmp_path / "script.py").write_text("")
-        (tmp_path / "data.txt").write_text("")
-        (tmp_path / "subdir" / "nested.md").write_text("")
-
-        checker = StructureChecker(tmp_path)
-        stats = checker._collect_stats()
-
-        assert stats["directories"] == 1
-        assert stats["markdown_files"] == 2
-        assert stats["python_files"] == 1
-        assert stats["total_files"] == 4
-
-    def test_collect_stats_skips_hidden(self, tmp_path):
-        """Test _collect_stats skips hidden files/dirs."""
-        (tmp_path / ".hidden").mkdir()
-        (tmp_path / ".hidden" / "file.md").write_text("")
-        (tmp_path / "visible.md").write_text("")
-
-        checker = StructureChecker(tmp_path)
-        stats = checker._collect_stats()
-
-        assert stats["markdown_files"] == 1
-        assert stats["directories"] == 0
-
-    def test_collect_stats_skips_pycache(self, tmp_path):
-        """Test _collect_stats skips __pycache__."""
-        (tmp_path / "__pycache__").mkdir()
-        (tmp_path / "__pycache__" / "module.pyc").write_text("")
-        (tmp_path / "script.py").write_text("")
-
-        checker = StructureChecker(tmp_path)
-        stats = checker._collect_stats()
-
-        assert stats["python_files"] == 1
-        assert stats["total_files"] == 1
-
-    def test_fix_issues_dry_run(self, tmp_path):
+        assert len(report.issues) == len(expected)
+        for issue, (severity, keyword) in zip(report.issues, expected, strict=True):
+            assert issue.category == "naming"
+            assert issue.severity == severity
+            assert keyword in issue.message.lower()
+
+    @pytest.mark.parametrize(
+        ("spec", "expected"),
+        [
+            ([], _stats(0, 0, 0, 0)),
+            (
+                ["subdir/", "doc.md", "script.py", "data.txt", "subdir/nested.md"],
+                _stats(1, 2, 1, 4),
+            ),
+            ([".hidden/", ".hidden/file.md", "visible.md"], _stats(0, 1, 0, 1)),
+            (
+                ["__pycache__/", "__pycache__/module.pyc", "script.py"],
+                _stats(0, 0, 1, 1),
+            ),
+        ],
+        ids=["empty", "with_files", "skips_hidden", "skips_pycache"],
+    )
+    def test_collect_stats(self, tmp_path, spec, expected):
+        """Test _collect_stats counts files and skips hidden/cache entries."""
+        _build_layout(tmp_path, spec)
+
+        stats = StructureChecker(tmp_path)._collect_stats()
+
+        assert stats == expected
+
+    def test_fix_issues_dry_run(self, tmp_path, report):
         """Test fix_issues in dry run mode."""
-        report = StructureReport()
-        report.add_issue(
-            StructureIssue(
-                severity="error",
-                category="missing",
-                path="01_core",
-                message="Missing directory",
-            )
-        )
+        report.add_issue(_issue("error", "missing", "01_core", "Missing directory"))
 
         checker = StructureChecker(tmp_path)
         actions = checker.fix_issues(report, dry_run=True)
@@ -422,17 +430,9 @@ class TestStructureChecker:
         # Directory should NOT be created in dry run
         assert not (tmp_path / "01_core").exists()
 
-    def test_fix_issues_create_directory(self, tmp_path):
+    def test_fix_issues_create_directory(self, tmp_path, report):
         """Test fix_issues creates missing directory."""
-        report = StructureReport()
-        report.add_issue(
-            StructureIssue(
-                severity="error",
-                category="missing",
-                path="01_core",
-                message="Missing directory",
-            )
-        )
+        report.add_issue(_issue("error", "missing", "01_core", "Missing directory"))
 
         checker = StructureChecker(tmp_path)
         actions = checker.fix_issues(report, dry_run=False)
@@ -441,16 +441,10 @@ class TestStructureChecker:
         assert (tmp_path / "01_core").exists()
         assert (tmp_path / "01_core").is_dir()
 
-    def test_fix_issues_create_file(self, tmp_path):
+    def test_fix_issues_create_file(self, tmp_path, report):
         """Test fix_issues creates missing file."""
-        report = StructureReport()
         report.add_issue(
-            StructureIssue(
-                severity="error",
-                category="missing",
-                path="01_core/principles.md",
-                message="Missing file",
-            )
+            _issue("error", "missing", "01_core/principles.md", "Missing file")
         )
 
         checker = StructureChecker(tmp_path)
@@ -459,16 +453,10 @@ class TestStructureChecker:
         assert len(actions) == 1
         assert (tmp_path / "01_core" / "principles.md").exists()
 
-    def test_fix_issues_skips_warnings(self, tmp_path):
+    def test_fix_issues_skips_warnings(self, tmp_path, report):
         """Test fix_issues only fixes error-level issues."""
-        report = StructureReport()
         report.add_issue(
-            StructureIssue(
-                severity="warning",
-                category="missing",
-                path="optional.md",
-                message="Missing optional file",
-            )
+            _issue("warning", "missing", "optional.md", "Missing optional file")
         )
 
         checker = StructureChecker(tmp_path)
@@ -476,42 +464,18 @@ class TestStructureChecker:
 
         assert len(actions) == 0
 
-    def test_fix_issues_skips_non_missing(self, tmp_path):
+    def test_fix_issues_skips_non_missing(self, tmp_path, report):
         """Test fix_issues only fixes missing category."""
-        report = StructureReport()
-        report.add_issue(
-            StructureIssue(
-                severity="error",
-                category="naming",
-                path="BadName.md",
-                message="Bad naming",
-            )
-        )
+        report.add_issue(_issue("error", "naming", "BadName.md", "Bad naming"))
 
         checker = StructureChecker(tmp_path)
         actions = checker.fix_issues(report, dry_run=False)
 
         assert len(actions) == 0
 
-    def test_check_full_valid_structure(self, tmp_path):
+    def test_check_full_valid_structure(self, valid_kb):
         """Test check() on fully valid structure."""
-        # Create all required directories
-        for dir_name in StructureChecker.REQUIRED_DIRS:
-            (tmp_path / dir_name).mkdir(parents=True)
-
-        # Create all required files
-        for file_path in StructureChecker.REQUIRED_FILES:
-            full_path = tmp_path / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text("")
-
-        # Create all guidelines
-        guidelines_dir = tmp_path / "content" / "guidelines"
-        guidelines_dir.mkdir(parents=True, exist_ok=True)
-        for guideline in StructureChecker.EXPECTED_GUIDELINES:
-            (guidelines_dir / guideline).write_text("")
-
-        checker = StructureChecker(tmp_path)
+        checker = StructureChecker(valid_kb)
         report = checker.check()
 
         assert report.valid is True
@@ -522,10 +486,13 @@ class TestStructureChecker:
 class TestCheckStructureFunction:
     """Tests for check_structure convenience function."""
 
-    def test_check_structure_default(self):
+    def test_check_structure_default(self, tmp_path, monkeypatch):
         """Test check_structure uses current directory."""
+        # Keep the scan bounded instead of walking wherever pytest was launched
+        monkeypatch.chdir(tmp_path)
         report = check_structure()
         assert isinstance(report, StructureReport)
+        assert report.stats["total_files"] == 0
 
     def test_check_structure_with_path(self, tmp_path):
         """Test check_structure with custom path."""
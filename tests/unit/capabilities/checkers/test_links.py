@@ -1,17 +1,35 @@
 """Tests for sage.capabilities.checkers.links module."""
 
-import tempfile
+import dataclasses
+import json
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
+
 from sage.capabilities.checkers.links import (
     LinkChecker,
     LinkReport,
     LinkResult,
     LinkStatus,
     LinkType,
+    _extract_links,
+    _RawLink,
     check_links,
 )
 
+# Built once at import rather than inside each parametrized case
+_APPROX30 = pytest.approx(30.0, rel=0.01)
+
+
+@pytest.fixture(scope="class")
+def checker(tmp_path_factory: pytest.TempPathFactory) -> LinkChecker:
+    """Create one offline checker shared by every test in a class."""
+    checker = LinkChecker(kb_path=tmp_path_factory.mktemp("kb"), check_external=False)
+    assert checker.check_external is False
+    return checker
+
 
 class TestLinkType:
     """Test cases for LinkType enum."""
@@ -51,39 +69,46 @@ class TestLinkResult:
         assert data["source_file"] == "test.md"
         assert data["line_number"] == 10
 
+    def test_result_is_frozen(self) -> None:
+        """Test results are slotted and immutable."""
+        result = LinkResult(
+            source_file="test.md",
+            line_number=1,
+            link_text="",
+            link_target="#top",
+            link_type=LinkType.ANCHOR,
+            status=LinkStatus.VALID,
+        )
+        assert "__slots__" in LinkResult.__dict__
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.status = LinkStatus.BROKEN  # type: ignore[misc]
+
 
 class TestLinkReport:
     """Test cases for LinkReport class."""
 
-    def test_broken_rate_calculation(self) -> None:
-        """Test broken link rate calculation."""
-        report = LinkReport(
-            total_links=100,
-            valid_count=90,
-            broken_count=10,
-            warning_count=0,
-            skipped_count=0,
-            results=[],
-            files_checked=5,
-            duration_ms=100.0,
-        )
-        rate = report.broken_rate
-        assert rate == 10.0  # 10% as percentage
-
-    def test_broken_rate_zero_total(self) -> None:
-        """Test broken rate with zero total links."""
+    @pytest.mark.parametrize(
+        ("total", "broken", "expected"),
+        [
+            (100, 10, 10.0),
+            (10, 3, _APPROX30),
+            (0, 0, 0.0),
+        ],
+        ids=["ten_percent", "thirty_percent", "zero_total"],
+    )
+    def test_broken_rate(self, total: int, broken: int, expected: float) -> None:
+        """Test broken link rate is a percentage and safe for zero links."""
         report = LinkReport(
-            total_links=0,
-            valid_count=0,
-            broken_count=0,
+            total_links=total,
+            valid_count=total - broken,
+            broken_count=broken,
             warning_count=0,
             skipped_count=0,
             results=[],
-            files_checked=0,
+            files_checked=1,
             duration_ms=0.0,
         )
-        rate = report.broken_rate
-        assert rate == 0.0
+        assert report.broken_rate == expected
 
     def test_report_to_dict(self) -> None:
         """Test converting report to dictionary."""
@@ -101,92 +126,336 @@ class TestLinkReport:
         assert data["total_links"] == 10
         assert "broken_rate" in data
 
+    def test_report_to_json(self) -> None:
+        """Test JSON output round-trips to the to_dict() form."""
+        report = _broken_report()
+        assert json.loads(report.to_json()) == report.to_dict()
+
+    def test_report_to_json_same_without_orjson(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the stdlib fallback emits exactly the orjson bytes."""
+        from sage.capabilities.checkers import links
+
+        if not links.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        report = _broken_report()
+        with_orjson = report.to_json()
+        monkeypatch.setattr(links, "ORJSON_AVAILABLE", False)
+
+        assert report.to_json().encode() == with_orjson.encode()
+
+
+def _broken_report() -> LinkReport:
+    """Build a one-result report with non-ASCII text and a float field."""
+    result = LinkResult(
+        source_file="a.md",
+        line_number=3,
+        link_text="目标",
+        link_target="./missing.md",
+        link_type=LinkType.INTERNAL,
+        status=LinkStatus.BROKEN,
+    )
+    return LinkReport(
+        total_links=1,
+        valid_count=0,
+        broken_count=1,
+        warning_count=0,
+        skipped_count=0,
+        results=[result],
+        files_checked=1,
+        duration_ms=1.0,
+    )
+
+
+class TestExtractLinks:
+    """Test cases for the raw link scanner."""
+
+    def test_extract_links_order_and_lines(self) -> None:
+        """Test links come in line order, links before images within a line."""
+        content = b"# T\n![img](a.png) [doc](b.md)\n\n[x]( c.md )\n"
+
+        assert _extract_links(content) == [
+            _RawLink(2, False, "img", "a.png"),
+            _RawLink(2, False, "doc", "b.md"),
+            _RawLink(2, True, "img", "a.png"),
+            _RawLink(4, False, "x", "c.md"),
+        ]
+
 
 class TestLinkChecker:
     """Test cases for LinkChecker class."""
 
-    def test_checker_creation(self) -> None:
+    @pytest.fixture(autouse=True)
+    def _reset_checker(self, checker: LinkChecker) -> Iterator[None]:
+        """Empty the shared knowledge base and caches after each test."""
+        yield
+        checker.clear_cache()
+        for entry in checker.kb_path.iterdir():
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+
+    def test_checker_creation(self, checker: LinkChecker) -> None:
         """Test that LinkChecker can be instantiated."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            checker = LinkChecker(kb_path=Path(tmpdir))
-            assert checker is not None
+        assert checker is not None
 
-    def test_check_file_with_valid_links(self) -> None:
+    def test_check_file_with_valid_links(self, checker: LinkChecker) -> None:
         """Test checking a file with valid internal links."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Create target file
-            (tmppath / "target.md").write_text("# Target\n\nContent.")
+        # Create target file
+        (checker.kb_path / "target.md").write_text("# Target\n\nContent.")
 
-            # Create source file with link to target
-            source = tmppath / "source.md"
-            source.write_text("# Source\n\nLink to [target](./target.md).")
+        # Create source file with link to target
+        source = checker.kb_path / "source.md"
+        source.write_text("# Source\n\nLink to [target](./target.md).")
 
-            checker = LinkChecker(kb_path=tmppath)
-            results = checker.check_file(source)
+        results = checker.check_file(source)
 
-            assert isinstance(results, list)
+        assert isinstance(results, list)
 
-    def test_check_file_with_broken_links(self) -> None:
+    def test_check_file_with_broken_links(self, checker: LinkChecker) -> None:
         """Test checking a file with broken links."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+        # Create source file with broken link
+        source = checker.kb_path / "source.md"
+        source.write_text("# Source\n\nLink to [missing](./missing.md).")
+
+        results = checker.check_file(source)
+
+        # Should find the broken link
+        assert any(r.status == LinkStatus.BROKEN for r in results)
+
+    def test_check_file_decodes_only_links(self, checker: LinkChecker) -> None:
+        """Test links are decoded from raw bytes with correct line numbers."""
+        (checker.kb_path / "目标.md").write_text("# Target\n", encoding="utf-8")
+        source = checker.kb_path / "source.md"
+        source.write_bytes(
+            b"# Source\n\xff\xfe stray bytes\n"
+            + "See [目标](./目标.md) and [gone](./gone.md)\n".encode()
+        )
 
-            # Create source file with broken link
-            source = tmppath / "source.md"
-            source.write_text("# Source\n\nLink to [missing](./missing.md).")
+        results = checker.check_file(source)
 
-            checker = LinkChecker(kb_path=tmppath)
-            results = checker.check_file(source)
+        assert [(r.line_number, r.link_text, r.status) for r in results] == [
+            (3, "目标", LinkStatus.VALID),
+            (3, "gone", LinkStatus.BROKEN),
+        ]
 
-            # Should find the broken link
-            broken = [r for r in results if r.status == LinkStatus.BROKEN]
-            assert len(broken) >= 1
+    def test_check_file_caches_resolved_targets(self, checker: LinkChecker) -> None:
+        """Test repeated targets resolve once until the cache is cleared."""
+        source = checker.kb_path / "source.md"
+        source.write_text("[a](./missing.md)\n[b](./missing.md)\n")
 
-    def test_check_all(self) -> None:
-        """Test checking all files in directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+        results = checker.check_file(source)
+
+        assert [r.status for r in results] == [LinkStatus.BROKEN] * 2
+        assert len(checker._target_cache) == 1
 
-            # Create test files
-            (tmppath / "file1.md").write_text("# File 1\n\nNo links.")
-            (tmppath / "file2.md").write_text("# File 2\n\nNo links.")
+        (checker.kb_path / "missing.md").write_text("# Now present\n")
+        checker.clear_cache()
+        assert checker._target_cache == {}
+        assert checker.check_file(source)[0].status == LinkStatus.VALID
 
-            checker = LinkChecker(kb_path=tmppath)
-            report = checker.check_all()
+    def test_check_file_sees_targets_created_later(self, checker: LinkChecker) -> None:
+        """Test standalone check_file() calls do not reuse earlier misses."""
+        source = checker.kb_path / "source.md"
+        source.write_text("[a](./later.md)\n")
+        assert checker.check_file(source)[0].status == LinkStatus.BROKEN
 
-            assert isinstance(report, LinkReport)
+        (checker.kb_path / "later.md").write_text("# Later\n")
+        assert checker.check_file(source)[0].status == LinkStatus.VALID
 
-    def test_get_broken_links(self) -> None:
+    def test_check_all(self, checker: LinkChecker) -> None:
+        """Test checking all files in directory."""
+        # Create test files
+        (checker.kb_path / "file1.md").write_text("# File 1\n\nNo links.")
+        (checker.kb_path / "file2.md").write_text("# File 2\n\nNo links.")
+
+        report = checker.check_all()
+
+        assert isinstance(report, LinkReport)
+        assert report.files_checked == 2
+
+    def test_check_all_matches_per_file_results(self, checker: LinkChecker) -> None:
+        """Test concurrent check_all returns the same results as check_file."""
+        for i in range(12):
+            (checker.kb_path / f"doc{i}.md").write_text(
+                f"# Doc {i}\n\n[next](./doc{i + 1}.md) [self](#doc-{i})\n"
+            )
+
+        report = checker.check_all()
+
+        expected = [
+            result
+            for path in checker.kb_path.glob("**/*.md")
+            for result in checker.check_file(path)
+        ]
+        assert report.files_checked == 12
+        assert report.results == expected
+        assert report.broken_count == 1
+
+    def test_check_all_multiprocess_matches_threads(
+        self, checker: LinkChecker, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test scanning in worker processes gives the same report."""
+        for i in range(4):
+            (checker.kb_path / f"doc{i}.md").write_text(
+                f"# Doc {i}\n\n[next](./doc{i + 1}.md) ![img](./img{i}.png)\n"
+            )
+        (checker.kb_path / "bad.md").write_bytes(b"[bad](\xff.md)\n")
+        threaded = checker.check_all()
+
+        checker.clear_cache()
+        monkeypatch.setattr(checker, "PROCESS_POOL_MIN_FILES", 2)
+        multiprocess = checker.check_all()
+
+        assert [r.to_dict() for r in multiprocess.results] == [
+            r.to_dict() for r in threaded.results
+        ]
+        assert multiprocess.files_checked == 5
+
+    def test_check_all_reuses_unchanged_files(
+        self, checker: LinkChecker, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test repeated check_all only re-reads files affected by changes."""
+        kb = checker.kb_path
+        (kb / "target.md").write_text("# Target\n")
+        (kb / "plain.md").write_text("[t](./target.md) [gone](./gone.md)\n")
+        (kb / "anchored.md").write_text("[t](./target.md#later)\n")
+        first = checker.check_all()
+
+        checked: list[str] = []
+        check_file = checker.check_file
+
+        def counting_check_file(path: Path) -> list[LinkResult]:
+            checked.append(path.name)
+            return check_file(path)
+
+        monkeypatch.setattr(checker, "check_file", counting_check_file)
+
+        assert checker.check_all().results == first.results
+        assert checked == []
+
+        # Only headings changed: files with cross-file anchors are rechecked
+        (kb / "target.md").write_text("# Target\n\n## Later\n")
+        report = checker.check_all()
+        assert sorted(checked) == ["anchored.md", "target.md"]
+        assert report.warning_count == 0
+
+        # A new file can fix any link, so everything is rechecked
+        checked.clear()
+        (kb / "gone.md").write_text("# Gone\n")
+        report = checker.check_all()
+        assert len(checked) == 4
+        assert report.broken_count == 0
+
+    def test_check_all_rechecks_after_directory_appears(
+        self, checker: LinkChecker
+    ) -> None:
+        """Test a new directory counts as a change to which paths exist."""
+        (checker.kb_path / "index.md").write_text("[x](sub)\n")
+        assert checker.check_all().broken_count == 1
+
+        (checker.kb_path / "sub").mkdir()
+        assert checker.check_all().broken_count == 0
+
+    def test_check_all_rechecks_links_outside_kb(self, tmp_path: Path) -> None:
+        """Test links leaving the KB are checked again on every run."""
+        kb = tmp_path / "kb"
+        kb.mkdir()
+        (kb / "inside.md").write_text("[x](../outside.md)\n")
+        checker = LinkChecker(kb_path=kb)
+        assert checker.check_all().broken_count == 1
+
+        (tmp_path / "outside.md").write_text("# Outside\n")
+        assert checker.check_all().broken_count == 0
+
+    def test_check_all_resolves_targets_from_index(
+        self, checker: LinkChecker, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test check_all answers hits from its walk, stat-ing only misses."""
+        (checker.kb_path / "guides").mkdir()
+        (checker.kb_path / "guides" / "intro.md").write_text("# Intro\n")
+        (checker.kb_path / "index.md").write_text(
+            "[dir](./guides) [file](guides/intro.md) [gone](./gone.md)\n"
+        )
+        stat_checked: list[str] = []
+        exists = Path.exists
+
+        def counting_exists(self: Path) -> bool:
+            stat_checked.append(self.name)
+            return exists(self)
+
+        monkeypatch.setattr(Path, "exists", counting_exists)
+        report = checker.check_all()
+
+        assert report.valid_count == 2
+        assert [r.link_target for r in report.broken_results] == ["./gone.md"]
+        assert stat_checked == ["gone.md"]
+
+    def test_check_all_follows_symlinked_directories(
+        self, checker: LinkChecker, tmp_path: Path
+    ) -> None:
+        """Test targets under a symlinked directory are not reported broken."""
+        outside = tmp_path / "shared"
+        outside.mkdir()
+        (outside / "t.md").write_text("# T\n")
+        try:
+            (checker.kb_path / "linked").symlink_to(outside, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+        (checker.kb_path / "index.md").write_text("[x](linked/t.md)\n")
+
+        report = checker.check_all()
+
+        assert report.broken_count == 0
+        assert report.valid_count == 1
+
+    def test_check_file_after_check_all_sees_new_targets(
+        self, checker: LinkChecker
+    ) -> None:
+        """Test the check_all() index is not trusted once that run is over."""
+        source = checker.kb_path / "source.md"
+        source.write_text("[a](./later.md)\n")
+        assert checker.check_all().broken_count == 1
+
+        (checker.kb_path / "later.md").write_text("# Later\n")
+        assert checker.check_file(source)[0].status == LinkStatus.VALID
+
+    def test_get_broken_links(self, checker: LinkChecker) -> None:
         """Test getting only broken links."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+        # Create file with broken link
+        (checker.kb_path / "test.md").write_text("[broken](./missing.md)")
+
+        report = checker.check_all()
+        broken = checker.get_broken_links()
+
+        assert isinstance(broken, list)
+        assert broken == list(report.broken_results)
+        assert [r.link_target for r in broken] == ["./missing.md"]
 
-            # Create file with broken link
-            (tmppath / "test.md").write_text("[broken](./missing.md)")
+    def test_get_broken_links_reuses_last_report(self, checker: LinkChecker) -> None:
+        """Test broken links come from the last report until caches clear."""
+        (checker.kb_path / "test.md").write_text("[broken](./missing.md)")
+        checker.check_all()
 
-            checker = LinkChecker(kb_path=tmppath)
-            checker.check_all()
-            broken = checker.get_broken_links()
+        (checker.kb_path / "missing.md").write_text("# Fixed\n")
+        assert len(checker.get_broken_links()) == 1
 
-            assert isinstance(broken, list)
+        checker.clear_cache()
+        assert checker.get_broken_links() == []
 
-    def test_clear_cache(self) -> None:
+    def test_clear_cache(self, checker: LinkChecker) -> None:
         """Test clearing the checker cache."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            checker = LinkChecker(kb_path=Path(tmpdir))
-            checker.clear_cache()  # Should not raise
+        checker.clear_cache()  # Should not raise
 
 
 class TestCheckLinksFunction:
     """Test cases for check_links convenience function."""
 
-    def test_check_links_function(self) -> None:
+    def test_check_links_function(self, tmp_path: Path) -> None:
         """Test the convenience function."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-            (tmppath / "test.md").write_text("# Test\n\nNo links.")
+        (tmp_path / "test.md").write_text("# Test\n\nNo links.")
 
-            report = check_links(kb_path=tmppath)
-            assert isinstance(report, LinkReport)
+        report = check_links(kb_path=tmp_path)
+        assert isinstance(report, LinkReport)
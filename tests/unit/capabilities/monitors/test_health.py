@@ -1,7 +1,12 @@
 """Tests for sage.capabilities.monitors.health module."""
 
-import tempfile
+import asyncio
+import dataclasses
+import gc
+import json
+import warnings
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -39,6 +44,13 @@ class TestHealthCheck:
         assert check.name == "test_check"
         assert check.status == HealthStatus.HEALTHY
 
+    def test_check_is_frozen(self) -> None:
+        """Test checks are slotted and immutable."""
+        check = HealthCheck(name="test", status=HealthStatus.HEALTHY)
+        assert "__slots__" in HealthCheck.__dict__
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            check.status = HealthStatus.UNHEALTHY  # type: ignore[misc]
+
     def test_check_to_dict(self) -> None:
         """Test converting check to dictionary."""
         check = HealthCheck(
@@ -84,85 +96,309 @@ class TestHealthReport:
         assert data["summary"]["total"] == 1
         assert data["summary"]["healthy"] == 1
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_report_to_json(
+        self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """Test JSON output matches to_dict with and without orjson."""
+        from sage.capabilities.monitors import health
+
+        if use_orjson and not health.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(health, "ORJSON_AVAILABLE", use_orjson)
+        report = HealthReport(
+            overall_status=HealthStatus.HEALTHY,
+            checks=[HealthCheck(name="check1", status=HealthStatus.HEALTHY)],
+        )
+
+        assert json.loads(report.to_json()) == report.to_dict()
+
+    def test_report_to_json_same_without_orjson(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the stdlib fallback emits exactly the orjson bytes."""
+        from sage.capabilities.monitors import health
+
+        if not health.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        report = HealthReport(
+            overall_status=HealthStatus.DEGRADED,
+            checks=[
+                HealthCheck(
+                    name="config",
+                    status=HealthStatus.DEGRADED,
+                    message="配置缺失",
+                    duration_ms=1.5,
+                    details={"missing": ["a", "b"]},
+                )
+            ],
+            duration_ms=2.25,
+        )
+        with_orjson = report.to_json()
+        monkeypatch.setattr(health, "ORJSON_AVAILABLE", False)
+
+        assert report.to_json().encode() == with_orjson.encode()
+
+
+class _AlertCounter:
+    """Plain callable that counts alerts, lighter than a Mock."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, report: HealthReport) -> None:
+        self.calls += 1
+
+
+@pytest.fixture(scope="module")
+def empty_kb(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide one empty knowledge base root for tests that only read it."""
+    return tmp_path_factory.mktemp("kb")
+
 
 class TestHealthMonitor:
     """Test cases for HealthMonitor class."""
 
-    def test_monitor_creation(self) -> None:
+    def test_monitor_creation(self, empty_kb: Path) -> None:
         """Test that HealthMonitor can be instantiated."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            monitor = HealthMonitor(kb_path=Path(tmpdir))
-            assert monitor is not None
+        monitor = HealthMonitor(kb_path=empty_kb)
+        assert monitor is not None
 
     @pytest.mark.asyncio
-    async def test_check_filesystem(self) -> None:
+    async def test_check_filesystem(self, tmp_path: Path) -> None:
         """Test filesystem health check."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-            # Create some content
-            (tmppath / "test.md").write_text("# Test")
+        # Create some content
+        (tmp_path / "test.md").write_text("# Test")
 
-            monitor = HealthMonitor(kb_path=tmppath)
-            check = await monitor.check_filesystem()
+        monitor = HealthMonitor(kb_path=tmp_path)
+        check = await monitor.check_filesystem()
 
-            assert isinstance(check, HealthCheck)
-            assert check.name == "filesystem"
+        assert isinstance(check, HealthCheck)
+        assert check.name == "filesystem"
 
     @pytest.mark.asyncio
-    async def test_check_config(self) -> None:
+    async def test_check_filesystem_healthy(self, tmp_path: Path) -> None:
+        """Test a complete layout is healthy and its files are counted."""
+        for dir_name in (".knowledge/core", ".knowledge/guidelines", "tools"):
+            (tmp_path / dir_name).mkdir(parents=True)
+        (tmp_path / "index.md").write_text("# Index")
+        (tmp_path / ".knowledge" / "core" / "principles.md").write_text("# P")
+        (tmp_path / "tools" / "check.py").write_text("")
+
+        check = await HealthMonitor(kb_path=tmp_path).check_filesystem()
+
+        assert check.status == HealthStatus.HEALTHY
+        assert check.details == {"md_files": 2, "py_files": 1}
+
+    @pytest.mark.asyncio
+    async def test_check_filesystem_missing_dirs(self, tmp_path: Path) -> None:
+        """Test missing core directories degrade the check."""
+        (tmp_path / ".knowledge" / "core").mkdir(parents=True)
+        (tmp_path / "index.md").write_text("# Index")
+
+        check = await HealthMonitor(kb_path=tmp_path).check_filesystem()
+
+        assert check.status == HealthStatus.DEGRADED
+        assert check.details == {"missing": [".knowledge/guidelines", "tools"]}
+
+    @pytest.mark.asyncio
+    async def test_check_config(self, empty_kb: Path) -> None:
         """Test config health check."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            monitor = HealthMonitor(kb_path=Path(tmpdir))
-            check = await monitor.check_config()
+        monitor = HealthMonitor(kb_path=empty_kb)
+        check = await monitor.check_config()
+
+        assert isinstance(check, HealthCheck)
+        assert check.name == "config"
 
-            assert isinstance(check, HealthCheck)
-            assert check.name == "config"
+    @pytest.mark.asyncio
+    async def test_check_config_invalid_yaml(self, tmp_path: Path) -> None:
+        """Test unparseable sage.yaml is unhealthy and the parse is cached."""
+        config_path = tmp_path / "sage.yaml"
+        config_path.write_text("version: [unclosed\n")
+        monitor = HealthMonitor(kb_path=tmp_path)
+
+        check = await monitor.check_config()
+
+        assert check.status == HealthStatus.UNHEALTHY
+        assert "Error parsing sage.yaml" in check.message
+        cached = monitor._config_load
+        assert cached is not None
+        assert cached[0][:2] == (str(config_path), config_path.stat().st_mtime_ns)
+        assert (await monitor.check_config()).message == check.message
+        assert monitor._config_load is cached
 
     @pytest.mark.asyncio
-    async def test_check_all(self) -> None:
+    async def test_check_config_parses_unchanged_yaml_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test repeated checks reuse the merged config until a file changes."""
+        import yaml
+
+        from sage.core import config as config_module
+
+        config_path = tmp_path / "sage.yaml"
+        config_path.write_text("version: '9.9'\ntimeout: {}\nloading: {}\n")
+        parsed: list[str] = []
+        safe_load = yaml.safe_load
+
+        def counting_safe_load(stream: Any) -> Any:
+            parsed.append(Path(stream.name).name)
+            return safe_load(stream)
+
+        monkeypatch.setattr(config_module.yaml, "safe_load", counting_safe_load)
+        monitor = HealthMonitor(kb_path=tmp_path)
+
+        checks = [await monitor.check_config() for _ in range(3)]
+
+        assert [c.status for c in checks] == [HealthStatus.HEALTHY] * 3
+        assert checks[0].details == {"version": "9.9"}
+        assert parsed == ["sage.yaml"]
+
+        (tmp_path / "config").mkdir()
+        (tmp_path / "config" / "extra.yaml").write_text("extra: true\n")
+        await monitor.check_config()
+        assert parsed == ["sage.yaml", "extra.yaml", "sage.yaml"]
+
+    @pytest.mark.asyncio
+    async def test_check_all(self, empty_kb: Path) -> None:
         """Test running all health checks."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            monitor = HealthMonitor(kb_path=Path(tmpdir))
-            report = await monitor.check_all()
+        monitor = HealthMonitor(kb_path=empty_kb)
+        report = await monitor.check_all()
+
+        assert isinstance(report, HealthReport)
+        assert len(report.checks) > 0
+
+    @pytest.mark.asyncio
+    async def test_check_all_times_out_slow_check(self, empty_kb: Path) -> None:
+        """Test a hung check is reported unhealthy without blocking the report."""
+        monitor = HealthMonitor(kb_path=empty_kb, check_timeout_s=0.05)
+
+        async def hung_loader() -> HealthCheck:
+            await asyncio.sleep(10)
+            raise AssertionError("unreachable")
+
+        monitor.check_loader = hung_loader  # type: ignore[method-assign]
+        report = await monitor.check_all()
+
+        checks = {c.name: c for c in report.checks}
+        assert set(checks) == {"filesystem", "config", "loader"}
+        assert checks["loader"].status == HealthStatus.UNHEALTHY
+        assert "timed out" in checks["loader"].message
+        assert report.overall_status == HealthStatus.UNHEALTHY
+
+    @pytest.mark.asyncio
+    async def test_check_all_with_exception(self, empty_kb: Path) -> None:
+        """Test a raising check becomes an unknown, unhealthy entry."""
+        monitor = HealthMonitor(kb_path=empty_kb)
+
+        async def broken_config() -> HealthCheck:
+            raise RuntimeError("boom")
+
+        monitor.check_config = broken_config  # type: ignore[method-assign]
+        report = await monitor.check_all()
+
+        failed = [c for c in report.checks if c.name == "unknown"]
+        assert len(failed) == 1
+        assert failed[0].status == HealthStatus.UNHEALTHY
+        assert failed[0].message == "boom"
+
+    @pytest.mark.asyncio
+    async def test_register_alert_callback(self, empty_kb: Path) -> None:
+        """Test a registered callback fires once per unhealthy report."""
+        monitor = HealthMonitor(kb_path=empty_kb)
+        counter = _AlertCounter()
 
-            assert isinstance(report, HealthReport)
-            assert len(report.checks) > 0
+        monitor.register_alert_callback(counter)
+        report = await monitor.check_all()
 
-    def test_register_alert_callback(self) -> None:
-        """Test registering alert callback."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            monitor = HealthMonitor(kb_path=Path(tmpdir))
+        assert report.overall_status != HealthStatus.HEALTHY
+        assert counter.calls == 1
 
-            alerts_received: list[HealthReport] = []
+    @pytest.mark.asyncio
+    async def test_check_all_runs_alert_callbacks_concurrently(
+        self, empty_kb: Path
+    ) -> None:
+        """Test async and sync callbacks all run, concurrently and isolated."""
+        monitor = HealthMonitor(kb_path=empty_kb)
+        released = asyncio.Event()
+        received: list[str] = []
+
+        async def waits_for_other(report: HealthReport) -> None:
+            # Only completes if the next callback runs while this one waits
+            await asyncio.wait_for(released.wait(), timeout=5)
+            received.append("async")
+
+        async def releases(report: HealthReport) -> None:
+            released.set()
+
+        def failing(report: HealthReport) -> None:
+            raise RuntimeError("callback failure")
+
+        def sync_callback(report: HealthReport) -> None:
+            received.append("sync")
 
-            def on_alert(report: HealthReport) -> None:
-                alerts_received.append(report)
+        for callback in (waits_for_other, releases, failing, sync_callback):
+            monitor.register_alert_callback(callback)
+
+        report = await monitor.check_all()
+
+        assert report.overall_status != HealthStatus.HEALTHY
+        assert sorted(received) == ["async", "sync"]
+
+    @pytest.mark.asyncio
+    async def test_awaitable_returning_callbacks_are_awaited(
+        self, empty_kb: Path
+    ) -> None:
+        """Test async __call__ objects and coroutine-returning wrappers run."""
+        monitor = HealthMonitor(kb_path=empty_kb)
+        received: list[str] = []
 
-            monitor.register_alert_callback(on_alert)
-            # Callback should be registered without error
+        class AsyncCallable:
+            async def __call__(self, report: HealthReport) -> None:
+                received.append("async __call__")
 
-    def test_get_history(self) -> None:
+        async def notify(report: HealthReport) -> None:
+            received.append("wrapped")
+
+        monitor.register_alert_callback(AsyncCallable())
+        monitor.register_alert_callback(lambda report: notify(report))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            await monitor.check_all()
+            gc.collect()
+
+        assert sorted(received) == ["async __call__", "wrapped"]
+
+    def test_get_history(self, empty_kb: Path) -> None:
         """Test getting health check history."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            monitor = HealthMonitor(kb_path=Path(tmpdir))
-            history = monitor.get_history()
+        monitor = HealthMonitor(kb_path=empty_kb)
+        history = monitor.get_history()
+
+        assert isinstance(history, list)
+
+    @pytest.mark.asyncio
+    async def test_history_overflow(self, empty_kb: Path) -> None:
+        """Test history keeps only the newest history_size reports, in order."""
+        monitor = HealthMonitor(kb_path=empty_kb, history_size=3)
+
+        reports = [await monitor.check_all() for _ in range(5)]
 
-            assert isinstance(history, list)
+        assert monitor.get_history() == reports[-3:]
+        assert monitor.get_history(limit=2) == reports[-2:]
 
-    def test_get_status_summary(self) -> None:
+    def test_get_status_summary(self, empty_kb: Path) -> None:
         """Test getting status summary."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            monitor = HealthMonitor(kb_path=Path(tmpdir))
-            summary = monitor.get_status_summary()
+        monitor = HealthMonitor(kb_path=empty_kb)
+        summary = monitor.get_status_summary()
 
-            assert isinstance(summary, dict)
+        assert isinstance(summary, dict)
 
 
 class TestGetHealthMonitor:
     """Test cases for get_health_monitor function."""
 
-    def test_get_health_monitor_function(self) -> None:
+    def test_get_health_monitor_function(self, empty_kb: Path) -> None:
         """Test the convenience function."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            monitor = get_health_monitor(kb_path=Path(tmpdir))
-            assert isinstance(monitor, HealthMonitor)
+        monitor = get_health_monitor(kb_path=empty_kb)
+        assert isinstance(monitor, HealthMonitor)
@@ -1,9 +1,55 @@
 """Tests for sage.core.di.container module."""
 
+import gc
+import itertools
+import threading
+import weakref
+from contextvars import ContextVar
+
 import pytest
 
-from sage.core.di import Lifetime
-from sage.core.di.container import DIContainer, DIScope
+from sage.core.di import CircularDependencyError, Lifetime
+from sage.core.di import container as container_module
+from sage.core.di.container import (
+    DIContainer,
+    DIScope,
+    Registration,
+    ServiceDescriptor,
+    get_container,
+)
+
+
+class Greeter:
+    """Dependency used by the auto-wiring tests."""
+
+
+class GreeterWithDependency:
+    """Service whose constructor is auto-wired."""
+
+    def __init__(self, greeter: Greeter, name: str = "sage") -> None:
+        self.greeter = greeter
+        self.name = name
+
+
+class Chicken:
+    """One half of a circular dependency."""
+
+    def __init__(self, egg: "Egg") -> None:
+        self.egg = egg
+
+
+class Egg:
+    """The other half of a circular dependency."""
+
+    def __init__(self, chicken: Chicken) -> None:
+        self.chicken = chicken
+
+
+class NeedsLateService:
+    """Service whose dependency is defined only after it is registered."""
+
+    def __init__(self, late: "LateService" = None) -> None:  # noqa: F821
+        self.late = late
 
 
 class TestDIContainer:
@@ -40,6 +86,295 @@ class TestDIContainer:
 
         assert instance1 is not instance2
 
+    def test_auto_wiring(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test dependencies are analyzed once at registration, not per resolve."""
+        container = DIContainer()
+        container.register(Greeter)
+        container.register(GreeterWithDependency, lifetime=Lifetime.TRANSIENT)
+
+        registration = container.get_registrations()[GreeterWithDependency]
+        assert registration.deps == (("greeter", Greeter), ("name", str))
+
+        def no_reflection(*args: object, **kwargs: object) -> None:
+            raise AssertionError("resolve() should not inspect constructors")
+
+        monkeypatch.setattr(container_module, "get_type_hints", no_reflection)
+        first = container.resolve(GreeterWithDependency)
+        second = container.resolve(GreeterWithDependency)
+
+        assert first is not second
+        assert first.greeter is second.greeter is container.resolve(Greeter)
+        assert first.name == "sage"
+
+    def test_forward_reference_dependency(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test unresolvable hints are retried instead of cached as no deps."""
+        container = DIContainer()
+        container.register(NeedsLateService, lifetime=Lifetime.TRANSIENT)
+        assert container.resolve(NeedsLateService).late is None
+
+        class LateService:
+            pass
+
+        monkeypatch.setitem(globals(), "LateService", LateService)
+        container.register(LateService)
+        assert isinstance(container.resolve(NeedsLateService).late, LateService)
+
+        fresh = DIContainer()
+        fresh.register(NeedsLateService)
+        fresh.register(LateService)
+        assert fresh.resolve(NeedsLateService).late is fresh.resolve(LateService)
+        assert isinstance(container_module._deps_cache, weakref.WeakKeyDictionary)
+
+    def test_circular_dependency_detection(self) -> None:
+        """Test a dependency cycle raises instead of recursing forever."""
+        container = DIContainer()
+        container.register(Chicken, lifetime=Lifetime.TRANSIENT)
+        container.register(Egg, lifetime=Lifetime.TRANSIENT)
+
+        with pytest.raises(CircularDependencyError, match="Chicken"):
+            container.resolve(Chicken)
+        # The failed attempt leaves nothing marked as in progress
+        with pytest.raises(CircularDependencyError, match="Egg"):
+            container.resolve(Egg)
+
+    def test_cycle_detection_passes_state_down(self) -> None:
+        """Test auto-wiring threads in-flight state through calls, not context."""
+        container = DIContainer()
+        container.register(Greeter, lifetime=Lifetime.TRANSIENT)
+        container.register(GreeterWithDependency, lifetime=Lifetime.TRANSIENT)
+
+        container.resolve(GreeterWithDependency)
+        assert container_module._RESOLVING.get() is None
+        # One module-level variable, not a ContextVar per container
+        assert not any(isinstance(v, ContextVar) for v in vars(container).values())
+
+        # Factories re-enter resolve(), so cycles through them are still caught
+        container.register_factory(
+            Chicken, lambda: container.resolve(Egg), Lifetime.TRANSIENT
+        )
+        container.register_factory(
+            Egg, lambda: container.resolve(Chicken), Lifetime.TRANSIENT
+        )
+        with pytest.raises(CircularDependencyError, match="Chicken"):
+            container.resolve(Chicken)
+        assert container_module._RESOLVING.get() is None
+
+    def test_concurrent_resolution_is_not_circular(self) -> None:
+        """Test threads constructing the same service do not see each other."""
+        container = DIContainer()
+        both_constructing = threading.Barrier(2, timeout=5)
+
+        class SlowService:
+            def __init__(self) -> None:
+                both_constructing.wait()
+
+        container.register(SlowService, lifetime=Lifetime.TRANSIENT)
+        errors: list[BaseException] = []
+
+        def resolve() -> None:
+            try:
+                container.resolve(SlowService)
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=resolve) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+
+    def test_build_constructs_singletons_in_dependency_order(self) -> None:
+        """Test build() creates dependencies first and resolve() reuses them."""
+        container = DIContainer()
+        built: list[type] = []
+
+        class RecordingGreeter(Greeter):
+            def __init__(self) -> None:
+                built.append(Greeter)
+
+        # Registered before its dependency to exercise the ordering
+        container.register(GreeterWithDependency)
+        container.register(Greeter, RecordingGreeter)
+        container.build()
+
+        service = container.resolve(GreeterWithDependency)
+        assert built == [Greeter]
+        assert service.greeter is container.resolve(Greeter)
+        assert service is container.resolve(GreeterWithDependency)
+
+    def test_build_detects_singleton_cycle(self) -> None:
+        """Test build() rejects singletons that depend on each other."""
+        container = DIContainer()
+        container.register(Chicken)
+        container.register(Egg)
+
+        with pytest.raises(CircularDependencyError, match="Chicken, Egg"):
+            container.build()
+
+    def test_build_detects_cycle_through_transients(self) -> None:
+        """Test build() also rejects cycles that pass through transients."""
+        container = DIContainer()
+        container.register(Chicken)
+        container.register(Egg, lifetime=Lifetime.TRANSIENT)
+
+        with pytest.raises(CircularDependencyError, match="Chicken, Egg"):
+            container.build()
+
+    def test_build_disables_runtime_cycle_tracking(self) -> None:
+        """Test an acyclic, factory-free build skips per-construction tracking."""
+        container = DIContainer()
+        container.register(Greeter, lifetime=Lifetime.TRANSIENT)
+        container.register(GreeterWithDependency, lifetime=Lifetime.TRANSIENT)
+        container.build()
+
+        container.resolve(GreeterWithDependency)
+        assert container_module._RESOLVING.get() is None
+
+        # A factory may resolve anything, so tracking comes back
+        container.register_factory(
+            Chicken, lambda: container.resolve(Chicken), Lifetime.TRANSIENT
+        )
+        container.build()
+        with pytest.raises(CircularDependencyError):
+            container.resolve(Chicken)
+
+    def test_reregister_replaces_singleton(self) -> None:
+        """Test re-registering a service drops its cached singleton."""
+        container = DIContainer()
+        container.register(Greeter)
+        first = container.resolve(Greeter)
+
+        container.register(Greeter)
+
+        assert container.resolve(Greeter) is not first
+
+    def test_registrations_share_lifetime_strategy(self) -> None:
+        """Test the lifetime policy object is shared, not built per registration."""
+        container = DIContainer()
+        container.register(Greeter, lifetime=Lifetime.TRANSIENT)
+        container.register(GreeterWithDependency, lifetime=Lifetime.TRANSIENT)
+        container.register(Chicken, lifetime=Lifetime.SCOPED)
+
+        registrations = container.get_registrations()
+        strategy = registrations[Greeter].strategy
+        assert registrations[GreeterWithDependency].strategy is strategy
+        assert registrations[Chicken].strategy is not strategy
+
+    def test_registration_is_slotted(self) -> None:
+        """Test registrations carry no instance dict and compare by identity."""
+        registration = Registration(Greeter, Greeter, Lifetime.SINGLETON)
+
+        assert not hasattr(registration, "__dict__")
+        assert registration.config_path == ()
+        twin = Registration(Greeter, Greeter, Lifetime.SINGLETON)
+        assert registration != twin
+        assert hash(registration) == object.__hash__(registration)
+        assert len({registration, twin}) == 2
+        assert repr(registration) == (
+            "Registration(interface=Greeter, implementation=Greeter, "
+            "lifetime=singleton)"
+        )
+
+    def test_registrations_get_unique_ids(self) -> None:
+        """Test each registration gets its own integer id."""
+        container = DIContainer()
+        container.register(Greeter)
+        container.register(GreeterWithDependency)
+        first_id = container.get_registrations()[Greeter].id
+
+        container.register(Greeter)
+
+        ids = {r.id for r in container.get_registrations().values()}
+        assert len(ids) == 2
+        assert first_id not in ids
+
+    def test_config_injection(self) -> None:
+        """Test config is looked up once per configure() and injected."""
+        container = DIContainer()
+
+        class ConfigurableService:
+            def __init__(self, config: dict | None = None) -> None:
+                self.config = config
+
+        container.register(
+            ConfigurableService,
+            lifetime=Lifetime.TRANSIENT,
+            config_key="services.test",
+        )
+        assert container.get_registrations()[ConfigurableService].config_path == (
+            "services",
+            "test",
+        )
+
+        container.configure({"services": {"test": {"retries": 3}}})
+        first = container.resolve(ConfigurableService)
+        assert first.config == {"retries": 3}
+        assert container.resolve(ConfigurableService).config is first.config
+
+        container.configure({"services": {"test": {"retries": 5}}})
+        assert container.resolve(ConfigurableService).config == {"retries": 5}
+
+    def test_try_resolve_returns_none(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test try_resolve answers misses without raising internally."""
+        container = DIContainer()
+        container.register(Greeter)
+        container.register(Chicken, lifetime=Lifetime.SCOPED)
+
+        def no_raise(*args: object, **kwargs: object) -> None:
+            raise AssertionError("try_resolve() should not construct the error")
+
+        with monkeypatch.context() as patched:
+            patched.setattr(container_module, "ServiceNotFoundError", no_raise)
+            assert container.try_resolve(Egg) is None
+
+        assert isinstance(container.try_resolve(Greeter), Greeter)
+        # Other container errors are still swallowed
+        assert container.try_resolve(Chicken) is None
+
+    def test_register_many(self) -> None:
+        """Test batch registration matches individual register() calls."""
+        container = DIContainer()
+        container.register(Greeter)
+        stale = container.resolve(Greeter)
+
+        container.register_many(
+            {
+                Greeter: ServiceDescriptor(Greeter),
+                GreeterWithDependency: ServiceDescriptor(
+                    GreeterWithDependency, Lifetime.TRANSIENT
+                ),
+            }
+        )
+
+        registrations = container.get_registrations()
+        assert registrations[GreeterWithDependency].deps[0] == ("greeter", Greeter)
+        assert registrations[GreeterWithDependency].lifetime is Lifetime.TRANSIENT
+        service = container.resolve(GreeterWithDependency)
+        assert service.greeter is container.resolve(Greeter) is not stale
+
+    def test_configure_registers_services(self) -> None:
+        """Test services declared in the 'di' config section are registered."""
+        from sage.core.events import EventBus
+
+        container = DIContainer()
+        container.configure(
+            {
+                "di": {
+                    "services": {
+                        "EventBus": {"lifetime": "transient"},
+                        "NoSuchService": {},
+                    }
+                }
+            }
+        )
+
+        assert container.get_registrations().keys() == {EventBus}
+        assert container.resolve(EventBus) is not container.resolve(EventBus)
+
     def test_resolve_unregistered_raises(self) -> None:
         """Test that resolving unregistered service raises error."""
         container = DIContainer()
@@ -50,6 +385,17 @@ class TestDIContainer:
         with pytest.raises(Exception):  # Adjust exception type as needed
             container.resolve(UnregisteredService)
 
+    def test_get_container_returns_singleton(self) -> None:
+        """Test get_container returns the singleton until it is reset."""
+        DIContainer.reset_instance()
+        container = get_container()
+        assert get_container() is container is DIContainer.get_instance()
+
+        DIContainer.reset_instance()
+
+        assert get_container() is not container
+        DIContainer.reset_instance()
+
 
 class TestDIScope:
     """Test cases for DIScope class."""
@@ -59,6 +405,7 @@ class TestDIScope:
         container = DIContainer()
         scope = container.create_scope("test-scope")
         assert isinstance(scope, DIScope)
+        assert not hasattr(scope, "__dict__")
 
     def test_scoped_lifetime(self) -> None:
         """Test that scoped services are same within scope."""
@@ -73,3 +420,50 @@ class TestDIScope:
             instance1 = scope.resolve(ScopedService)
             instance2 = scope.resolve(ScopedService)
             assert instance1 is instance2
+
+    def test_scope_disposal(self) -> None:
+        """Test disposable scoped services are kept alive and disposed on exit."""
+        container = DIContainer()
+
+        class DisposableService:
+            disposed = False
+
+            def dispose(self) -> None:
+                self.disposed = True
+
+        container.register(DisposableService, lifetime=Lifetime.SCOPED)
+
+        with container.create_scope("test-scope") as scope:
+            scope.resolve(DisposableService)
+            gc.collect()
+            service = scope.resolve(DisposableService)
+            assert service is scope.resolve(DisposableService)
+            assert not service.disposed
+
+        assert service.disposed
+
+    def test_scope_releases_unreferenced_services(self) -> None:
+        """Test a scope does not keep non-disposable services alive by itself."""
+        container = DIContainer()
+
+        constructed = itertools.count()
+
+        class ScopedService:
+            def __init__(self) -> None:
+                next(constructed)
+
+        container.register(ScopedService, lifetime=Lifetime.SCOPED)
+        container.register_factory(dict, dict, lifetime=Lifetime.SCOPED)
+
+        with container.create_scope("test-scope") as scope:
+            released = weakref.ref(scope.resolve(ScopedService))
+            settings = scope.resolve(dict)
+            gc.collect()
+
+            assert released() is None
+            # Once released, the next resolve constructs a fresh instance
+            held = scope.resolve(ScopedService)
+            assert scope.resolve(ScopedService) is held
+            assert next(constructed) == 2
+            # Values that cannot be weakly referenced are still reused
+            assert scope.resolve(dict) is settings
@@ -1,6 +1,17 @@
 """Tests for sage.core.di.registry module."""
 
-from sage.core.di.registry import TypeRegistry, get_registry
+import sys
+from pathlib import Path
+
+import pytest
+
+from sage.core.di import registry as registry_module
+from sage.core.di.registry import (
+    TypeRegistry,
+    _resolve_dotted,
+    get_registry,
+    register_default_types,
+)
 
 
 class TestTypeRegistry:
@@ -87,6 +98,88 @@ class TestTypeRegistry:
         registry.clear()
         assert not registry.is_registered("test_service")
 
+    def test_register_callable_as_factory(self) -> None:
+        """Test register() files callables as factories, not types."""
+        registry = TypeRegistry()
+
+        class Service:
+            pass
+
+        def create_service() -> Service:
+            return Service()
+
+        registry.register("service", Service)
+        registry.register("service_factory", create_service)
+
+        assert registry.resolve_factory("service_factory") is create_service
+        assert registry.resolve("service_factory") is None
+        assert registry.resolve_factory("service") is None
+        assert registry.get_all_types() == {"service": Service}
+        assert registry.get_all_factories() == {"service_factory": create_service}
+
+    def test_registered_names_are_interned(self) -> None:
+        """Test names built at runtime are stored as interned strings."""
+        registry = TypeRegistry()
+        name = "".join(["dynamic", "_service"])
+
+        registry.register("".join(["dynamic", "_service"]), Path)
+
+        (key,) = registry.get_all_types()
+        assert key is sys.intern(name)
+        assert registry.resolve(name) is Path
+
+    def test_resolve_with_full_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test dotted paths resolve from sys.modules without re-importing."""
+        registry = TypeRegistry()
+        _resolve_dotted.cache_clear()
+
+        def no_import(name: str) -> None:
+            raise AssertionError(f"{name} is already loaded")
+
+        monkeypatch.setattr(registry_module.importlib, "import_module", no_import)
+
+        assert registry.resolve("pathlib.Path") is Path
+        assert registry.resolve("pathlib.Path") is Path
+        assert _resolve_dotted.cache_info().hits == 1
+
+    def test_resolve_invalid_path_returns_none(self) -> None:
+        """Test unknown modules and attributes resolve to None."""
+        registry = TypeRegistry()
+
+        assert registry.resolve("sage.no_such_module.Thing") is None
+        assert registry.resolve("pathlib.NoSuchThing") is None
+        assert registry.resolve(".Path") is None
+
+    def test_register_type_lazy(self) -> None:
+        """Test lazy types are registered at once and imported on resolve."""
+        registry = TypeRegistry()
+        registry.register_type_lazy("path", "pathlib.Path")
+        registry.register_type_lazy("missing", "sage.no_such_module.Thing")
+
+        assert registry.is_registered("path")
+        assert registry.is_registered("missing")
+        assert registry.resolve("path") is Path
+        assert registry.resolve("missing") is None
+        assert registry.get_all_types() == {"path": Path}
+
+    def test_register_default_types_defers_imports(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test default registration imports nothing until a type is resolved."""
+        from sage.core.events import EventBus
+
+        registry = TypeRegistry()
+
+        def no_import(full_path: str) -> None:
+            raise AssertionError(f"{full_path} imported during registration")
+
+        with monkeypatch.context() as patched:
+            patched.setattr(registry_module, "_resolve_dotted", no_import)
+            register_default_types(registry)
+
+        assert registry.is_registered("LinkChecker")
+        assert registry.resolve("AsyncEventBus") is EventBus
+
 
 class TestGetRegistry:
     """Test cases for get_registry function."""
@@ -99,3 +192,12 @@ class TestGetRegistry:
         """Test that get_registry returns a TypeRegistry instance."""
         registry = get_registry()
         assert isinstance(registry, TypeRegistry)
+
+    def test_get_registry_follows_reset(self) -> None:
+        """Test get_registry returns the singleton until it is reset."""
+        registry = get_registry()
+        assert get_registry() is registry is TypeRegistry.get_instance()
+
+        TypeRegistry.reset_instance()
+
+        assert get_registry() is not registry
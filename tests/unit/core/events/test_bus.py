@@ -1,5 +1,10 @@
 """Tests for sage.core.events.bus module."""
 
+import asyncio
+import fnmatch
+import logging
+from collections.abc import Awaitable, Callable
+
 import pytest
 
 from sage.core.events.bus import EventBus, Subscription, get_event_bus, reset_event_bus
@@ -52,6 +57,44 @@ class TestSubscription:
         assert sub.matches("test.updated")
         assert not sub.matches("other.created")
 
+    def test_generated_ids_are_unique(self) -> None:
+        """Test generated subscription IDs are sequential and never reused."""
+
+        async def handler(event: Event) -> None:
+            pass
+
+        first, second = (
+            Subscription(event_pattern="test.*", handler=handler) for _ in range(2)
+        )
+        assert first.subscription_id.startswith("sub_")
+        assert int(second.subscription_id[4:]) == int(first.subscription_id[4:]) + 1
+        assert not hasattr(first, "__dict__")
+
+    @pytest.mark.parametrize(
+        ("pattern", "event_type"),
+        [
+            ("*", "loader.start"),
+            ("*", ""),
+            ("loader.start", "loader.start"),
+            ("loader.start", "loader.started"),
+            ("loader.*", "loader.a.b"),
+            ("*.error", "search.error"),
+            ("load?r.*", "loader.start"),
+            ("[ls]*.start", "search.start"),
+            ("loader[", "loader["),
+        ],
+    )
+    def test_subscription_matches_like_fnmatch(
+        self, pattern: str, event_type: str
+    ) -> None:
+        """Test the precompiled matcher agrees with fnmatch."""
+
+        async def handler(event: Event) -> None:
+            pass
+
+        sub = Subscription(event_pattern=pattern, handler=handler)
+        assert sub.matches(event_type) is fnmatch.fnmatchcase(event_type, pattern)
+
 
 class TestEventBus:
     """Test cases for EventBus class."""
@@ -106,6 +149,418 @@ class TestEventBus:
         assert len(received_events) == 1
         assert received_events[0].event_type == "test.created"
 
+    @pytest.mark.asyncio
+    async def test_publish_matches_like_fnmatch(self) -> None:
+        """Test the subscription index picks the same handlers, in order."""
+        bus = EventBus()
+        calls: list[tuple[str, str]] = []
+        patterns = [
+            "*",
+            "loader.*",
+            "loader.start",
+            "loader.start.*",
+            "*.error",
+            "load?r.error",
+            "search.start",
+        ]
+
+        def record(pattern: str) -> Callable[[Event], Awaitable[None]]:
+            async def handler(event: Event) -> None:
+                calls.append((pattern, str(event.event_type)))
+
+            return handler
+
+        for priority, pattern in zip(
+            [50, 10, 50, 10, 30, 30, 10], patterns, strict=True
+        ):
+            bus.subscribe(pattern, record(pattern), priority=priority)
+        dropped = bus.subscribe("loader.start", record("dropped"))
+        bus.unsubscribe(dropped)
+
+        for event_type in ["loader.start", "loader.start.sub", "loader.error", "x"]:
+            calls.clear()
+            await bus.publish(Event(event_type=event_type))
+
+            expected = [
+                (s.event_pattern, event_type)
+                for s in bus.get_subscriptions()
+                if s.matches(event_type)
+            ]
+            assert calls == expected
+
+    @pytest.mark.asyncio
+    async def test_glob_subscriptions_survive_unsubscribe(self) -> None:
+        """Test glob matching stays aligned as glob subscriptions come and go."""
+        bus = EventBus()
+        calls: list[str] = []
+
+        def record(name: str) -> Callable[[Event], Awaitable[None]]:
+            async def handler(event: Event) -> None:
+                calls.append(name)
+
+            return handler
+
+        bus.subscribe("*.error", record("errors"), priority=20)
+        gone = bus.subscribe("load?r.*", record("gone"), priority=10)
+        bus.subscribe("[ls]*.error", record("ls-errors"), priority=30)
+        bus.subscribe("search.?tart", record("start"), priority=5)
+        bus.unsubscribe(gone)
+
+        await bus.publish(Event(event_type="loader.error"))
+        await bus.publish(Event(event_type="search.start"))
+
+        assert calls == ["errors", "ls-errors", "start"]
+
+    def test_glob_subscriptions_share_compiled_pattern(self) -> None:
+        """Test the glob column reuses each subscription's compiled regex."""
+        bus = EventBus()
+
+        async def handler(event: Event) -> None:
+            pass
+
+        bus.subscribe("*.error", handler, priority=20)
+        bus.subscribe("load?r.*", handler, priority=10)
+
+        assert len(bus._glob_matchers) == 2
+        assert all(
+            m is s._matcher for m, s in zip(bus._glob_matchers, bus._globs, strict=True)
+        )
+
+    def test_unsubscribe_prunes_empty_index_nodes(self) -> None:
+        """Test unsubscribing leaves no empty trie nodes behind."""
+        bus = EventBus()
+
+        async def handler(event: Event) -> None:
+            pass
+
+        kept = bus.subscribe("loader.*", handler)
+        ids = [bus.subscribe(f"loader.{n}.done", handler) for n in range(100)] + [
+            bus.subscribe(f"request.{n}", handler) for n in range(100)
+        ]
+        ids.append(bus.subscribe("loader.*", handler))
+        ids.append(bus.subscribe("*", handler))
+
+        for sub_id in ids:
+            assert bus.unsubscribe(sub_id) is True
+
+        assert list(bus._index.children) == ["loader"]
+        loader = bus._index.children["loader"]
+        assert loader.children == {}
+        assert [s.subscription_id for s in loader.prefix] == [kept]
+
+        bus.unsubscribe(kept)
+        assert bus._index.children == {}
+
+    @pytest.mark.asyncio
+    async def test_publish_without_interest_short_circuits(self) -> None:
+        """Test unmatched event types are remembered until a new subscribe."""
+        bus = EventBus()
+        calls: list[str] = []
+
+        async def handler(event: Event) -> None:
+            calls.append(str(event.event_type))
+
+        bus.subscribe("loader.*", handler)
+        assert await bus.publish(Event(event_type="search.start")) == 0
+        assert bus._no_interest == {"search.start"}
+
+        bus.subscribe("*.start", handler)
+        assert bus._no_interest == set()
+        assert await bus.publish(Event(event_type="search.start")) == 1
+        assert calls == ["search.start"]
+
+    @pytest.mark.asyncio
+    async def test_match_cache_follows_subscription_changes(self) -> None:
+        """Test cached matches are reused until subscribe/unsubscribe."""
+        bus = EventBus()
+        calls: list[str] = []
+
+        def record(name: str) -> Callable[[Event], Awaitable[None]]:
+            async def handler(event: Event) -> None:
+                calls.append(name)
+
+            return handler
+
+        first = bus.subscribe("loader.*", record("first"))
+        assert await bus.publish(Event(event_type="loader.start")) == 1
+        cached = bus._match_cache["loader.start"]
+        assert await bus.publish(Event(event_type="loader.start")) == 1
+        assert bus._match_cache["loader.start"] is cached
+
+        bus.subscribe("*.start", record("second"))
+        assert await bus.publish(Event(event_type="loader.start")) == 2
+        bus.unsubscribe(first)
+        assert await bus.publish(Event(event_type="loader.start")) == 1
+        assert calls == ["first", "first", "first", "second", "second"]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_during_publish(self) -> None:
+        """Test a handler can unsubscribe others without affecting this publish."""
+        bus = EventBus()
+        calls: list[str] = []
+
+        async def once(event: Event) -> None:
+            calls.append("once")
+            assert bus.unsubscribe(once_id) is True
+            assert bus.unsubscribe(later_id) is True
+
+        async def later(event: Event) -> None:
+            calls.append("later")
+
+        once_id = bus.subscribe("test.*", once, priority=10)
+        later_id = bus.subscribe("test.*", later, priority=20)
+
+        assert await bus.publish(Event(event_type="test.created")) == 2
+        assert bus.subscription_count == 0
+        assert await bus.publish(Event(event_type="test.created")) == 0
+        assert calls == ["once", "later"]
+
+    @pytest.mark.asyncio
+    async def test_priority_ordering(self) -> None:
+        """Test handlers run by priority, ties in subscription order."""
+        bus = EventBus()
+        calls: list[str] = []
+
+        def record(name: str) -> Callable[[Event], Awaitable[None]]:
+            async def handler(event: Event) -> None:
+                calls.append(name)
+
+            return handler
+
+        bus.subscribe("test.*", record("late"), priority=30)
+        bus.subscribe("test.created", record("early"), priority=10)
+        bus.subscribe("test.*", record("middle-1"), priority=20)
+        bus.subscribe("*", record("middle-2"), priority=20)
+
+        await bus.publish(Event(event_type="test.created"))
+
+        assert calls == ["early", "middle-1", "middle-2", "late"]
+        assert [s.priority for s in bus.get_subscriptions()] == [10, 20, 20, 30]
+
+    @pytest.mark.asyncio
+    async def test_same_priority_handlers_run_concurrently(self) -> None:
+        """Test handlers sharing a priority overlap instead of queueing."""
+        bus = EventBus(default_timeout_ms=1000)
+        peer_started = asyncio.Event()
+        calls: list[str] = []
+
+        async def waiter(event: Event) -> None:
+            await peer_started.wait()
+            calls.append("waiter")
+
+        async def peer(event: Event) -> None:
+            peer_started.set()
+            calls.append("peer")
+
+        async def later(event: Event) -> None:
+            calls.append("later")
+
+        bus.subscribe("test.*", waiter)
+        bus.subscribe("test.*", peer)
+        bus.subscribe("test.*", later, priority=200)
+
+        assert await bus.publish(Event(event_type="test.created")) == 3
+        assert calls == ["peer", "waiter", "later"]
+
+    @pytest.mark.asyncio
+    async def test_lone_handlers_run_without_gather(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test priority groups of one handler skip gather, errors still isolated."""
+        errors: list[type[Exception]] = []
+        bus = EventBus(error_handler=lambda e, event, sub: errors.append(type(e)))
+        calls: list[str] = []
+
+        def no_gather(*aws: Awaitable[None], return_exceptions: bool) -> None:
+            raise AssertionError("gather used for a single handler")
+
+        monkeypatch.setattr(asyncio, "gather", no_gather)
+
+        async def broken(event: Event) -> None:
+            raise ValueError("boom")
+
+        async def healthy(event: Event) -> None:
+            calls.append("healthy")
+
+        bus.subscribe("test.*", broken, priority=10)
+        bus.subscribe("test.*", healthy, priority=20)
+
+        assert await bus.publish(Event(event_type="test.created")) == 1
+        assert calls == ["healthy"]
+        assert errors == [ValueError]
+
+    @pytest.mark.asyncio
+    async def test_handler_error_isolation(self) -> None:
+        """Test failing and slow handlers are reported without stopping others."""
+        errors: list[tuple[type[Exception], str]] = []
+        bus = EventBus(
+            error_handler=lambda e, event, sub: errors.append(
+                (type(e), sub.event_pattern)
+            )
+        )
+        calls: list[str] = []
+
+        async def broken(event: Event) -> None:
+            raise ValueError("boom")
+
+        async def slow(event: Event) -> None:
+            await asyncio.sleep(1)
+
+        async def healthy(event: Event) -> None:
+            calls.append("healthy")
+
+        bus.subscribe("test.created", broken)
+        bus.subscribe("test.*", slow, timeout_ms=10)
+        bus.subscribe("*", healthy)
+
+        assert await bus.publish(Event(event_type="test.created")) == 1
+        assert calls == ["healthy"]
+        assert errors == [(ValueError, "test.created"), (TimeoutError, "test.*")]
+
+    @pytest.mark.asyncio
+    async def test_handlers_without_timeout_skip_wait_for(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test only handlers with a timeout are wrapped in wait_for."""
+        bus = EventBus(default_timeout_ms=None)
+        wrapped: list[float] = []
+        wait_for = asyncio.wait_for
+
+        async def counting_wait_for(aw: Awaitable[None], timeout: float) -> None:
+            wrapped.append(timeout)
+            await wait_for(aw, timeout)
+
+        monkeypatch.setattr(asyncio, "wait_for", counting_wait_for)
+
+        async def handler(event: Event) -> None:
+            pass
+
+        bus.subscribe("test.*", handler)
+        bus.subscribe("test.*", handler, timeout_ms=250)
+
+        assert await bus.publish(Event(event_type="test.created")) == 2
+        assert wrapped == [0.25]
+        assert bus.get_subscriptions()[0].timeout_ms is None
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_matches_each_type_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a batch reaches the same handlers as one publish per event."""
+        bus = EventBus()
+        calls: list[tuple[str, object]] = []
+
+        async def handler(event: Event) -> None:
+            calls.append((str(event.event_type), event.data["n"]))
+
+        bus.subscribe("loader.*", handler)
+        bus.subscribe("loader.start", handler)
+
+        matched: list[str] = []
+        match = bus._match
+
+        def counting_match(event_type: str) -> tuple[Subscription, ...]:
+            matched.append(event_type)
+            return match(event_type)
+
+        monkeypatch.setattr(bus, "_match", counting_match)
+        events = [
+            Event(event_type=event_type, data={"n": n})
+            for n, event_type in enumerate(
+                ["loader.start", "loader.done", "loader.start", "other"]
+            )
+        ]
+
+        assert await bus.publish_batch(events) == 5
+        assert matched == ["loader.start", "loader.done", "other"]
+        assert sorted(calls) == [
+            ("loader.done", 1),
+            ("loader.start", 0),
+            ("loader.start", 0),
+            ("loader.start", 2),
+            ("loader.start", 2),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_publish_nowait_dispatches_in_background(self) -> None:
+        """Test queued events reach handlers in order once drained."""
+        bus = EventBus()
+        calls: list[str] = []
+
+        async def handler(event: Event) -> None:
+            calls.append(str(event.event_type))
+
+        bus.subscribe("test.*", handler)
+        bus.subscribe("test.created", handler)
+
+        assert bus.publish_nowait(Event(event_type="test.created")) == 2
+        assert bus.publish_nowait(Event(event_type="test.updated")) == 1
+        assert bus.publish_nowait(Event(event_type="other")) == 0
+        assert calls == []
+
+        await bus.drain()
+        assert calls == ["test.created", "test.created", "test.updated"]
+
+        task = bus._dispatcher_task
+        assert task is not None
+        bus.clear()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_aclose_delivers_queued_events(self) -> None:
+        """Test aclose() runs queued handlers before stopping the dispatcher."""
+        bus = EventBus()
+        calls: list[str] = []
+
+        async def handler(event: Event) -> None:
+            await asyncio.sleep(0)
+            calls.append(str(event.event_type))
+
+        bus.subscribe("test.*", handler)
+        bus.publish_nowait(Event(event_type="test.created"))
+        bus.publish_nowait(Event(event_type="test.updated"))
+        task = bus._dispatcher_task
+        assert task is not None
+
+        await bus.aclose()
+
+        assert calls == ["test.created", "test.updated"]
+        assert task.cancelled()
+        assert bus._dispatcher_task is None
+
+    def test_shutdown_without_drain_logs_dropped_events(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test events lost to loop shutdown or clear() are reported."""
+        bus = EventBus(default_timeout_ms=None)
+
+        async def handler(event: Event) -> None:
+            await asyncio.sleep(10)
+
+        bus.subscribe("test.*", handler)
+
+        async def publish_and_exit() -> None:
+            bus.publish_nowait(Event(event_type="test.created"))
+            await asyncio.sleep(0)
+            bus.publish_nowait(Event(event_type="test.updated"))
+
+        with caplog.at_level(logging.WARNING, logger="sage.core.events.bus"):
+            asyncio.run(publish_and_exit())
+            assert "Dispatch of test.created cancelled" in caplog.text
+            assert "Dropped 1 event(s)" in caplog.text
+            assert not bus._queue
+
+            caplog.clear()
+
+            async def publish_and_clear() -> None:
+                bus.publish_nowait(Event(event_type="test.created"))
+                bus.publish_nowait(Event(event_type="test.updated"))
+                bus.clear()
+
+            asyncio.run(publish_and_clear())
+            assert "Dropped 2 event(s)" in caplog.text
+
     def test_clear(self) -> None:
         """Test clearing all subscriptions."""
         bus = EventBus()
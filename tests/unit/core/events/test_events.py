@@ -13,6 +13,10 @@ Tests cover:
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import json
+import sys
+from collections.abc import Callable
 from datetime import UTC, datetime
 
 import pytest
@@ -69,6 +73,12 @@ class TestEventType:
         assert EventType.SYSTEM_SHUTDOWN.value == "system.shutdown"
         assert EventType.SYSTEM_HEALTH_CHECK.value == "system.health_check"
 
+    def test_values_are_interned(self) -> None:
+        """Test enum values are the interned type strings."""
+        value = "".join(["loader", ".start"])
+        assert EventType.LOADER_START.value is sys.intern(value)
+        assert EventType(value) is EventType.LOADER_START
+
 
 class TestEvent:
     """Tests for Event base class."""
@@ -106,6 +116,58 @@ class TestEvent:
         assert "timestamp" in d
         assert "event_id" in d
 
+    def test_event_defaults_share_empty_mapping(self) -> None:
+        """Test empty data/metadata are one shared read-only mapping."""
+        first, second = Event(event_type="a"), Event(event_type="b")
+        assert first.data is second.data is first.metadata
+        with pytest.raises(TypeError):
+            first.data["key"] = "value"
+        assert json.loads(json.dumps(first.to_dict()))["data"] == {}
+
+        enriched = first.with_data(key="value")
+        assert enriched.data == {"key": "value"}
+        assert enriched.event_id == first.event_id
+        assert first.data == {}
+
+    def test_subclass_data_leaves_caller_dict_alone(self) -> None:
+        """Test subclasses build their data without mutating the input."""
+        data = {"extra": 1}
+        event = LoadEvent(event_type=EventType.LOADER_START, layer="core", data=data)
+        assert event.data == {
+            "extra": 1,
+            "layer": "core",
+            "file_count": 0,
+            "duration_ms": 0.0,
+        }
+        assert data == {"extra": 1}
+
+    def test_event_to_dict_caches_timestamp(self) -> None:
+        """Test repeated serialization reuses the formatted timestamp."""
+        event = Event(event_type="custom.event")
+        first = event.to_dict()
+        second = event.to_dict()
+        assert first == second
+        assert first is not second
+        assert second["timestamp"] is first["timestamp"]
+
+    @pytest.mark.parametrize(
+        "event",
+        [
+            Event(event_type="custom.event"),
+            LoadEvent(event_type=EventType.LOADER_START, layer="core"),
+            TimeoutEvent(event_type=EventType.TIMEOUT_WARNING),
+            SearchEvent(event_type=EventType.SEARCH_START),
+            PluginEvent(event_type=EventType.PLUGIN_REGISTERED),
+            SystemEvent(event_type=EventType.SYSTEM_STARTUP),
+        ],
+        ids=lambda event: type(event).__name__,
+    )
+    def test_events_are_slotted_and_frozen(self, event: Event) -> None:
+        """Test events have no instance dict and reject reassignment."""
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.source = "elsewhere"  # type: ignore[misc]
+
     def test_event_from_dict(self) -> None:
         """Test event deserialization from dict."""
         now = datetime.now(UTC)
@@ -127,6 +189,11 @@ class TestEvent:
         event = Event(event_type="custom.event", source="test")
         assert event.event_type == "custom.event"
 
+    def test_custom_event_type_is_interned(self) -> None:
+        """Test custom string event types are interned."""
+        event = Event(event_type="".join(["custom", ".event"]))
+        assert event.event_type is sys.intern("custom.event")
+
 
 class TestLoadEvent:
     """Tests for LoadEvent class."""
@@ -454,6 +521,58 @@ class TestPluginAdapter:
         assert count == 2
         assert adapter.is_registered is True
 
+    def test_adapter_scans_each_plugin_class_once(self) -> None:
+        """Test handler discovery is cached per class, instance handlers kept."""
+
+        class TestPlugin:
+            def on_load_start(self, event: Event) -> None:
+                pass
+
+        assert PluginAdapter(TestPlugin(), EventBus()).register() == 1
+        scans = PluginAdapter.__dict__["_method_scans"]
+        assert scans[TestPlugin] == ((("loader.start", "on_load_start"),), ())
+
+        # Later instances trust the cached scan instead of probing again
+        scans[TestPlugin] = ((), ())
+        assert PluginAdapter(TestPlugin(), EventBus()).register() == 0
+
+        plugin = TestPlugin()
+        plugin.on_search_start = lambda event: None  # type: ignore[attr-defined]
+        assert PluginAdapter(plugin, EventBus()).register() == 1
+
+    def test_adapter_finds_instance_provided_handlers(self) -> None:
+        """Test properties, __slots__ and __getattr__ handlers are registered."""
+
+        def handler(event: Event) -> None:
+            pass
+
+        class PropertyPlugin:
+            def __init__(self, enabled: bool) -> None:
+                self.enabled = enabled
+
+            @property
+            def on_load_start(self) -> Callable[[Event], None] | None:
+                return handler if self.enabled else None
+
+        class SlotsPlugin:
+            __slots__ = ("on_search_start",)
+
+        class DelegatingPlugin:
+            def __getattr__(self, name: str) -> Callable[[Event], None]:
+                if name == "on_load_complete":
+                    return handler
+                raise AttributeError(name)
+
+        slotted = SlotsPlugin()
+        slotted.on_search_start = handler
+
+        assert PluginAdapter(PropertyPlugin(True), EventBus()).register() == 1
+        assert PluginAdapter(PropertyPlugin(False), EventBus()).register() == 0
+        assert PluginAdapter(slotted, EventBus()).register() == 1
+        assert PluginAdapter(SlotsPlugin(), EventBus()).register() == 0
+        adapter = PluginAdapter(DelegatingPlugin(), EventBus())
+        assert adapter._handler_methods() == [("loader.complete", "on_load_complete")]
+
     def test_adapter_unregister(self) -> None:
         """Test adapter unregisters plugin."""
 
@@ -590,3 +709,15 @@ class TestCreateEventFromDict:
         )
         assert isinstance(event, Event)
         assert event.data["key"] == "value"
+
+    def test_create_event_by_namespace(self) -> None:
+        """Test custom types use their namespace's class and its own fields."""
+        event = create_event_from_dict(
+            "loader.custom", {"layer": "core", "unknown": 1, "source": "x"}
+        )
+        assert isinstance(event, LoadEvent)
+        assert event.layer == "core"
+        assert event.duration_ms == 0.0
+        assert event.source == "adapter"
+
+        assert type(create_event_from_dict("loader", {})) is Event
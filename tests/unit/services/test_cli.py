@@ -13,8 +13,10 @@ Author: SAGE AI Collab Team
 Version: 0.1.0
 """
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from sage.services.cli import app, console, display_content, display_result
@@ -777,3 +779,24 @@ class TestRunAsyncFunction:
 
         result = run_async(sample_coro())
         assert result == 42
+
+    def test_run_async_without_uvloop(self, monkeypatch):
+        """Test run_async falls back to the default loop without uvloop."""
+        from sage.services import cli
+
+        monkeypatch.setattr(cli, "UVLOOP_AVAILABLE", False)
+
+        async def loop_name():
+            return type(asyncio.get_running_loop()).__module__
+
+        assert not cli.run_async(loop_name()).startswith("uvloop")
+
+    def test_run_async_uses_uvloop(self):
+        """Test run_async runs on a uvloop loop when uvloop is installed."""
+        pytest.importorskip("uvloop")
+        from sage.services.cli import run_async
+
+        async def loop_name():
+            return type(asyncio.get_running_loop()).__module__
+
+        assert run_async(loop_name()).startswith("uvloop")